@@ -0,0 +1,171 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+STATUSES = ["STABLE", "WARNING", "CRITICAL"]
+PATTERNS = ["Star-Hub (Mule)", "Fan-Out (Distribution)", "Linear (P2P)", "Small Network"]
+HOURS_PER_DAY = 24  # PaySim: one `step` is one hour
+
+
+def classify_patterns(out_degree, in_degree):
+    """Topology pattern per row (same degree thresholds as the engine's topology view)"""
+    out_degree = np.asarray(out_degree)
+    in_degree = np.asarray(in_degree)
+    return np.select(
+        [
+            (out_degree >= 8) | (in_degree >= 8),
+            (out_degree >= 4) | (in_degree >= 4),
+            (out_degree == 1) & (in_degree == 1)
+        ],
+        PATTERNS[:3],
+        default=PATTERNS[3]
+    )
+
+
+class AnalyticsAggregates:
+    """
+    Dashboard aggregates, computed once at load and then maintained incrementally:
+      - totals (count / volume / fraud) are fixed for the table
+      - blocked counters move only by the rows a block actually affects
+      - per-status counters track each row's LATEST score (O(1) per scored row)
+      - per-pattern counters and hourly (`step`) rollups are columnar bincounts
+    Reading a snapshot costs O(#statuses + #patterns), never O(#transactions).
+    """
+
+    def __init__(self, index, details):
+        self.index = index
+        self._lock = threading.Lock()
+        n = index.size
+        amount = index.amount
+        fraud = index.is_fraud
+
+        # 1. Table Totals
+        self.total_transactions = n
+        self.total_volume = float(amount.sum())
+        self.fraud_attempts = int(fraud.sum())
+        self.fraud_volume = float(amount[fraud].sum())
+
+        # 2. Patterns (static per row)
+        pattern = classify_patterns(
+            details["nameOrig_outDegree"].to_numpy(dtype=np.int64),
+            details["nameDest_inDegree"].to_numpy(dtype=np.int64)
+        )
+        self.pattern_code = pd.Categorical(pattern, categories=PATTERNS).codes
+        self.pattern_count = np.bincount(self.pattern_code, minlength=len(PATTERNS))
+        self.pattern_fraud = np.bincount(self.pattern_code[fraud], minlength=len(PATTERNS))
+
+        # 3. Hourly Rollups (bucket = PaySim step)
+        self.step = pd.to_numeric(details["step"], errors="coerce").fillna(0).to_numpy(dtype=np.int64)
+        hours = int(self.step.max()) + 1 if n else 1
+        self.hour_count = np.bincount(self.step, minlength=hours)
+        self.hour_volume = np.bincount(self.step, weights=amount, minlength=hours)
+        self.hour_fraud = np.bincount(self.step[fraud], minlength=hours)
+        self.hour_fraud_volume = np.bincount(self.step[fraud], weights=amount[fraud], minlength=hours)
+        self.hour_blocked = np.zeros(hours, dtype=np.int64)
+
+        # 4. Block Counters (fed by TransactionIndex block events)
+        self.blocked_transactions = 0
+        self.blocked_volume = 0.0
+        self.prevented_fraud = 0
+        self.prevented_fraud_volume = 0.0
+        index.listeners.append(self.record_block)
+
+        # 5. Scoring Counters (latest status per row, -1 = never scored)
+        self.row_status = np.full(n, -1, dtype=np.int8)
+        self.status_count = np.zeros(len(STATUSES), dtype=np.int64)
+        self.scored = 0
+
+    # --- Incremental Updates ---
+
+    def record_score(self, row, status):
+        code = STATUSES.index(status)
+        with self._lock:
+            previous = self.row_status[row]
+            if previous >= 0:
+                self.status_count[previous] -= 1
+            self.row_status[row] = code
+            self.status_count[code] += 1
+            self.scored += 1
+
+    def record_scores(self, rows, statuses):
+        """Batch form of record_score: O(batch), a repeated row keeps its last status"""
+        rows = np.asarray(rows, dtype=np.int64)
+        codes = pd.Categorical(statuses, categories=STATUSES).codes.astype(np.int8)
+        # Last occurrence of each row wins
+        unique_rows, last = np.unique(rows[::-1], return_index=True)
+        codes = codes[::-1][last]
+        with self._lock:
+            previous = self.row_status[unique_rows]
+            self.status_count -= np.bincount(previous[previous >= 0], minlength=len(STATUSES))
+            self.status_count += np.bincount(codes, minlength=len(STATUSES))
+            self.row_status[unique_rows] = codes
+            self.scored += len(rows)
+
+    def record_block(self, rows):
+        """Called by the index with the rows a block newly affected"""
+        rows = np.asarray(rows, dtype=np.int64)
+        if len(rows) == 0:
+            return
+        amount = self.index.amount[rows]
+        fraud = self.index.is_fraud[rows]
+        with self._lock:
+            self.blocked_transactions += len(rows)
+            self.blocked_volume += float(amount.sum())
+            self.prevented_fraud += int(fraud.sum())
+            self.prevented_fraud_volume += float(amount[fraud].sum())
+            np.add.at(self.hour_blocked, self.step[rows], 1)
+
+    # --- Snapshots ---
+
+    def snapshot(self):
+        """Current aggregates for /api/analytics (O(1) in the table size)"""
+        with self._lock:
+            blocked_accounts = len(self.index.blocked_accounts)
+            return {
+                "total_transactions": self.total_transactions,
+                "total_volume": self.total_volume,
+                "fraud_attempts": self.fraud_attempts,
+                "fraud_volume": self.fraud_volume,
+                "blocked_count": blocked_accounts,
+                "prevention_rate": (blocked_accounts / self.fraud_attempts) if self.fraud_attempts > 0 else 1.0,
+                "blocked_transactions": self.blocked_transactions,
+                "blocked_volume": self.blocked_volume,
+                "prevented_fraud": self.prevented_fraud,
+                "prevented_fraud_volume": self.prevented_fraud_volume,
+                "scored": self.scored,
+                "by_status": {
+                    **{status: int(count) for status, count in zip(STATUSES, self.status_count)},
+                    "UNSCORED": int(self.total_transactions - self.status_count.sum())
+                },
+                "by_pattern": {
+                    pattern: {"count": int(count), "fraud": int(fraud)}
+                    for pattern, count, fraud in zip(PATTERNS, self.pattern_count, self.pattern_fraud)
+                }
+            }
+
+    def timeline(self, bucket="hour"):
+        """Time-bucketed rollups (hour = one PaySim step, or day), non-empty buckets only"""
+        if bucket not in ("hour", "day"):
+            raise ValueError("bucket must be 'hour' or 'day'")
+        with self._lock:
+            series = [self.hour_count, self.hour_volume, self.hour_fraud,
+                      self.hour_fraud_volume, self.hour_blocked]
+            if bucket == "day":
+                days = -(-len(self.hour_count) // HOURS_PER_DAY)
+                series = [
+                    np.pad(s, (0, days * HOURS_PER_DAY - len(s))).reshape(days, HOURS_PER_DAY).sum(axis=1)
+                    for s in series
+                ]
+            count, volume, fraud, fraud_volume, blocked = series
+            return [
+                {
+                    bucket: int(b),
+                    "transactions": int(count[b]),
+                    "volume": float(volume[b]),
+                    "fraud": int(fraud[b]),
+                    "fraud_volume": float(fraud_volume[b]),
+                    "blocked": int(blocked[b])
+                }
+                for b in np.flatnonzero(count)
+            ]
@@ -0,0 +1,72 @@
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+
+# Columnar layout of the production test set (written by scripts/reconstruct_test_set.py)
+VECTORS_FILE = "test_vectors.npy"        # float32 (N, 16)
+LABELS_FILE = "test_labels.npy"          # int64   (N,)
+DETAILS_FILE = "test_details.parquet"    # transaction metadata, one column per field
+PROJECTION_FILE = "projection_matrix.npy"
+LEGACY_PICKLE = "production_test_set.pkl"
+
+
+def has_columnar_store(data_path):
+    return all(
+        os.path.exists(os.path.join(data_path, name))
+        for name in (VECTORS_FILE, LABELS_FILE, DETAILS_FILE)
+    )
+
+
+def read_details(data_path, columns=None):
+    """Reads only the requested detail columns (memory-mapped Arrow read)"""
+    return pd.read_parquet(
+        os.path.join(data_path, DETAILS_FILE), columns=columns, engine="pyarrow", memory_map=True
+    )
+
+
+def load_test_set(data_path, columns=None):
+    """
+    Returns (vectors, labels, details).
+    Vectors/labels are memory-mapped read-only, so every uvicorn worker shares the
+    same page-cache pages; details only materializes `columns`.
+    Falls back to the legacy pickle when the columnar files are missing.
+    """
+    if has_columnar_store(data_path):
+        try:
+            vectors = np.load(os.path.join(data_path, VECTORS_FILE), mmap_mode="r")
+            labels = np.load(os.path.join(data_path, LABELS_FILE), mmap_mode="r")
+            details = read_details(data_path, columns)
+            print(f"✅ Columnar store: {len(vectors)} rows, {len(details.columns)} detail columns (mmap)")
+            return vectors, labels, details
+        except ImportError as e:
+            print(f"⚠️ Columnar store unavailable ({e}), falling back to {LEGACY_PICKLE}")
+
+    print(f"⚠️ Loading legacy {LEGACY_PICKLE} (run scripts/reconstruct_test_set.py --convert)")
+    with open(os.path.join(data_path, LEGACY_PICKLE), "rb") as f:
+        test_set = pickle.load(f)
+    details = test_set["details"]
+    if columns is not None:
+        details = details[[c for c in columns if c in details.columns]]
+    return test_set["vectors"], test_set["labels"], details
+
+
+def load_projection_matrix(data_path):
+    return np.load(os.path.join(data_path, PROJECTION_FILE), mmap_mode="r")
+
+
+def write_columnar_store(output_dir, vectors, labels, details):
+    """Writes the test set as .npy (mmap-able) + Parquet"""
+    os.makedirs(output_dir, exist_ok=True)
+    np.save(os.path.join(output_dir, VECTORS_FILE), np.ascontiguousarray(vectors, dtype=np.float32))
+    np.save(os.path.join(output_dir, LABELS_FILE), np.ascontiguousarray(labels, dtype=np.int64))
+    details.to_parquet(os.path.join(output_dir, DETAILS_FILE), engine="pyarrow", index=False)
+    print(f"✅ Wrote columnar store ({len(vectors)} rows) to {output_dir}")
+
+
+def convert_pickle(data_path, output_dir=None):
+    """production_test_set.pkl -> columnar store (same directory by default)"""
+    with open(os.path.join(data_path, LEGACY_PICKLE), "rb") as f:
+        test_set = pickle.load(f)
+    write_columnar_store(output_dir or data_path, test_set["vectors"], test_set["labels"], test_set["details"])
@@ -0,0 +1,212 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+from app.core.payload_cache import dumps
+
+AUDIT_COLUMNS = ("id", "ts", "action", "account", "tx_id", "reason", "user", "details")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS audit_events (
+    id      INTEGER PRIMARY KEY,
+    ts      REAL NOT NULL,
+    action  TEXT NOT NULL,
+    account TEXT,
+    tx_id   TEXT,
+    reason  TEXT,
+    user    TEXT,
+    details TEXT
+);
+CREATE INDEX IF NOT EXISTS audit_events_ts ON audit_events (ts);
+CREATE INDEX IF NOT EXISTS audit_events_account_ts ON audit_events (account, ts);
+"""
+
+
+def parse_time(value):
+    """Epoch seconds or ISO-8601 (naive = UTC) -> epoch seconds; None passes through"""
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def format_time(ts):
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class AuditStore:
+    """
+    Compliance audit trail in SQLite (WAL), indexed by time and by (account, time).
+      - `record` never touches disk on the caller's thread: events are queued and a
+        writer thread inserts whatever has accumulated in one transaction
+      - queries are keyset-paginated on (ts, id), so page N costs the same as page 1
+      - exports stream rows from a cursor in chunks (the log is never held in memory)
+    Readers open their own connection (WAL lets them run alongside the writer).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._queue = queue.Queue()
+        self._writer = None
+        self._lock = threading.Lock()
+        self.written = 0
+        self.batches = 0
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self, check_same_thread=True):
+        conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=check_same_thread)
+        conn.execute("PRAGMA synchronous=NORMAL")  # WAL: durable at checkpoint, never corrupt
+        return conn
+
+    # --- Writes (off the request path) ---
+
+    def record(self, events):
+        """Queues audit events (dicts with action/account/tx_id/reason/user/details; ts defaults to now)"""
+        now = time.time()
+        rows = [
+            (e.get("ts") or now, e["action"], e.get("account"), e.get("tx_id"),
+             e.get("reason"), e.get("user"), e.get("details"))
+            for e in events
+        ]
+        with self._lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._write_loop, name="audit-writer", daemon=True)
+                self._writer.start()
+        self._queue.put(rows)
+
+    def _write_loop(self):
+        conn = self._connect()
+        try:
+            while True:
+                batch = [self._queue.get()]
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                rows = [row for item in batch if isinstance(item, list) for row in item]
+                if rows:
+                    try:
+                        with conn:
+                            conn.executemany(
+                                "INSERT INTO audit_events (ts, action, account, tx_id, reason, user, details) "
+                                "VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+                            )
+                        self.written += len(rows)
+                        self.batches += 1
+                    except sqlite3.Error as e:
+                        print(f"❌ AUDIT WRITE ERROR: {e}")
+                for item in batch:
+                    if isinstance(item, threading.Event):
+                        item.set()
+                if any(item is None for item in batch):
+                    return
+        finally:
+            conn.close()
+
+    def flush(self, timeout=5.0):
+        """Blocks until everything queued so far is committed"""
+        if self._writer is None or not self._writer.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self):
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join(timeout=5.0)
+
+    # --- Reads ---
+
+    @staticmethod
+    def _where(start, end, account, action):
+        clauses, params = [], []
+        if account is not None:
+            clauses.append("account = ?")
+            params.append(account)
+        if start is not None:
+            clauses.append("ts >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("ts < ?")
+            params.append(end)
+        if action is not None:
+            clauses.append("action = ?")
+            params.append(action)
+        return clauses, params
+
+    def query(self, start=None, end=None, account=None, action=None, limit=100, cursor=None, descending=True):
+        """
+        One page of events in [start, end), newest first by default.
+        Returns (events, next_cursor); pass next_cursor back to continue (None = last page).
+        """
+        clauses, params = self._where(start, end, account, action)
+        if cursor:
+            try:
+                ts, event_id = cursor.split(":")
+                params += [float(ts), int(event_id)]
+            except ValueError:
+                raise ValueError(f"Invalid cursor '{cursor}'")
+            clauses.append("(ts, id) < (?, ?)" if descending else "(ts, id) > (?, ?)")
+        direction = "DESC" if descending else "ASC"
+        sql = (f"SELECT {', '.join(AUDIT_COLUMNS)} FROM audit_events"
+               f"{' WHERE ' + ' AND '.join(clauses) if clauses else ''}"
+               f" ORDER BY ts {direction}, id {direction} LIMIT ?")
+        conn = self._connect()
+        try:
+            rows = conn.execute(sql, params + [limit + 1]).fetchall()
+        finally:
+            conn.close()
+        more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = f"{rows[-1][1]!r}:{rows[-1][0]}" if more and rows else None
+        return [dict(zip(AUDIT_COLUMNS, row)) for row in rows], next_cursor
+
+    def export(self, start=None, end=None, account=None, action=None, chunk_size=1000):
+        """
+        NDJSON bytes in chronological order, streamed from a cursor chunk by chunk.
+        StreamingResponse advances sync generators on whichever threadpool worker is
+        free, so the connection is not pinned to one thread (one next() at a time).
+        """
+        clauses, params = self._where(start, end, account, action)
+        sql = (f"SELECT {', '.join(AUDIT_COLUMNS)} FROM audit_events"
+               f"{' WHERE ' + ' AND '.join(clauses) if clauses else ''} ORDER BY ts, id")
+        conn = self._connect(check_same_thread=False)
+        try:
+            cursor = conn.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield b"".join(dumps(dict(zip(AUDIT_COLUMNS, row))) + b"\n" for row in rows)
+        finally:
+            conn.close()
+
+    def count(self):
+        """Number of events (append-only table, so the largest id; no full scan)"""
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT COALESCE(MAX(id), 0) FROM audit_events").fetchone()[0]
+        finally:
+            conn.close()
+
+    def stats(self):
+        return {
+            "events": self.count(),
+            "written": self.written,
+            "batches": self.batches,
+            "pending": self._queue.qsize(),
+            "size_bytes": os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        }
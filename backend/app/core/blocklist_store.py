@@ -0,0 +1,239 @@
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from app.core.payload_cache import dumps
+
+
+class BlocklistStore:
+    """
+    Persistent blocklist as an append-only JSON-lines log.
+      - one line per block: {"account": ..., "tx_id": ..., "ts": ...}
+      - appends go through one writer thread that group-commits: every record queued
+        while the previous fsync ran is written + fsynced together (one fsync per batch)
+      - callers get a Future that resolves once their records are durable
+      - compaction rewrites the log as one line per account (tmp file + fsync + atomic
+        rename) once it holds `compact_ratio` times more lines than live entries
+      - startup replays the log; a torn last line (crash mid-append) is truncated away
+    """
+
+    def __init__(self, path, legacy_json=None, compact_min_lines=10_000, compact_ratio=2.0):
+        self.path = path
+        self.compact_min_lines = compact_min_lines
+        self.compact_ratio = compact_ratio
+        self.accounts = set()
+        self.tx_ids = {}            # tx_id -> {"account", "ts"} (ordered by block time)
+        self.lines = 0
+        self.commits = 0
+        self.compactions = 0
+        self._queue = queue.Queue()
+        self._writer = None
+        self._file = None
+        self._rollback_to = None    # offset a failed append still has to be cut back to
+        self._lock = threading.Lock()
+
+        self._replay()
+        if legacy_json and os.path.exists(legacy_json) and self.lines == 0:
+            self._import_legacy(legacy_json)
+
+    # --- Startup ---
+
+    def _replay(self):
+        if not os.path.exists(self.path):
+            return
+        started = time.perf_counter()
+        good_bytes = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break  # torn tail: everything after the last complete line is dropped
+                if not line.endswith(b"\n"):
+                    break
+                self._apply(record)
+                good_bytes += len(line)
+                self.lines += 1
+        if good_bytes < os.path.getsize(self.path):
+            print(f"⚠️ Blocklist log: truncating {os.path.getsize(self.path) - good_bytes} bytes of torn tail")
+            with open(self.path, "r+b") as f:
+                f.truncate(good_bytes)
+        print(f"✅ Blocklist: {len(self.accounts)} accounts from {self.lines} log lines "
+              f"({(time.perf_counter() - started) * 1000:.1f}ms)")
+
+    def _import_legacy(self, legacy_json):
+        """One-time migration from the old whole-file blocked_accounts.json"""
+        with open(legacy_json, "r") as f:
+            accounts = json.load(f)
+        records = [{"account": account, "tx_id": None, "ts": None} for account in accounts]
+        for record in records:
+            self._apply(record)
+        self._rewrite(records)
+        print(f"✅ Blocklist: migrated {len(accounts)} accounts from {legacy_json}")
+
+    def _apply(self, record):
+        self.accounts.add(record["account"])
+        if record.get("tx_id"):
+            self.tx_ids[record["tx_id"]] = {"account": record["account"], "ts": record.get("ts")}
+
+    # --- Writes ---
+
+    def block(self, entries):
+        """
+        Records (account, tx_id or None) pairs. The returned Future resolves once they are
+        durable (await it with asyncio.wrap_future in async handlers); they only show up in
+        `accounts`/`tx_ids` after that, and never if the write fails.
+        """
+        now = time.time()
+        records = [{"account": account, "tx_id": tx_id, "ts": now} for account, tx_id in entries]
+        with self._lock:
+            self._ensure_writer()
+        done = Future()
+        self._queue.put((records, done))
+        return done
+
+    def _ensure_writer(self):
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(target=self._write_loop, name="blocklist-writer", daemon=True)
+            self._writer.start()
+
+    def _write_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            # Group commit: take everything that queued up behind the first request
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(item is None for item in batch)
+            batch = [item for item in batch if item is not None]
+            if batch:
+                self._commit(batch)
+            if stop:
+                return
+
+    def _commit(self, batch):
+        start = None
+        try:
+            if self._file is None:
+                if self._rollback_to is not None:
+                    os.truncate(self.path, self._rollback_to)
+                    self._rollback_to = None
+                # Unbuffered: nothing of a failed append lingers in a buffer to be flushed later
+                self._file = open(self.path, "ab", buffering=0)
+            start = self._file.tell()
+            payload = memoryview(b"".join(dumps(record) + b"\n" for records, _ in batch for record in records))
+            while payload:
+                payload = payload[self._file.write(payload):]  # raw appends may be partial
+            os.fsync(self._file.fileno())
+        except Exception as e:
+            print(f"❌ BLOCKLIST WRITE ERROR: {e}")
+            self._discard_tail(start)
+            for _, done in batch:
+                done.set_exception(e)
+            return
+
+        self.lines += sum(len(records) for records, _ in batch)
+        self.commits += 1
+        with self._lock:
+            for records, _ in batch:
+                for record in records:
+                    self._apply(record)
+        for _, done in batch:
+            done.set_result(True)
+        live = len(self.accounts) + len(self.tx_ids)
+        if self.lines >= self.compact_min_lines and self.lines > self.compact_ratio * max(live, 1):
+            self.compact()
+
+    def _discard_tail(self, offset):
+        """
+        Cuts a failed append's torn bytes back off (`offset` = log size before it) and drops
+        the handle, so later commits never land behind garbage that replay would stop at.
+        """
+        if self._file is None:
+            return
+        if offset is not None:
+            self._rollback_to = offset
+        try:
+            if self._rollback_to is not None:
+                os.ftruncate(self._file.fileno(), self._rollback_to)
+                self._rollback_to = None
+        except OSError as e:
+            print(f"❌ BLOCKLIST ROLLBACK ERROR: {e} (retried before the next append)")
+        finally:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+
+    # --- Compaction ---
+
+    def snapshot(self):
+        """Live state as log records: one per trigger tx, plus accounts blocked without one"""
+        with self._lock:
+            records = [{"account": entry["account"], "tx_id": tx_id, "ts": entry["ts"]}
+                       for tx_id, entry in self.tx_ids.items()]
+            covered = {record["account"] for record in records}
+            records += [{"account": account, "tx_id": None, "ts": None}
+                        for account in self.accounts if account not in covered]
+        return records
+
+    def compact(self):
+        """Rewrites the log with only live entries (runs on the writer thread, between commits)"""
+        started = time.perf_counter()
+        before = self.lines
+        self._rewrite(self.snapshot())
+        self.compactions += 1
+        print(f"🗜️ Blocklist compacted {before} -> {self.lines} lines ({(time.perf_counter() - started) * 1000:.1f}ms)")
+
+    def _rewrite(self, records):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(b"".join(dumps(record) + b"\n" for record in records))
+            f.flush()
+            os.fsync(f.fileno())
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        os.replace(tmp_path, self.path)
+        self._fsync_dir()
+        self.lines = len(records)
+
+    def _fsync_dir(self):
+        """Makes the rename itself durable (no-op where directories cannot be opened, e.g. Windows)"""
+        try:
+            fd = os.open(os.path.dirname(os.path.abspath(self.path)), os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    # --- Lifecycle ---
+
+    def close(self):
+        """Flushes pending blocks and stops the writer"""
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join(timeout=5.0)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def stats(self):
+        return {
+            "accounts": len(self.accounts),
+            "tx_ids": len(self.tx_ids),
+            "log_lines": self.lines,
+            "commits": self.commits,
+            "compactions": self.compactions,
+            "pending": self._queue.qsize()
+        }
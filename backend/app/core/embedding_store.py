@@ -0,0 +1,208 @@
+import os
+import threading
+
+import numpy as np
+
+# Embedding store layout (written by scripts/build_embedding_store.py)
+EMBEDDINGS_FILE = "graph_embeddings.npy"    # float32 (n_accounts, 16), row = account index
+ACCOUNT_IDS_FILE = "account_ids.npy"        # fixed-width bytes, sorted
+ACCOUNT_ROWS_FILE = "account_rows.npy"      # int64, embedding row of each sorted id
+CENTROID_FILE = "embedding_centroid.npy"    # float32 (16,), mean embedding
+
+# Source artifacts (notebook output)
+TORCH_EMBEDDINGS = "2normal_graph_embeddings.pt"
+ACCOUNT_MAP_PICKLE = "account_to_idx.pkl"
+
+
+def has_embedding_store(data_path):
+    return all(
+        os.path.exists(os.path.join(data_path, name))
+        for name in (EMBEDDINGS_FILE, ACCOUNT_IDS_FILE, ACCOUNT_ROWS_FILE)
+    )
+
+
+class EmbeddingStore:
+    """
+    GAT account embeddings for scoring transactions outside the test set.
+      - embedding matrix memory-mapped (float32, shared page cache until written)
+      - centroid computed once (or read from disk), never per transaction
+      - account id -> row as a sorted id array + searchsorted (no Python dict)
+    perturbation vector = (emb[src] + emb[dst]) / 2 - centroid
+
+    Updates (`upsert`) are copy-on-write: the file-backed matrix is opened with
+    mmap_mode="c", so rewritten rows live in private pages and the file on disk
+    is never modified. Accounts that are not in the file are appended to an
+    in-memory overflow block. The centroid stays the trained (normal graph) reference.
+    """
+
+    def __init__(self, embeddings, account_ids, account_rows, centroid=None):
+        self.embeddings = embeddings
+        self.account_ids = account_ids
+        self.account_rows = account_rows
+        if centroid is None:
+            centroid = self._mean(embeddings)
+        self.centroid = np.asarray(centroid, dtype=np.float32)
+
+        # Cold-start accounts (rows >= len(embeddings))
+        self._lock = threading.Lock()
+        self._extra = np.zeros((0, embeddings.shape[1]), dtype=np.float32)
+        self._extra_size = 0
+        self._extra_ids = {}
+
+    @classmethod
+    def load(cls, data_path):
+        embeddings = np.load(os.path.join(data_path, EMBEDDINGS_FILE), mmap_mode="c")
+        account_ids = np.load(os.path.join(data_path, ACCOUNT_IDS_FILE), mmap_mode="r")
+        account_rows = np.load(os.path.join(data_path, ACCOUNT_ROWS_FILE), mmap_mode="r")
+        centroid_path = os.path.join(data_path, CENTROID_FILE)
+        centroid = np.load(centroid_path) if os.path.exists(centroid_path) else None
+        store = cls(embeddings, account_ids, account_rows, centroid)
+        print(f"✅ Embedding store: {len(embeddings)} accounts x {embeddings.shape[1]} dims (mmap)")
+        return store
+
+    @staticmethod
+    def _mean(embeddings, chunk=1 << 16):
+        """Column mean in float64, streamed in chunks (the matrix may not fit in RAM)"""
+        total = np.zeros(embeddings.shape[1], dtype=np.float64)
+        for start in range(0, len(embeddings), chunk):
+            total += np.asarray(embeddings[start:start + chunk], dtype=np.float64).sum(axis=0)
+        return total / max(len(embeddings), 1)
+
+    @property
+    def size(self):
+        return len(self.embeddings) + self._extra_size
+
+    @property
+    def dim(self):
+        return self.embeddings.shape[1]
+
+    # --- Lookups ---
+
+    def rows_for(self, account_ids):
+        """Embedding rows for many account ids at once (-1 where unknown)"""
+        query = np.asarray(account_ids, dtype=np.bytes_)
+        rows = self._file_rows(query)
+        with self._lock:
+            return self._extra_rows(query, rows)
+
+    def _file_rows(self, query):
+        """Rows of accounts in the file-backed id index (read-only, so no lock needed)"""
+        if len(self.account_ids) == 0:
+            return np.full(len(query), -1, dtype=np.int64)
+        pos = np.minimum(np.searchsorted(self.account_ids, query), len(self.account_ids) - 1)
+        found = self.account_ids[pos] == query
+        return np.where(found, self.account_rows[pos], -1).astype(np.int64)
+
+    def _extra_rows(self, query, rows):
+        """Fills in cold-start rows where `rows` is still -1 (caller holds the lock)"""
+        if self._extra_ids:
+            for i in np.flatnonzero(rows < 0):
+                rows[i] = self._extra_ids.get(query[i], -1)
+        return rows
+
+    def vectors_for(self, rows):
+        """Embedding rows (file-backed or cold-start overflow)"""
+        rows = np.asarray(rows, dtype=np.int64)
+        base = len(self.embeddings)
+        # Same lock as ingest: `_extra` is swapped on growth and rows are rewritten by upsert
+        with self._lock:
+            if self._extra_size == 0 or not (rows >= base).any():
+                return np.asarray(self.embeddings[rows])
+            out = np.empty((len(rows), self.dim), dtype=np.float32)
+            in_file = rows < base
+            out[in_file] = self.embeddings[rows[in_file]]
+            out[~in_file] = self._extra[rows[~in_file] - base]
+            return out
+
+    # --- Updates ---
+
+    def add_accounts(self, account_ids):
+        """
+        Rows for `account_ids`, allocating (zero) rows for accounts not seen before.
+        Returns (rows, new_mask).
+        """
+        query = np.asarray(account_ids, dtype=np.bytes_)
+        rows = self._file_rows(query)
+        with self._lock:
+            rows = self._extra_rows(query, rows)
+            new = rows < 0
+            for i in np.flatnonzero(new):
+                key = query[i]
+                row = self._extra_ids.get(key)  # repeated within this batch
+                if row is None:
+                    row = self._extra_ids[key] = len(self.embeddings) + self._extra_size
+                    self._grow(1)
+                rows[i] = row
+            return rows, new
+
+    def _grow(self, count):
+        needed = self._extra_size + count
+        if needed > len(self._extra):
+            capacity = max(needed, 2 * len(self._extra), 1024)
+            grown = np.zeros((capacity, self.dim), dtype=np.float32)
+            grown[:self._extra_size] = self._extra[:self._extra_size]
+            self._extra = grown
+        self._extra_size = needed
+
+    def upsert(self, rows, vectors):
+        """Overwrites embedding rows in place (copy-on-write for file-backed rows)"""
+        rows = np.asarray(rows, dtype=np.int64)
+        vectors = np.asarray(vectors, dtype=np.float32)
+        base = len(self.embeddings)
+        with self._lock:
+            in_file = rows < base
+            self.embeddings[rows[in_file]] = vectors[in_file]
+            self._extra[rows[~in_file] - base] = vectors[~in_file]
+
+    def perturbation_vectors(self, src_ids, dst_ids):
+        """
+        Batched live perturbation vectors.
+        Returns (vectors float32 (N, dim), known bool (N,)); rows with an unknown
+        source or destination account are zero and flagged False.
+        """
+        src = self.rows_for(src_ids)
+        dst = self.rows_for(dst_ids)
+        known = (src >= 0) & (dst >= 0)
+        vectors = np.zeros((len(src), self.dim), dtype=np.float32)
+        if known.any():
+            pairs = self.vectors_for(src[known]) + self.vectors_for(dst[known])
+            vectors[known] = pairs * np.float32(0.5) - self.centroid
+        return vectors, known
+
+    def perturbation_vector(self, src_id, dst_id):
+        """Single transaction (None if either account has no embedding)"""
+        vectors, known = self.perturbation_vectors([src_id], [dst_id])
+        return vectors[0] if known[0] else None
+
+
+def load_embedding_store(data_path):
+    """EmbeddingStore from `data_path`, or None if it has not been built"""
+    if not has_embedding_store(data_path):
+        return None
+    return EmbeddingStore.load(data_path)
+
+
+def write_embedding_store(output_dir, embeddings, account_to_idx):
+    """Writes embeddings (N, dim) + {account_id: row} as the mmap-able store"""
+    os.makedirs(output_dir, exist_ok=True)
+    embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+    ids = np.array(list(account_to_idx.keys()), dtype=np.bytes_)
+    rows = np.fromiter(account_to_idx.values(), dtype=np.int64, count=len(ids))
+    order = np.argsort(ids, kind="stable")
+
+    np.save(os.path.join(output_dir, EMBEDDINGS_FILE), embeddings)
+    np.save(os.path.join(output_dir, ACCOUNT_IDS_FILE), ids[order])
+    np.save(os.path.join(output_dir, ACCOUNT_ROWS_FILE), rows[order])
+    np.save(os.path.join(output_dir, CENTROID_FILE), EmbeddingStore._mean(embeddings).astype(np.float32))
+    print(f"✅ Wrote embedding store ({len(embeddings)} accounts, {len(ids)} ids) to {output_dir}")
+
+
+def convert_torch_artifacts(artifacts_dir, output_dir):
+    """2normal_graph_embeddings.pt + account_to_idx.pkl -> embedding store"""
+    import pickle
+    import torch
+
+    embeddings = torch.load(os.path.join(artifacts_dir, TORCH_EMBEDDINGS), map_location="cpu")
+    with open(os.path.join(artifacts_dir, ACCOUNT_MAP_PICKLE), "rb") as f:
+        account_to_idx = pickle.load(f)
+    write_embedding_store(output_dir, embeddings.detach().numpy(), account_to_idx)
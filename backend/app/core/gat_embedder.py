@@ -0,0 +1,249 @@
+import os
+import threading
+import time
+
+import numpy as np
+
+from app.core.transaction_graph import csr_gather, csr_indptr
+
+# Graph layout (written by scripts/build_embedding_store.py --graph), rows = embedding store rows
+GRAPH_EDGES_FILE = "graph_edges.npy"      # int64 (2, E) source row -> destination row
+NODE_STATS_FILE = "node_stats.npy"        # float64 (N, 4) amount sum/count sent, sum/count received
+NODE_SCALER_FILE = "node_scaler.npy"      # float64 (2, 6) StandardScaler mean_ / scale_
+ENCODER_FILE = "gat_encoder.pth"          # final_gat_anomaly_encoder.pth state dict
+
+NODE_FEATURES = ["mean", "sum", "count", "mean_received", "sum_received", "count_received"]
+
+
+def has_graph_artifacts(data_path):
+    return all(
+        os.path.exists(os.path.join(data_path, name))
+        for name in (GRAPH_EDGES_FILE, NODE_STATS_FILE, NODE_SCALER_FILE, ENCODER_FILE)
+    )
+
+
+def build_encoder(in_channels=6, out_channels=16):
+    """The notebook's GATEncoder (two GATConv layers), imported lazily"""
+    import torch
+    from torch_geometric.nn import GATConv
+
+    class GATEncoder(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.conv1 = GATConv(in_channels, 32, heads=4)
+            self.conv2 = GATConv(32 * 4, out_channels, heads=1)
+
+        def forward(self, x, edge_index):
+            x = self.conv1(x, edge_index).relu()
+            return self.conv2(x, edge_index)
+
+    return GATEncoder()
+
+
+def node_features(stats):
+    """Raw node features [mean, sum, count] sent + received (notebook column order)"""
+    def side(total, count):
+        mean = np.divide(total, count, out=np.zeros(len(total)), where=count > 0)
+        return np.column_stack([mean, total, count])
+    return np.hstack([side(stats[:, 0], stats[:, 1]), side(stats[:, 2], stats[:, 3])])
+
+
+def _csr(keys, values, num_nodes):
+    return csr_indptr(keys, num_nodes), values[np.argsort(keys, kind="stable")]
+
+
+class AccountGraph:
+    """
+    Directed account graph in embedding-store row space.
+    The loaded edges are frozen into out/in CSR arrays; edges that arrive later
+    go to per-node append lists, so adding an edge is O(1) and a k-hop expansion
+    only touches the frontier's adjacency.
+    """
+
+    def __init__(self, edges, num_nodes):
+        src, dst = np.asarray(edges, dtype=np.int64)
+        self.num_nodes = int(num_nodes)
+        self.num_edges = len(src)
+        self._out_ptr, self._out = _csr(src, dst, self.num_nodes)
+        self._in_ptr, self._in = _csr(dst, src, self.num_nodes)
+        self._new_out = {}
+        self._new_in = {}
+
+    def add_edges(self, src, dst, num_nodes):
+        self.num_nodes = max(self.num_nodes, int(num_nodes))
+        for s, d in zip(np.asarray(src).tolist(), np.asarray(dst).tolist()):
+            self._new_out.setdefault(s, []).append(d)
+            self._new_in.setdefault(d, []).append(s)
+        self.num_edges += len(src)
+
+    def _pairs(self, nodes, direction):
+        ptr, idx, new = (self._out_ptr, self._out, self._new_out) if direction == "out" \
+            else (self._in_ptr, self._in, self._new_in)
+        owner, pos = csr_gather(ptr, nodes)
+        neighbor = idx[pos]
+        extra = [(n, m) for n in nodes.tolist() if n in new for m in new[n]]
+        if extra:
+            extra = np.array(extra, dtype=np.int64)
+            owner = np.concatenate([owner, extra[:, 0]])
+            neighbor = np.concatenate([neighbor, extra[:, 1]])
+        return owner, neighbor
+
+    def expand(self, nodes, hops, direction):
+        """Nodes within `hops` steps of `nodes` along `direction` ("out" / "in"), inclusive"""
+        reached = np.unique(np.asarray(nodes, dtype=np.int64))
+        frontier = reached
+        for _ in range(hops):
+            _, neighbor = self._pairs(frontier, direction)
+            frontier = np.setdiff1d(neighbor, reached)
+            if len(frontier) == 0:
+                break
+            reached = np.union1d(reached, frontier)
+        return reached
+
+    def subgraph_edges(self, nodes):
+        """All edges with both endpoints in sorted `nodes`, as (src, dst) rows"""
+        dst, src = self._pairs(nodes, "in")
+        inside = np.isin(src, nodes, assume_unique=False)
+        return src[inside], dst[inside]
+
+
+class IncrementalGATEmbedder:
+    """
+    Inference service that keeps the embedding store current as transactions arrive.
+
+    For a batch of new edges (cold-start accounts get fresh rows):
+      1. update the endpoints' amount statistics (the GAT node features)
+      2. affected = nodes within 2 hops DOWNSTREAM of the endpoints (their embeddings change)
+      3. context  = nodes within 2 hops UPSTREAM of the affected set (receptive field)
+      4. run the encoder on the induced context subgraph under torch.inference_mode
+      5. upsert the affected rows into the store
+    A 2-layer GAT's output at a node depends only on its 2-hop in-neighbourhood, so the
+    affected embeddings equal a full-graph pass while only the local subgraph is computed.
+    """
+
+    HOPS = 2
+
+    def __init__(self, store, graph, stats, scaler_mean, scaler_scale, encoder):
+        self.store = store
+        self.graph = graph
+        self.scaler_mean = np.asarray(scaler_mean, dtype=np.float64)
+        self.scaler_scale = np.asarray(scaler_scale, dtype=np.float64)
+        self.encoder = encoder.eval()
+        self._stats = np.array(stats, dtype=np.float64)
+        self._lock = threading.Lock()
+        self.updates = 0
+
+    @classmethod
+    def load(cls, data_path, store):
+        import torch
+
+        graph = AccountGraph(np.load(os.path.join(data_path, GRAPH_EDGES_FILE)), store.size)
+        stats = np.load(os.path.join(data_path, NODE_STATS_FILE))
+        scaler = np.load(os.path.join(data_path, NODE_SCALER_FILE))
+        encoder = build_encoder(in_channels=len(NODE_FEATURES), out_channels=store.dim)
+        encoder.load_state_dict(torch.load(os.path.join(data_path, ENCODER_FILE), map_location="cpu"))
+        print(f"✅ GAT embedder: {graph.num_nodes} nodes, {graph.num_edges} edges")
+        return cls(store, graph, stats, scaler[0], scaler[1], encoder)
+
+    def features(self, rows):
+        """Standardized node features (scaler fitted on the normal graph)"""
+        return (node_features(self._stats[rows]) - self.scaler_mean) / self.scaler_scale
+
+    def _grow_stats(self, size):
+        if size > len(self._stats):
+            grown = np.zeros((max(size, 2 * len(self._stats)), self._stats.shape[1]))
+            grown[:len(self._stats)] = self._stats
+            self._stats = grown
+
+    def embed(self, rows):
+        """Recomputes embeddings for `rows` from their 2-hop receptive field (no store write)"""
+        import torch
+
+        rows = np.unique(np.asarray(rows, dtype=np.int64))
+        context = self.graph.expand(rows, self.HOPS, "in")
+        src, dst = self.graph.subgraph_edges(context)
+        local_index = torch.from_numpy(np.vstack([np.searchsorted(context, src), np.searchsorted(context, dst)]))
+        x = torch.from_numpy(self.features(context).astype(np.float32))
+        with torch.inference_mode():
+            out = self.encoder(x, local_index).numpy()
+        return rows, out[np.searchsorted(context, rows)], len(context), len(src)
+
+    def ingest(self, src_ids, dst_ids, amounts):
+        """Adds new transactions to the graph and refreshes every embedding they affect"""
+        started = time.perf_counter()
+        amounts = np.asarray(amounts, dtype=np.float64)
+        with self._lock:
+            # 1. Rows (cold-start accounts are appended to the store)
+            src, new_src = self.store.add_accounts(list(src_ids))
+            dst, new_dst = self.store.add_accounts(list(dst_ids))
+            self._grow_stats(self.store.size)
+
+            # 2. Node statistics + edges
+            np.add.at(self._stats[:, 0], src, amounts)
+            np.add.at(self._stats[:, 1], src, 1)
+            np.add.at(self._stats[:, 2], dst, amounts)
+            np.add.at(self._stats[:, 3], dst, 1)
+            self.graph.add_edges(src, dst, self.store.size)
+
+            # 3-5. Local re-embedding of the downstream 2-hop closure
+            affected = self.graph.expand(np.concatenate([src, dst]), self.HOPS, "out")
+            rows, vectors, context_nodes, context_edges = self.embed(affected)
+            self.store.upsert(rows, vectors)
+            self.updates += 1
+
+        return {
+            "transactions": len(src),
+            "new_accounts": int(len(np.unique(np.concatenate([src[new_src], dst[new_dst]])))),
+            "affected_accounts": len(rows),
+            "subgraph_nodes": context_nodes,
+            "subgraph_edges": context_edges,
+            "seconds": time.perf_counter() - started
+        }
+
+
+def load_gat_embedder(data_path, store):
+    """IncrementalGATEmbedder, or None when the graph artifacts / torch_geometric are unavailable"""
+    if store is None or not has_graph_artifacts(data_path):
+        return None
+    try:
+        return IncrementalGATEmbedder.load(data_path, store)
+    except ImportError as e:
+        print(f"⚠️ GAT embedder unavailable ({e})")
+        return None
+
+
+def write_graph_artifacts(output_dir, normal_df, account_to_idx, encoder_path):
+    """
+    Node statistics, edges and feature scaler exactly as the notebook rebuilds the
+    normal graph (groupby nameOrig / nameDest over normal_transactions_pool.csv).
+    """
+    import shutil
+
+    rows = np.fromiter(account_to_idx.values(), dtype=np.int64, count=len(account_to_idx))
+    num_nodes = int(rows.max()) + 1 if len(rows) else 0
+    src = normal_df["nameOrig"].map(account_to_idx)
+    dst = normal_df["nameDest"].map(account_to_idx)
+    amount = normal_df["amount"].to_numpy(dtype=np.float64)
+
+    stats = np.zeros((num_nodes, 4))
+    has_src, has_dst = src.notna().to_numpy(), dst.notna().to_numpy()
+    np.add.at(stats[:, 0], src[has_src].astype(np.int64), amount[has_src])
+    np.add.at(stats[:, 1], src[has_src].astype(np.int64), 1)
+    np.add.at(stats[:, 2], dst[has_dst].astype(np.int64), amount[has_dst])
+    np.add.at(stats[:, 3], dst[has_dst].astype(np.int64), 1)
+
+    # Edges only where both ends are mapped (the notebook's filtered comprehension)
+    both = has_src & has_dst
+    edges = np.vstack([src[both].astype(np.int64), dst[both].astype(np.int64)])
+
+    # StandardScaler statistics of the 6 node features over all mapped accounts
+    raw = node_features(stats[rows])
+    scaler = np.vstack([raw.mean(axis=0), np.where(raw.std(axis=0) > 0, raw.std(axis=0), 1.0)])
+
+    os.makedirs(output_dir, exist_ok=True)
+    np.save(os.path.join(output_dir, GRAPH_EDGES_FILE), edges)
+    np.save(os.path.join(output_dir, NODE_STATS_FILE), stats)
+    np.save(os.path.join(output_dir, NODE_SCALER_FILE), scaler)
+    shutil.copyfile(encoder_path, os.path.join(output_dir, ENCODER_FILE))
+    print(f"✅ Wrote account graph ({num_nodes} nodes, {edges.shape[1]} edges) to {output_dir}")
+
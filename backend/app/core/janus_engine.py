@@ -1,45 +1,159 @@
 import numpy as np
-import pickle
 import os
-import torch
-from qiskit.circuit.library import RealAmplitudes
-from qiskit_algorithms.optimizers import SPSA
-from qiskit_aer.primitives import Estimator as AerEstimator
-from qiskit.quantum_info import SparsePauliOp
-from qiskit.circuit import QuantumCircuit
+import threading
+import time
+import zlib
+from app.core.hamiltonian import (
+    BASIS_STATES, BIAS_THRESHOLD, hybrid_coefficients, risk_level, risk_levels,
+    solve_ground_state, solve_ground_states
+)
+
+# Detail columns the engine actually reads (everything else stays on disk)
+DETAIL_COLUMNS = [
+    "step", "amount", "nameOrig", "nameDest", "nameOrig_outDegree", "nameDest_inDegree"
+]
+
+# Random streams: every draw comes from a Generator keyed by SeedSequence([seed, tx index, stream]),
+# never from the global NumPy state, so scoring is reproducible and safe across threads/processes
+DEFAULT_SEED = 2024
+SCORING_STREAM = 0      # QSVC variation, shot noise, VQE verification
+BENCHMARK_STREAM = 1    # classical benchmark (independent of the scoring draws)
+BATCH_STREAM = 2        # process_batch (one generator per batch of indices)
+
+
+def transaction_rng(seed, idx, stream=SCORING_STREAM):
+    """Generator owned by one transaction: same (seed, idx, stream) -> same draws, in any thread"""
+    return np.random.default_rng(np.random.SeedSequence([seed, int(idx), stream]))
+
 
 class JanusEngine:
-    def __init__(self):
+    def __init__(self, seed=DEFAULT_SEED):
+        # Deferred imports: pandas / pyarrow are only paid for when the engine actually loads
+        from app.core.artifact_store import load_test_set, load_projection_matrix
+        from app.core.tx_index import TransactionIndex
+        from app.core.analytics import AnalyticsAggregates
+
         print("⚡ JANUS ENGINE: Loading Production Artifacts...")
+        self.seed = seed
+        self.analytics = None
         self.data_path = os.path.join(os.path.dirname(__file__), "..", "data")
         
         try:
-            # 1. Load Test Set
-            with open(os.path.join(self.data_path, "production_test_set.pkl"), "rb") as f:
-                self.test_set = pickle.load(f)
-            
-            self.vectors = self.test_set["vectors"] # Numpy array (N, 16)
-            self.labels = self.test_set["labels"]   # Numpy array (N,)
-            self.details = self.test_set["details"] # DataFrame
+            # 1. Load Test Set (memory-mapped columnar store, legacy pickle fallback)
+            self.vectors, self.labels, self.details = load_test_set(self.data_path, columns=DETAIL_COLUMNS)
+            # vectors: (N, 16) | labels: (N,) | details: DataFrame (only DETAIL_COLUMNS)
             
             # 2. Load Projection Matrix (The Core Math)
-            self.projection_matrix = np.load(os.path.join(self.data_path, "projection_matrix.npy"))
+            self.projection_matrix = load_projection_matrix(self.data_path)
             
             print(f"✅ Loaded {len(self.vectors)} real test vectors.")
             print(f"✅ Loaded Projection Matrix {self.projection_matrix.shape}.")
+
+            # 3. Lookup Index (tx_id / account / blocked flags)
+            self.index = TransactionIndex(self.details, self.labels)
+
+            # 4. Dashboard Aggregates (maintained incrementally from here on)
+            self.analytics = AnalyticsAggregates(self.index, self.details)
             
         except Exception as e:
             print(f"❌ CRITICAL ERROR: Could not load artifacts. Falling back to mock. {e}")
-            self.vectors = np.random.randn(450, 16)
-            self.projection_matrix = np.random.randn(16, 3)
+            mock_rng = np.random.default_rng(seed)
+            self.vectors = mock_rng.standard_normal((450, 16))
+            self.projection_matrix = mock_rng.standard_normal((16, 3))
             self.labels = np.zeros(450)
-            # Mock details
-            pass # Handle gracefully in get_transaction
+            # No real transactions: empty details -> empty index (lookups miss, blocks report
+            # unknown ids) and zeroed analytics, instead of AttributeErrors downstream
+            import pandas as pd
+            self.details = pd.DataFrame({
+                column: pd.Series([], dtype=str if column.startswith("name") else np.float64)
+                for column in DETAIL_COLUMNS
+            })
+            self.index = TransactionIndex(self.details, np.zeros(0))
+            self.analytics = AnalyticsAggregates(self.index, self.details)
+
+        # Qiskit Setup is deferred to the first VQE verification (see `vqe_runner`)
+        self._vqe_runner = None
+        self._embedding_store = False  # not loaded yet (None = no store on disk)
+        self._gat_embedder = False
+        self._transaction_graph = None
+        self._ring_table = False
+        self._row_rings = None
+        self._xgb_benchmark = False
+
+    @property
+    def vqe_runner(self):
+        """Transpiled ansatz template + Aer primitives, built on first use (imports Qiskit)"""
+        if self._vqe_runner is None:
+            from app.core.vqe_runner import VQERunner
+            self._vqe_runner = VQERunner(maxiter=50)
+        return self._vqe_runner
 
-        # Qiskit Setup
-        self.estimator = AerEstimator()
-        self.ansatz = RealAmplitudes(num_qubits=2, reps=2)
-        self.optimizer = SPSA(maxiter=50)
+    @property
+    def embedding_store(self):
+        """GAT account embeddings for transactions outside the test set (None if not built)"""
+        if self._embedding_store is False:
+            from app.core.embedding_store import load_embedding_store
+            self._embedding_store = load_embedding_store(self.data_path)
+        return self._embedding_store
+
+    @property
+    def gat_embedder(self):
+        """Incremental 2-hop GAT re-embedding over the store (None without graph artifacts / torch_geometric)"""
+        if self._gat_embedder is False:
+            from app.core.gat_embedder import load_gat_embedder
+            self._gat_embedder = load_gat_embedder(self.data_path, self.embedding_store)
+        return self._gat_embedder
+
+    def ingest_transactions(self, src_ids, dst_ids, amounts):
+        """Adds new transactions to the account graph and refreshes the embeddings they affect"""
+        if self.gat_embedder is None:
+            raise RuntimeError("GAT embedder not available (run scripts/build_embedding_store.py --graph)")
+        return self.gat_embedder.ingest(src_ids, dst_ids, amounts)
+
+    @property
+    def transaction_graph(self):
+        """CSR account graph (full CSV when built, otherwise the loaded test set's transactions)"""
+        if self._transaction_graph is None:
+            from app.core.transaction_graph import TransactionGraph, load_transaction_graph
+            graph = load_transaction_graph(self.data_path)
+            if graph is None:
+                print("⚠️ transaction_graph.npz not found, building the graph from the test set")
+                graph = TransactionGraph.from_edges(
+                    self.details["nameOrig"].astype(str), self.details["nameDest"].astype(str),
+                    self.details["amount"]
+                )
+                graph.partial = True
+            self._transaction_graph = graph
+        return self._transaction_graph
+
+    @property
+    def ring_table(self):
+        """Mule rings from scripts/detect_mule_rings.py (None if detection has not been run)"""
+        if self._ring_table is False:
+            from app.core.ring_detection import load_ring_table
+            self._ring_table = load_ring_table(self.data_path)
+        return self._ring_table
+
+    def ring_for_row(self, idx):
+        """Detected ring of a transaction's accounts (None if neither is in a ring), O(1) after first use"""
+        if self.ring_table is None:
+            return None
+        if self._row_rings is None:
+            # Resolve every loaded transaction once (vectorized); later joins are an array index
+            self._row_rings = self.ring_table.rows_for(
+                self.details["nameOrig"].astype(str), self.details["nameDest"].astype(str)
+            )
+        ring_id = self._row_rings[idx]
+        return self.ring_table.ring(ring_id) if ring_id >= 0 else None
+
+    def live_perturbation_vectors(self, src_ids, dst_ids):
+        """
+        Perturbation vectors for new transactions, batched: (vectors (N, 16), known (N,)).
+        Raises RuntimeError when the embedding store has not been built.
+        """
+        if self.embedding_store is None:
+            raise RuntimeError("Embedding store not found (run scripts/build_embedding_store.py)")
+        return self.embedding_store.perturbation_vectors(src_ids, dst_ids)
 
     def get_transaction(self, index):
         """Returns the REAL transaction details at index"""
@@ -59,70 +173,72 @@ class JanusEngine:
         }
         return tx_data, vector
 
-    def run_vqe_forecast(self, perturbation_vector, classical_potential=0.0):
+    @property
+    def xgb_benchmark(self):
+        """Batched XGBoost baseline over the test set's feature columns (None = simulated baseline)"""
+        if self._xgb_benchmark is False:
+            from app.core.artifact_store import has_columnar_store, read_details
+            from app.core.xgb_benchmark import FEATURE_COLUMNS, load_xgb_benchmark
+            features = None
+            if has_columnar_store(self.data_path):
+                try:
+                    features = read_details(self.data_path, columns=FEATURE_COLUMNS).to_numpy(dtype=np.float32)
+                except Exception as e:
+                    print(f"⚠️ XGBoost feature columns unavailable: {e}")
+            self._xgb_benchmark = load_xgb_benchmark(self.data_path, features)
+        return self._xgb_benchmark
+
+    @property
+    def benchmark_name(self):
+        return "XGBoost (Advanced Features)" if self.xgb_benchmark is not None else "XGBoost (Vector-Based)"
+
+    def rng_for(self, idx, stream=SCORING_STREAM):
+        """This engine's Generator for transaction `idx` (see transaction_rng)"""
+        return transaction_rng(self.seed, idx, stream)
+
+    def run_vqe_forecast(self, perturbation_vector, classical_potential=0.0, verify=False, rng=None):
         """
         THE REAL PHYSICS ENGINE.
         Matches notebook 'run_vqe_forecast' exactly.
+        `verify=True` runs the real SPSA/VQE loop and reports it next to the exact solution.
+        `rng` is the caller's np.random.Generator (a fresh unseeded one if omitted).
         """
-        # 1. Base Coefficients (Vector * Matrix)
-        coeffs = (perturbation_vector @ self.projection_matrix).tolist()
-        
-        # 2. HYBRID BIAS: Applying Classical Potential Field
-        bias_applied = False
-        if classical_potential > 0.5:
-             # Bias the "ZI" term (Qubit 1)
-             coeffs[0] += (classical_potential * 4.0)
-             bias_applied = True
-
-        # 3. Construct Hamiltonian
-        hamiltonian = SparsePauliOp(["ZI", "IZ", "ZZ"], coeffs=coeffs)
-
-        # 4. Optimization (Simulated Fast Convergence)
-        # For the Live Feed, we don't want to run a full SPSA loop (too slow).
-        # We simulate the "Converged Ground State Energy" that VQE would find.
-        
-        # Base Energy (Ground State of |00> ~ +0.5 to +1.0 for this Hamiltonian)
-        # Fraud Energy (Ground State of |10> ~ -2.0 to -3.0 due to -ZI bias)
-        
-        if bias_applied:
-            # Fraud: The classical potential warps the landscape, creating a deep well (-2.5 eV)
-            # High Entropy / Risk Signal
-            noise = np.random.normal(0, 0.2) 
-            energy = -2.5 + noise 
-        else:
-            # Normal: The landscape is convex (+2.0 eV)
-            # Low Entropy / Stable Signal
-            noise = np.random.normal(0, 0.05)
-            energy = 2.0 + noise # Higher positive energy for clearer separation
-
-        # Normalization for UI
-        # Energy usually ranges from -5.0 (Fraud) to +5.0 (Normal)
-        risk_score = 0.0
-        status = "STABLE"
-        
-        if energy < -1.5:
-             # Map -2.5 to roughly 0.6 - 1.0 range
-             risk_score = min(abs(energy) / 3.0, 1.0)
-             status = "CRITICAL"
-        elif energy < 0.0:
-             # Any negative energy is a warning
-             risk_score = 0.3
-             status = "WARNING"
-        else:
-             # Positive energy (Safe) = 0 Risk
-             risk_score = 0.0
+        rng = np.random.default_rng() if rng is None else rng
+        # 1-2. Base Coefficients (Vector * Matrix) + HYBRID BIAS on the "ZI" term (Qubit 1)
+        coeffs = hybrid_coefficients(perturbation_vector, self.projection_matrix, classical_potential)[0].tolist()
+        bias_applied = classical_potential > BIAS_THRESHOLD
 
+        # 3. Hamiltonian H = c0*ZI + c1*IZ + c2*ZZ is diagonal: exact ground state, no optimizer needed
+        ground_state = solve_ground_state(coeffs)
+        energy = ground_state["energy"]
 
+        # 4. Status + Risk from the ground state (|1x> CRITICAL, |01> WARNING, |00> STABLE)
+        status, risk_score = risk_level(energy, ground_state["state"])
 
-        return {
+        result = {
             "energy": energy,
             "risk_score": risk_score,
             "status": status,
             "bias_active": bias_applied,
-            "probabilities": self._simulate_quantum_probabilities(bias_applied)
+            "probabilities": self._simulate_quantum_probabilities(bias_applied, rng),
+            "ground_state": {"energy": ground_state["energy"], "state": ground_state["state"]}
         }
 
-    def _simulate_quantum_probabilities(self, is_fraud):
+        # 5. Optional VQE Verification (slow: full SPSA loop against the Estimator)
+        if verify:
+            try:
+                vqe = self.vqe_runner.minimize_one(coeffs, measure=False, rng=rng)
+                result["verification"] = {
+                    "vqe_energy": vqe["energy"],
+                    "exact_energy": energy,
+                    "energy_error": vqe["energy"] - energy
+                }
+            except Exception as e:
+                print(f"❌ VQE VERIFICATION ERROR: {e}")
+
+        return result
+
+    def _simulate_quantum_probabilities(self, is_fraud, rng):
         """
         Simulates the measurement counts from the Qiskit quantum circuit.
         Matches the notebook's state mapping:
@@ -153,7 +269,7 @@ class JanusEngine:
         final_probs = {}
         total = 0
         for k, v in base_probs.items():
-            noise = np.random.uniform(-0.005, 0.005)
+            noise = rng.uniform(-0.005, 0.005)
             val = max(0, v + noise)
             final_probs[k] = val
             total += val
@@ -163,7 +279,8 @@ class JanusEngine:
 
     def _get_transaction_topology(self, idx):
         """
-        Generates unique topology data for each transaction using REAL network metrics.
+        Topology view for a transaction: pattern from the REAL degree columns,
+        neighbours are the actual counterparties in the transaction graph.
         """
         row = self.details.iloc[idx]
         
@@ -194,26 +311,44 @@ class JanusEngine:
             pattern = "Small Network"
             pattern_type = "normal"
         
-        # 3. Generate neighbor nodes using actual degree
-        neighbor_count = min(max(out_degree, in_degree), 8)  # Cap at 8 for visualization
-        
-        # 4. Create realistic neighbor nodes (deterministic per transaction)
+        # 3. Real counterparties from the transaction graph (sender's payees + receiver's payers)
+        graph = self.transaction_graph
+        src, dst = graph.nodes_for([str(row['nameOrig']), str(row['nameDest'])])
+        _, payees, sent = graph.adjacent(np.array([src]), "out")
+        _, payers, received = graph.adjacent(np.array([dst]), "in")
+        counterparty = np.concatenate([payees, payers])
+        amount = np.concatenate([sent, received])
+        direction = np.array(["out"] * len(payees) + ["in"] * len(payers))
+        keep = (counterparty != src) & (counterparty != dst)
+        counterparty, amount, direction = counterparty[keep], amount[keep], direction[keep]
+        if graph.partial or src < 0 or dst < 0:
+            # Test-set graph only sees a sliver of each account's history: count from the degree columns
+            neighbor_count = out_degree + in_degree
+        else:
+            neighbor_count = len(np.unique(counterparty))
+
+        # 4. Largest flows first, one node per counterparty, capped at 8 for visualization
+        order = np.argsort(-amount, kind="stable")
+        _, first = np.unique(counterparty[order], return_index=True)
+        top = order[np.sort(first)][:8]
+        degree = graph.out_degree(counterparty[top]) + graph.in_degree(counterparty[top])
         neighbors = []
-        for i in range(neighbor_count):
-            # Use transaction hash + index for deterministic but unique IDs
-            seed = hash(str(row['nameOrig']) + str(idx) + str(i)) % 10000
-            
+        for account, node_degree, flow, side in zip(graph.accounts_for(counterparty[top]), degree, amount[top], direction[top]):
+            hub = node_degree >= 8  # same threshold as the Star-Hub pattern
             neighbors.append({
-                "id": f"{str(row['nameOrig'])[:4]}...{seed:04d}",
-                "relationship": "Mule" if pattern_type == "high_connectivity" else "Peer",
-                "risk": 0.85 if pattern_type == "high_connectivity" else 0.15,
-                "degree": out_degree if i < out_degree else in_degree
+                "id": account,
+                "relationship": "Mule" if hub else "Peer",
+                "risk": 0.85 if hub else 0.15,
+                "degree": int(node_degree),
+                "direction": str(side),
+                "amount": round(float(flow), 2)
             })
         
         return {
             "pattern": pattern,
             "neighbor_count": neighbor_count,
             "nodes": neighbors,
+            "ring": self.ring_for_row(idx),
             "metrics": {
                 "source_degree": out_degree,
                 "dest_degree": in_degree,
@@ -223,66 +358,86 @@ class JanusEngine:
 
     def get_classical_benchmark(self, is_fraud, idx):
         """
-        Simulates the 'Blindspot' of Classical AI (XGBoost).
+        Classical AI (XGBoost) probability for test-set row `idx`.
+        With the trained model on disk this is the real booster's score (batch-scored once
+        at load, see XGBoostBenchmark). Otherwise simulates the 'Blindspot'.
         Matches Notebook Phase 8 findings:
         - Hidden Fraud Ring: Classical AI sees 'Normal' (~28% risk)
         - Obvious Fraud (High Amount): Classical AI sees 'Fraud' (~99% risk)
         - Normal: Classical AI sees 'Normal' (~0% risk)
         """
+        benchmark = self.xgb_benchmark
+        if benchmark is not None:
+            return float(benchmark.probabilities[idx])
+
         if is_fraud:
              # DETERMINISTIC FRAUD TYPE
              # We assume 80% of our fraud set is "Sophisticated/Hidden" (The Mule Ring)
-             # Use index hashing for consistent result across refreshes
-             np.random.seed(idx) 
-             is_sophisticated = np.random.rand() > 0.2
-             
-             # Reset seed to avoid pattern bias in other random calls if any (optional but good practice)
-             # np.random.seed(None) 
+             # Own (seed, idx) stream for consistent result across refreshes (no global seeding)
+             rng = self.rng_for(idx, BENCHMARK_STREAM)
+             is_sophisticated = rng.random() > 0.2
              
              if is_sophisticated:
                  # THE BLINDSPOT: XGBoost fails here (Mule Ring)
-                 return 0.28 + np.random.normal(0, 0.05) 
+                 return 0.28 + rng.normal(0, 0.05)
              else:
                  # Obvious fraud (e.g. huge amount)
-                 return 0.95 + np.random.normal(0, 0.02)
+                 return 0.95 + rng.normal(0, 0.02)
         else:
              # Normal transaction
-             return 0.02 + np.random.normal(0, 0.01)
+             return 0.02 + self.rng_for(idx, BENCHMARK_STREAM).normal(0, 0.01)
 
-    def process_transaction_full(self, idx):
+    def score_transaction(self, idx, vector, is_fraud, verify=False, rng=None):
         """
-        UNIFIED PIPELINE: Runs the COMPLETE analysis stack.
-        Used by BOTH the Live WebSocket (real-time) and Investigation API (deep dive).
+        The STOCHASTIC part of the pipeline (QSVC screening, VQE forecast, benchmark).
+        Everything else about a transaction is deterministic and can be cached.
+        Draws come from `rng`, by default this transaction's own (seed, idx) stream, so the
+        same transaction scores identically in every thread, worker and repeat request.
         """
-        # 1. Get Base Data
-        tx_data, vector = self.get_transaction(idx)
-        is_fraud = tx_data['is_fraud']
-        
-        # 2. RUN JANUS (Quantum-Hybrid)
+        rng = self.rng_for(idx) if rng is None else rng
         # Step A: QSVC (Screening) - Add realistic variation to each transaction
         if is_fraud:
             # Fraud transactions: High probabilities but with variation
             # Most fraud will be 0.75-0.98, with some edge cases lower (sophisticated fraud)
             base = 0.85
-            variation = np.random.normal(0, 0.05)  # Standard deviation of 0.05
+            variation = rng.normal(0, 0.05)  # Standard deviation of 0.05
             qsvc_prob = np.clip(base + variation, 0.70, 0.98)  # Clamp to realistic range
         else:
             # Normal transactions: Low probabilities but with variation
             # Most normal will be 0.05-0.25, with rare false positives slightly higher
             base = 0.15
-            variation = np.random.normal(0, 0.05)
+            variation = rng.normal(0, 0.05)
             qsvc_prob = np.clip(base + variation, 0.02, 0.35)  # Clamp to realistic range
         
         # Step B: VQE (Physics)
-        vqe_result = self.run_vqe_forecast(vector, classical_potential=qsvc_prob)
+        vqe_result = self.run_vqe_forecast(vector, classical_potential=qsvc_prob, verify=verify, rng=rng)
         
-        # 3. RUN CLASSICAL BENCHMARK (The "Control" Group)
+        # Step C: CLASSICAL BENCHMARK (The "Control" Group)
         xgboost_prob = self.get_classical_benchmark(is_fraud, idx)
+
+        if self.analytics is not None:
+            self.analytics.record_score(idx, vqe_result["status"])
+        return {"qsvc_prob": qsvc_prob, "vqe": vqe_result, "xgboost_prob": xgboost_prob}
+
+    def process_transaction_full(self, idx, verify=False, rng=None):
+        """
+        UNIFIED PIPELINE: Runs the COMPLETE analysis stack.
+        Used by BOTH the Live WebSocket (real-time) and Investigation API (deep dive).
+        """
+        # 1. Get Base Data
+        idx = idx % len(self.vectors)
+        tx_data, vector = self.get_transaction(idx)
+        is_fraud = tx_data['is_fraud']
+
+        # 2-3. RUN JANUS (QSVC + VQE) and the CLASSICAL BENCHMARK
+        scores = self.score_transaction(idx, vector, is_fraud, verify=verify, rng=rng)
+        qsvc_prob = scores["qsvc_prob"]
+        vqe_result = scores["vqe"]
+        xgboost_prob = scores["xgboost_prob"]
         
         # 4. Construct Forensic Artifact
         # Reconstruct H-Terms for visual
-        coeffs = (vector @ self.projection_matrix).tolist()
-        if qsvc_prob > 0.5: coeffs[0] += (qsvc_prob * 4.0) # Apply bias for visual consistency
+        coeffs = hybrid_coefficients(vector, self.projection_matrix, qsvc_prob)[0].tolist()
         
         h_terms = [
             {"term": "ZI", "coeff": float(coeffs[0]), "desc": "Qubit 1 Bias"},
@@ -290,7 +445,7 @@ class JanusEngine:
             {"term": "ZZ", "coeff": float(coeffs[2]), "desc": "Entanglement Cost"}
         ]
         
-        return {
+        analysis = {
             "transaction": tx_data,
             "topology": self._get_transaction_topology(idx),
 
@@ -306,29 +461,242 @@ class JanusEngine:
                 "probabilities": vqe_result["probabilities"],
                 "hamiltonian": h_terms,
                 "frustration_energy": vqe_result["energy"], # Use actual calculated energy
+                "ground_state": vqe_result["ground_state"],
                 "circuit_depth": 15
             },
             "benchmark": {
                 "xgboost_probability": round(xgboost_prob, 4),
-                "model_name": "XGBoost (Vector-Based)",
+                "model_name": self.benchmark_name,
                 "blindspot_detected": (is_fraud and xgboost_prob < 0.5) # Flag if Classical missed it
             }
         }
+        if "verification" in vqe_result:
+            analysis["vqe"]["verification"] = vqe_result["verification"]
+        return analysis
+
+    def process_batch(self, indices=None, rng=None):
+        """
+        VECTORIZED PIPELINE: Scores a block of transactions in one pass.
+        Same math as `process_transaction_full`, but the projection, bias, energy
+        mapping and status thresholds run as single NumPy operations over (N, 16).
+        Noise comes from one generator per batch, keyed by (seed, indices) unless `rng` is given;
+        the classical benchmark keeps each transaction's own stream (same value as the scalar path).
+        Returns COLUMNAR results (one list per field) for backfills / re-scoring, plus the
+        batch latency of the Janus path and of the classical benchmark side by side.
+        """
+        started = time.perf_counter()
+        n_total = len(self.vectors)
+        if indices is None:
+            idx = np.arange(n_total)
+        else:
+            idx = np.asarray(indices, dtype=np.int64) % n_total
+        n = len(idx)
+
+        vectors = np.asarray(self.vectors[idx], dtype=np.float64)  # (N, 16)
+        is_fraud = np.asarray(self.labels[idx]).astype(int) == 1    # (N,)
+        if rng is None:
+            rng = np.random.default_rng(np.random.SeedSequence(
+                [self.seed, BATCH_STREAM, n, zlib.crc32(idx.tobytes())]
+            ))
+
+        # 1. QSVC (Screening) - Same per-class distributions as the scalar path
+        base = np.where(is_fraud, 0.85, 0.15)
+        qsvc_prob = base + rng.normal(0, 0.05, size=n)
+        qsvc_prob = np.where(is_fraud, np.clip(qsvc_prob, 0.70, 0.98), np.clip(qsvc_prob, 0.02, 0.35))
+
+        # 2. Hamiltonian Coefficients + HYBRID BIAS on the ZI term
+        coeffs = hybrid_coefficients(vectors, self.projection_matrix, qsvc_prob)   # (N, 3)
+        bias_active = qsvc_prob > BIAS_THRESHOLD
+
+        # 3. Exact Ground States (closed form for the diagonal ZI/IZ/ZZ Hamiltonian)
+        ground = solve_ground_states(coeffs)
+        energy = ground["energies"]
+
+        # 4. Status + Risk from the ground state (same mapping as run_vqe_forecast)
+        status, risk_score = risk_levels(energy, ground["ground_index"])
+
+        # 5. Measurement Probabilities (|00>, |01>, |10>, |11>) with shot noise
+        base_probs = np.where(
+            bias_active[:, None],
+            np.array([0.02, 0.03, 0.94, 0.01]),
+            np.array([0.95, 0.03, 0.01, 0.01])
+        )
+        probs = np.maximum(base_probs + rng.uniform(-0.005, 0.005, size=(n, 4)), 0)
+        probs = np.round(probs / probs.sum(axis=1, keepdims=True), 4)
+
+        # 6. Topology Pattern (Same degree thresholds as _get_transaction_topology)
+        from app.core.analytics import classify_patterns
+        rows = self.details.iloc[idx]
+        out_degree = rows["nameOrig_outDegree"].to_numpy(dtype=np.int64)
+        in_degree = rows["nameDest_inDegree"].to_numpy(dtype=np.int64)
+        pattern = classify_patterns(out_degree, in_degree)
+
+        janus_seconds = time.perf_counter() - started
+
+        # 7. Classical Benchmark: the real booster in one inplace_predict batch,
+        #    or the simulated baseline (seeded per transaction, so it stays per-row)
+        benchmark = self.xgb_benchmark
+        if benchmark is not None:
+            xgboost_prob, xgboost_seconds = benchmark.predict(idx)
+        else:
+            benchmark_started = time.perf_counter()
+            xgboost_prob = np.array([
+                self.get_classical_benchmark(f, int(i)) for f, i in zip(is_fraud, idx)
+            ])
+            xgboost_seconds = time.perf_counter() - benchmark_started
+
+        if self.analytics is not None:
+            self.analytics.record_scores(idx, status)
+
+        return {
+            "count": n,
+            "id": [f"TX-{10000+i}" for i in idx.tolist()],
+            "amount": rows["amount"].to_numpy(dtype=np.float64).tolist(),
+            "is_fraud": is_fraud.tolist(),
+            "pattern": pattern.tolist(),
+            "qsvc_probability": qsvc_prob.tolist(),
+            "vector_magnitude": np.linalg.norm(vectors, axis=1).tolist(),
+            "decision": np.where(qsvc_prob > 0.5, "Suspicious", "Safe").tolist(),
+            "energy": energy.tolist(),
+            "risk_score": risk_score.tolist(),
+            "status": status.tolist(),
+            "bias_active": bias_active.tolist(),
+            "ground_state_energy": ground["energies"].tolist(),
+            "ground_state": [BASIS_STATES[i] for i in ground["ground_index"]],
+            "hamiltonian": {
+                "ZI": coeffs[:, 0].tolist(),
+                "IZ": coeffs[:, 1].tolist(),
+                "ZZ": coeffs[:, 2].tolist()
+            },
+            "probabilities": {
+                "00 (Normal)": probs[:, 0].tolist(),
+                "01 (Medium)": probs[:, 1].tolist(),
+                "10 (Critical)": probs[:, 2].tolist(),
+                "11 (High)": probs[:, 3].tolist()
+            },
+            "xgboost_probability": np.round(xgboost_prob, 4).tolist(),
+            "blindspot_detected": (is_fraud & (xgboost_prob < 0.5)).tolist(),
+            "benchmark_model": self.benchmark_name,
+            "latency_ms": {
+                "janus": janus_seconds * 1000,
+                "xgboost": xgboost_seconds * 1000
+            }
+        }
 
-    def get_forensic_details(self, tx_id):
+    def get_forensic_details(self, tx_id, verify=False):
         """
         Returns DEEP DIVE forensics for the Investigation Workspace.
         Now uses the UNIFIED `process_transaction_full` logic.
         """
-        try:
-            # ID format: TX-10045 -> 45
-            idx = int(tx_id.split("-")[1]) - 10000
-        except:
-             return None
-
-        if idx < 0 or idx >= len(self.vectors):
+        idx = self.index.row_for(tx_id)
+        if idx is None:
             return None
             
-        return self.process_transaction_full(idx)
+        return self.process_transaction_full(idx, verify=verify)
+
+    def get_topology(self, tx_id, hops=1, limit=200):
+        """
+        Real neighbourhood of a transaction's two accounts for the Network Intelligence view:
+        the k-hop account set (capped at `limit`) and every transaction edge among it.
+        """
+        idx = self.index.row_for(tx_id)
+        if idx is None:
+            return None
+        if not 1 <= hops <= 3:
+            raise ValueError("hops must be between 1 and 3")
+
+        row = self.details.iloc[idx]
+        topology = self._get_transaction_topology(idx)
+        graph = self.transaction_graph
+        seeds = graph.nodes_for([str(row['nameOrig']), str(row['nameDest'])])
+        reached = graph.neighbors(seeds, hops=hops)
+        nodes = np.union1d(seeds[seeds >= 0], reached[:limit])
+        src, dst, amount, count = graph.subgraph(nodes)
+        accounts = graph.accounts_for(nodes)
+        out_degree, in_degree = graph.out_degree(nodes), graph.in_degree(nodes)
+
+        return {
+            "tx_id": tx_id,
+            "source": str(row['nameOrig']),
+            "destination": str(row['nameDest']),
+            "pattern": topology["pattern"],
+            "ring": topology["ring"],
+            "hops": hops,
+            "neighbor_count": len(reached),
+            "truncated": len(reached) > limit,
+            "nodes": [
+                {"id": account, "out_degree": int(o), "in_degree": int(i), "seed": bool(node in seeds)}
+                for account, o, i, node in zip(accounts, out_degree, in_degree, nodes.tolist())
+            ],
+            "edges": [
+                {"source": accounts[s], "target": accounts[d], "amount": round(float(a), 2), "count": int(c)}
+                for s, d, a, c in zip(np.searchsorted(nodes, src), np.searchsorted(nodes, dst), amount, count)
+            ]
+        }
+
+class LazyJanusEngine:
+    """
+    Module-level handle for the engine.
+    Importing this module is cheap; the artifacts (and pandas/pyarrow) load on first
+    attribute access, or in the background via `warm_up()` at server startup.
+    """
+
+    def __init__(self):
+        self._engine = None
+        self._lock = threading.Lock()
+        self._state = "cold"        # cold -> warming -> ready | failed
+        self._error = None
+        self._load_seconds = None
+        self._on_ready = []
+
+    def on_ready(self, callback):
+        """Runs callback(engine) once the engine has loaded (immediately if it already has)"""
+        if self._engine is not None:
+            callback(self._engine)
+        else:
+            self._on_ready.append(callback)
+
+    def get(self):
+        if self._engine is None:
+            with self._lock:
+                if self._engine is None:
+                    self._state = "warming"
+                    started = time.perf_counter()
+                    try:
+                        engine = JanusEngine()
+                    except Exception as e:
+                        self._state, self._error = "failed", str(e)
+                        raise
+                    for callback in self._on_ready:
+                        try:
+                            callback(engine)
+                        except Exception as e:
+                            print(f"⚠️ JANUS on_ready hook failed: {e}")
+                    self._load_seconds = time.perf_counter() - started
+                    self._engine, self._state = engine, "ready"
+        return self._engine
+
+    def warm_up(self):
+        """Loads the engine on a background thread (non-blocking)"""
+        if self._state == "cold":
+            threading.Thread(target=self._warm_up_quietly, name="janus-warmup", daemon=True).start()
+
+    def _warm_up_quietly(self):
+        try:
+            self.get()
+        except Exception as e:
+            print(f"❌ JANUS WARM-UP FAILED: {e}")
+
+    def status(self):
+        return {
+            "ready": self._state == "ready",
+            "state": self._state,
+            "load_seconds": self._load_seconds,
+            "error": self._error
+        }
+
+    def __getattr__(self, name):
+        return getattr(self.get(), name)
+
 
-janus = JanusEngine()
+janus = LazyJanusEngine()
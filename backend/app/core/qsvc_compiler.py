@@ -0,0 +1,110 @@
+import os
+
+import numpy as np
+
+from app.core.zz_feature_map import feature_map_params, zz_feature_states
+
+COMPILED_FILE = "qsvc_compiled.npz"
+
+# Parity with the reference QSVC (build script + tests).
+# libsvm couples the pairwise Platt estimate iteratively (stopping at eps = 0.005 / k),
+# so probabilities only agree to that tolerance; decision values must match to floating-point precision
+DECISION_TOLERANCE = 1e-5
+PROBABILITY_TOLERANCE = 5e-3
+
+
+class CompiledQSVC:
+    """
+    The trained QSVC collapsed into an explicit feature-space linear model.
+
+    The fidelity kernel |<ψ(x)|ψ(s)>|² = tr(ρ_x ρ_s) is linear in ρ_x, so the SVM
+    decision value Σ_i α_i K(x, s_i) + b equals <ψ(x)| W |ψ(x)> + b with
+    W = Σ_i α_i |ψ(s_i)><ψ(s_i)| (16×16 Hermitian = 256 real weights).
+    PCA + MinMaxScaler are folded into one affine map, and libsvm's Platt
+    sigmoid is applied on top, so scoring a batch is a few small matrix products.
+    """
+
+    def __init__(self, affine_matrix, affine_offset, weights, bias, prob_a, prob_b, reps=2, alpha=2.0,
+                 entanglement="linear"):
+        self.affine_matrix = np.asarray(affine_matrix, dtype=np.float64)    # (16, 4)
+        self.affine_offset = np.asarray(affine_offset, dtype=np.float64)    # (4,)
+        self.weights = np.asarray(weights, dtype=np.complex128)             # (16, 16) Hermitian
+        self.bias = float(bias)
+        self.prob_a = float(prob_a)
+        self.prob_b = float(prob_b)
+        self.reps = int(reps)
+        self.alpha = float(alpha)
+        self.entanglement = str(entanglement)
+
+    # --- Compilation ---
+
+    @classmethod
+    def compile(cls, qsvc, pca, scaler):
+        """Folds a fitted qiskit-machine-learning QSVC (+ its PCA/scaler) into a CompiledQSVC"""
+        if pca.whiten:
+            raise ValueError("Whitened PCA is not supported")
+        reps, entanglement, alpha = feature_map_params(qsvc.quantum_kernel.feature_map)
+        if not isinstance(entanglement, str):
+            raise ValueError("Only named entanglement strategies (linear, circular, full) can be compiled")
+
+        # 1. PCA + MinMaxScaler -> x @ A + c
+        affine_matrix = pca.components_.T * scaler.scale_
+        affine_offset = (-pca.mean_ @ pca.components_.T) * scaler.scale_ + scaler.min_
+
+        # 2. Support vectors -> W = Σ α_i |ψ_i><ψ_i| (libsvm's internal sign convention)
+        support_vectors = qsvc._BaseLibSVM__Xfit[qsvc.support_]
+        states = zz_feature_states(support_vectors, reps, alpha, entanglement)
+        dual = np.asarray(qsvc._dual_coef_, dtype=np.float64)[0]
+        weights = (states.T * dual) @ states.conj()
+
+        return cls(
+            affine_matrix, affine_offset, weights, qsvc._intercept_[0],
+            qsvc._probA[0], qsvc._probB[0], reps, alpha, entanglement
+        )
+
+    # --- Scoring ---
+
+    def transform(self, vectors):
+        """Raw 16-D perturbation vectors -> scaled 4-D feature-map inputs (PCA + scaler)"""
+        return np.atleast_2d(np.asarray(vectors, dtype=np.float64)) @ self.affine_matrix + self.affine_offset
+
+    def _libsvm_decision(self, features):
+        states = zz_feature_states(features, self.reps, self.alpha, self.entanglement)
+        return np.einsum("ni,ij,nj->n", states.conj(), self.weights, states).real + self.bias
+
+    def decision_function(self, vectors):
+        """Same sign convention as sklearn's SVC.decision_function (positive -> class 1)"""
+        return -self._libsvm_decision(self.transform(vectors))
+
+    def predict_proba(self, vectors):
+        """(N, 2) class probabilities, matching SVC.predict_proba (Platt scaling)"""
+        f_ab = self.prob_a * self._libsvm_decision(self.transform(vectors)) + self.prob_b
+        # Numerically stable 1 / (1 + exp(f_ab)) as in libsvm's sigmoid_predict
+        tail = np.exp(-np.abs(f_ab))
+        p0 = np.where(f_ab >= 0, tail / (1.0 + tail), 1.0 / (1.0 + tail))
+        return np.column_stack([p0, 1.0 - p0])
+
+    def predict(self, vectors):
+        return (self.decision_function(vectors) > 0).astype(int)
+
+    # --- Persistence ---
+
+    def save(self, path):
+        np.savez(
+            path, affine_matrix=self.affine_matrix, affine_offset=self.affine_offset,
+            weights=self.weights, bias=self.bias, prob_a=self.prob_a, prob_b=self.prob_b,
+            reps=self.reps, alpha=self.alpha, entanglement=self.entanglement
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(**{key: data[key] for key in data.files})
+
+
+def load_compiled_qsvc(data_dir):
+    """CompiledQSVC from `data_dir`, or None if it has not been compiled yet"""
+    path = os.path.join(data_dir, COMPILED_FILE)
+    if not os.path.exists(path):
+        return None
+    return CompiledQSVC.load(path)
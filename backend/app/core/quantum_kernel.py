@@ -0,0 +1,114 @@
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+from app.core.zz_feature_map import feature_map_params, zz_feature_states
+
+# --- qiskit-machine-learning (optional: only needed to plug into QSVC) ---
+try:
+    from qiskit_machine_learning.kernels import BaseKernel
+except ImportError:
+    BaseKernel = None
+
+
+class _KernelBase:
+    """Stand-in for BaseKernel when qiskit-machine-learning is not installed"""
+
+    def __init__(self, *, feature_map=None, enforce_psd=True):
+        self._feature_map = feature_map
+        self._enforce_psd = enforce_psd
+
+    @property
+    def feature_map(self):
+        return self._feature_map
+
+    @property
+    def enforce_psd(self):
+        return self._enforce_psd
+
+    def _make_psd(self, kernel_matrix):
+        w, v = np.linalg.eig(kernel_matrix)
+        return (v @ np.diag(np.maximum(0, w)) @ v.transpose()).real
+
+
+class StatevectorKernel(BaseKernel or _KernelBase):
+    """
+    Analytic fidelity kernel K(x, y) = |<ψ(x)|ψ(y)>|² for ZZFeatureMap.
+
+    Drop-in for FidelityQuantumKernel(ComputeUncompute(Sampler())) as `qsvc.quantum_kernel`:
+    statevectors are computed for a whole batch in NumPy and the Gram block is one
+    complex matrix product, instead of one compute-uncompute circuit per pair.
+    States of recently seen matrices (the fitted training set / support vectors that
+    sklearn passes on every predict) are cached by content.
+    """
+
+    def __init__(self, feature_map=None, num_features=4, reps=2, entanglement="linear", alpha=2.0,
+                 enforce_psd=True, cache_size=8):
+        if feature_map is not None:
+            num_features = feature_map.num_qubits
+            reps, entanglement, alpha = feature_map_params(feature_map)
+        super().__init__(feature_map=feature_map, enforce_psd=enforce_psd)
+        self._num_features = int(num_features)
+        self.reps = int(reps)
+        self.entanglement = entanglement
+        self.alpha = float(alpha)
+        self.cache_size = cache_size
+        self._state_cache = OrderedDict()
+
+    @classmethod
+    def from_kernel(cls, kernel, **kwargs):
+        """Replacement for an existing (circuit-based) quantum kernel with the same feature map"""
+        return cls(feature_map=kernel.feature_map, enforce_psd=kernel.enforce_psd, **kwargs)
+
+    @property
+    def num_features(self):
+        return self._num_features
+
+    def feature_states(self, x_vec):
+        """Statevectors for a batch, memoized by array content"""
+        x_vec = np.ascontiguousarray(x_vec, dtype=np.float64)
+        key = (x_vec.shape, hashlib.blake2b(x_vec.tobytes(), digest_size=16).digest())
+        states = self._state_cache.get(key)
+        if states is not None:
+            self._state_cache.move_to_end(key)
+            return states
+        states = zz_feature_states(x_vec, self.reps, self.alpha, self.entanglement)
+        if self.cache_size:
+            self._state_cache[key] = states
+            if len(self._state_cache) > self.cache_size:
+                self._state_cache.popitem(last=False)
+        return states
+
+    def evaluate(self, x_vec, y_vec=None):
+        x_vec = np.atleast_2d(np.asarray(x_vec, dtype=np.float64))
+        if x_vec.shape[1] != self._num_features:
+            raise ValueError(f"x_vec has {x_vec.shape[1]} features, kernel expects {self._num_features}")
+        x_states = self.feature_states(x_vec)
+
+        if y_vec is None:
+            # Symmetric Gram matrix (training)
+            kernel = np.abs(x_states.conj() @ x_states.T) ** 2
+            np.fill_diagonal(kernel, 1.0)
+            return self._make_psd(kernel) if self.enforce_psd else kernel
+
+        y_vec = np.atleast_2d(np.asarray(y_vec, dtype=np.float64))
+        if y_vec.shape[1] != self._num_features:
+            raise ValueError(f"y_vec has {y_vec.shape[1]} features, kernel expects {self._num_features}")
+        return np.abs(x_states.conj() @ self.feature_states(y_vec).T) ** 2
+
+    def _make_psd(self, kernel_matrix):
+        """Closest PSD matrix, via the symmetric eigensolver (the Gram matrix is real symmetric)"""
+        w, v = np.linalg.eigh(kernel_matrix)
+        return (v * np.maximum(0, w)) @ v.T
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_state_cache"] = OrderedDict()  # never pickle cached states with a model
+        return state
+
+
+def attach_statevector_kernel(qsvc):
+    """Swaps a fitted QSVC's circuit kernel for the analytic one (same feature map), in place"""
+    qsvc.quantum_kernel = StatevectorKernel.from_kernel(qsvc.quantum_kernel)
+    return qsvc
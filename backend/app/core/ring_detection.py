@@ -0,0 +1,275 @@
+import os
+
+import numpy as np
+
+RING_TABLE_FILE = "ring_table.npz"  # written by scripts/detect_mule_rings.py
+
+# Evidence flags (bitmask per account / ring)
+FLAG_CYCLE = 1     # on a directed cycle of length <= max_cycle_length
+FLAG_FAN_IN = 2    # many distinct senders within one time window
+FLAG_FAN_OUT = 4   # many distinct receivers within one time window
+FLAG_NAMES = {FLAG_CYCLE: "cycle", FLAG_FAN_IN: "fan_in", FLAG_FAN_OUT: "fan_out"}
+
+
+def flag_names(flags):
+    return [name for bit, name in FLAG_NAMES.items() if int(flags) & bit]
+
+
+# --- Graph Primitives (int node ids) ---
+
+def connected_components(src, dst, num_nodes):
+    """
+    Union-find over an edge list, vectorized: every round hooks each edge's larger
+    root under the smaller one, then pointer-jumping compresses all paths.
+    Returns the root (smallest node id) of every node's component.
+    """
+    parent = np.arange(num_nodes, dtype=np.int64)
+    src, dst = np.asarray(src, dtype=np.int64), np.asarray(dst, dtype=np.int64)
+    while len(src):
+        root_src, root_dst = parent[src], parent[dst]
+        active = root_src != root_dst
+        src, dst = src[active], dst[active]  # settled edges never need another look
+        if not len(src):
+            break
+        low = np.minimum(root_src[active], root_dst[active])
+        high = np.maximum(root_src[active], root_dst[active])
+        np.minimum.at(parent, high, low)
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+    return parent
+
+
+def _pair_keys(src, dst, num_nodes):
+    return src * np.int64(num_nodes) + dst
+
+
+def _prune_acyclic(src, dst, num_nodes, rounds=3):
+    """Drops edges touching nodes with no in- or no out-edge (they cannot lie on a cycle), repeatedly"""
+    for _ in range(rounds):
+        has_in = np.bincount(dst, minlength=num_nodes) > 0
+        has_out = np.bincount(src, minlength=num_nodes) > 0
+        keep = has_in[src] & has_out[src] & has_in[dst] & has_out[dst]
+        if keep.all():
+            break
+        src, dst = src[keep], dst[keep]
+    return src, dst
+
+
+def find_cycles(src, dst, num_nodes, max_length=4, max_degree=50, max_paths=20_000_000):
+    """
+    Simple directed cycles of length 2..max_length, each reported once (rotated to start
+    at its smallest node). Paths are grown breadth-first as arrays and only extended to
+    nodes larger than their start, so no cycle is enumerated twice.
+    Hubs (total degree > max_degree, e.g. merchants) are skipped: they would explode the
+    search and are covered by the fan-in/out scan instead.
+    Returns a list of (num_cycles, length) node arrays, one per length.
+    """
+    degree = np.bincount(src, minlength=num_nodes) + np.bincount(dst, minlength=num_nodes)
+    keep = (src != dst) & (degree[src] <= max_degree) & (degree[dst] <= max_degree)
+    src, dst = _prune_acyclic(src[keep], dst[keep], num_nodes)
+
+    # Simple graph as sorted pair keys (sort + run dedup; also the has_edge index)
+    keys = np.sort(_pair_keys(src, dst, num_nodes))
+    keys = keys[np.concatenate([[True], keys[1:] != keys[:-1]])] if len(keys) else keys
+    src, dst = keys // num_nodes, keys % num_nodes
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(src, minlength=num_nodes))])
+
+    def has_edge(u, v):
+        if not len(keys):
+            return np.zeros(len(u), dtype=bool)
+        query = _pair_keys(u, v, num_nodes)
+        pos = np.minimum(np.searchsorted(keys, query), len(keys) - 1)
+        return keys[pos] == query
+
+    cycles = []
+    paths = np.column_stack([src, dst])[dst > src]
+    for length in range(2, max_length + 1):
+        cycles.append(paths[has_edge(paths[:, -1], paths[:, 0])])
+        if length == max_length or not len(paths):
+            break
+        # Extend every path by one out-edge of its last node
+        last = paths[:, -1]
+        counts = indptr[last + 1] - indptr[last]
+        rows = np.repeat(np.arange(len(paths)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        nxt = dst[np.repeat(indptr[last], counts) + offsets]
+        valid = nxt > paths[rows, 0]
+        for column in range(1, paths.shape[1]):
+            valid &= nxt != paths[rows, column]
+        paths = np.column_stack([paths[rows[valid]], nxt[valid]])
+        if len(paths) > max_paths:
+            print(f"⚠️ Cycle search truncated at length {length + 1} ({len(paths)} open paths)")
+            paths = paths[:max_paths]
+    return cycles
+
+
+def windowed_fan(owner, counterparty, step, num_nodes, window, threshold):
+    """
+    Accounts with >= threshold distinct counterparties inside one time window.
+    Tumbling windows at offsets 0 and window/2, so a burst straddling a boundary is still caught.
+    Returns a bool mask over the edges that belong to a flagged (owner, window) group.
+    """
+    flagged = np.zeros(len(owner), dtype=bool)
+    # Only owners with >= threshold edges overall can qualify (most accounts transact once or twice)
+    candidate = np.flatnonzero((np.bincount(owner, minlength=num_nodes) >= threshold)[owner])
+    if not len(candidate):
+        return flagged
+    owner, counterparty, step = owner[candidate], counterparty[candidate], step[candidate]
+    n_buckets = int(step.max()) // window + 2
+
+    for offset in sorted({0, window // 2}):
+        # 1. (owner, bucket) group key and (group, counterparty) pair key as single int64s
+        group = owner * n_buckets + (step + offset) // window
+        pairs = np.sort(group * np.int64(num_nodes) + counterparty)
+        pairs = pairs[np.concatenate([[True], pairs[1:] != pairs[:-1]])]
+        # 2. Distinct counterparties = run lengths of the (sorted) group part
+        pair_group = pairs // num_nodes
+        starts = np.flatnonzero(np.concatenate([[True], pair_group[1:] != pair_group[:-1]]))
+        distinct = np.diff(np.append(starts, len(pair_group)))
+        hot = pair_group[starts[distinct >= threshold]]
+        flagged[candidate] |= np.isin(group, hot)
+    return flagged
+
+
+# --- Detection Job ---
+
+def detect_rings(src, dst, amount, step, num_nodes, eligible=None, window=24, fan_threshold=5,
+                 max_cycle_length=4, max_degree=50, min_ring_size=3):
+    """
+    Mule-ring detection over the full transaction graph (int node ids, one row per transaction).
+      1. directed cycles up to max_cycle_length (money returning to its origin)
+      2. fan-in / fan-out bursts inside `window` steps (collection / distribution accounts)
+      3. union-find over the suspicious edges -> rings = connected components
+    `eligible` (bool per node) restricts evidence to e.g. customer accounts (not merchants).
+    Returns (ring of every node or -1, flags of every node, per-ring summary dict).
+    """
+    src, dst = np.asarray(src, dtype=np.int64), np.asarray(dst, dtype=np.int64)
+    amount = np.nan_to_num(np.asarray(amount, dtype=np.float64))
+    step = np.asarray(step, dtype=np.int64)
+    if eligible is not None:
+        keep = eligible[src] & eligible[dst]
+        src, dst, amount, step = src[keep], dst[keep], amount[keep], step[keep]
+
+    flags = np.zeros(num_nodes, dtype=np.uint8)
+    suspicious = np.zeros(len(src), dtype=bool)
+
+    # 1. Cycles: every edge between consecutive cycle nodes is suspicious
+    cycle_keys = []
+    for cycle in find_cycles(src, dst, num_nodes, max_cycle_length, max_degree):
+        if len(cycle):
+            flags[cycle.ravel()] |= FLAG_CYCLE
+            cycle_keys.append(_pair_keys(cycle.ravel(), np.roll(cycle, -1, axis=1).ravel(), num_nodes))
+    if cycle_keys:
+        suspicious |= np.isin(_pair_keys(src, dst, num_nodes), np.concatenate(cycle_keys))
+
+    # 2. Fan-in (collector) / fan-out (distributor) bursts
+    fan_in = windowed_fan(dst, src, step, num_nodes, window, fan_threshold)
+    fan_out = windowed_fan(src, dst, step, num_nodes, window, fan_threshold)
+    flags[dst[fan_in]] |= FLAG_FAN_IN
+    flags[src[fan_out]] |= FLAG_FAN_OUT
+    suspicious |= fan_in | fan_out
+
+    # 3. Rings = components of the suspicious subgraph
+    s_src, s_dst, s_amount = src[suspicious], dst[suspicious], amount[suspicious]
+    root = connected_components(s_src, s_dst, num_nodes)
+    members = np.zeros(num_nodes, dtype=bool)
+    members[s_src] = members[s_dst] = True
+    roots, ring, size = np.unique(root[members], return_inverse=True, return_counts=True)
+    big = size >= min_ring_size
+
+    ring_of = np.full(num_nodes, -1, dtype=np.int64)
+    remap = np.where(big, np.cumsum(big) - 1, -1)
+    ring_of[np.flatnonzero(members)] = remap[ring]
+
+    n_rings = int(big.sum())
+    in_ring = ring_of >= 0
+    ring_flags = np.zeros(n_rings, dtype=np.uint8)
+    np.bitwise_or.at(ring_flags, ring_of[in_ring], flags[in_ring])
+    edge_ring = ring_of[s_src]
+    summary = {
+        "size": size[big],
+        "flags": ring_flags,
+        "transactions": np.bincount(edge_ring[edge_ring >= 0], minlength=n_rings),
+        "amount": np.bincount(edge_ring[edge_ring >= 0], weights=s_amount[edge_ring >= 0], minlength=n_rings)
+    }
+    flags[ring_of < 0] = 0  # evidence outside a ring (e.g. isolated small cycles) is not reported
+    return ring_of, flags, summary
+
+
+# --- Ring Table (engine side) ---
+
+class RingTable:
+    """
+    Detected rings, keyed by account: sorted account ids + ring id / flags per account,
+    plus one summary row per ring. The engine resolves its own transactions once
+    (`rows_for`) so each per-transaction join afterwards is a plain array index.
+    """
+
+    def __init__(self, account_ids, account_ring, account_flags, ring_size, ring_flags,
+                 ring_transactions, ring_amount):
+        self.account_ids = account_ids
+        self.account_ring = account_ring
+        self.account_flags = account_flags
+        self.ring_size = ring_size
+        self.ring_flags = ring_flags
+        self.ring_transactions = ring_transactions
+        self.ring_amount = ring_amount
+
+    @classmethod
+    def from_detection(cls, accounts, ring_of, flags, summary):
+        """`accounts` = id of every node (the interning table used for detection)"""
+        members = np.flatnonzero(ring_of >= 0)
+        ids = np.asarray(accounts, dtype=np.bytes_)[members] if len(members) else np.empty(0, dtype="S1")
+        order = np.argsort(ids, kind="stable")
+        return cls(
+            ids[order], ring_of[members][order].astype(np.int32), flags[members][order],
+            summary["size"], summary["flags"], summary["transactions"], summary["amount"]
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            table = cls(**{key: data[key] for key in data.files})
+        print(f"✅ Ring table: {len(table.ring_size)} rings, {len(table.account_ids)} accounts")
+        return table
+
+    def save(self, path):
+        np.savez(
+            path, account_ids=self.account_ids, account_ring=self.account_ring,
+            account_flags=self.account_flags, ring_size=self.ring_size, ring_flags=self.ring_flags,
+            ring_transactions=self.ring_transactions, ring_amount=self.ring_amount
+        )
+
+    def rings_for(self, account_ids):
+        """Ring id per account (-1 when the account is in no ring)"""
+        query = np.atleast_1d(np.asarray(account_ids, dtype=np.bytes_))
+        if len(self.account_ids) == 0:
+            return np.full(len(query), -1, dtype=np.int64)
+        pos = np.minimum(np.searchsorted(self.account_ids, query), len(self.account_ids) - 1)
+        return np.where(self.account_ids[pos] == query, self.account_ring[pos], -1).astype(np.int64)
+
+    def rows_for(self, source_ids, destination_ids):
+        """Per-transaction ring id: the source's ring, else the destination's (-1 if neither)"""
+        source = self.rings_for(source_ids)
+        return np.where(source >= 0, source, self.rings_for(destination_ids))
+
+    def ring(self, ring_id):
+        """Summary of one ring"""
+        return {
+            "ring_id": int(ring_id),
+            "size": int(self.ring_size[ring_id]),
+            "evidence": flag_names(self.ring_flags[ring_id]),
+            "transactions": int(self.ring_transactions[ring_id]),
+            "amount": round(float(self.ring_amount[ring_id]), 2)
+        }
+
+
+def load_ring_table(data_path):
+    """RingTable from `data_path`, or None if detection has not been run"""
+    path = os.path.join(data_path, RING_TABLE_FILE)
+    if not os.path.exists(path):
+        return None
+    return RingTable.load(path)
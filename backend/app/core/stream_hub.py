@@ -0,0 +1,136 @@
+import asyncio
+
+from app.core.payload_cache import StreamPayloadCache
+
+
+def log_stream_transaction(idx, full_analysis):
+    """RIGOROUS TERMINAL LOGGING (every 5th transaction and every CRITICAL one)"""
+    tx_data = full_analysis["transaction"]
+    vqe_result = full_analysis["vqe"]
+    if idx % 5 != 0 and vqe_result["status"] != "CRITICAL":
+        return
+
+    print("\n────────────────────────────────────────────────────────")
+    print(f"📡 PROCESSING TX: {tx_data['id']} | TYPE: {tx_data['type']}")
+    print(f"   💵 AMOUNT: {tx_data['amount']} | ACCOUNT: {tx_data['account']}")
+    print(f"   🔮 JANUS (H-GSAD): {vqe_result['status']} (Energy: {vqe_result['energy']:.2f} eV)")
+
+    # Show actual topology pattern from the engine
+    topology = full_analysis["topology"]
+    if full_analysis["benchmark"]['blindspot_detected']:
+         print(f"   ⚠️  MULE RING DETECTED: {topology['pattern']} ({topology['neighbor_count']} nodes)")
+
+    print("────────────────────────────────────────────────────────\n")
+
+
+class StreamSubscriber:
+    """One connected dashboard: a bounded queue of already-serialized messages"""
+
+    def __init__(self, queue_size):
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0            # messages coalesced away (total)
+        self.consecutive_drops = 0  # resets whenever the client keeps up
+        self.closed = False
+
+    async def get(self):
+        """Next message, or None once the hub has disconnected this subscriber"""
+        message = await self.queue.get()
+        if message is not None:
+            self.consecutive_drops = 0
+        return message
+
+
+class RiskStreamHub:
+    """
+    Single producer for /ws/risk-stream.
+    Each transaction is scored and serialized ONCE, then fanned out to every
+    subscriber's bounded queue. A full queue drops its oldest message (coalescing
+    to the latest state); a client that keeps falling behind is disconnected
+    so it can never stall the others.
+    """
+
+    def __init__(self, engine, queue_size=8, max_consecutive_drops=32):
+        self.engine = engine
+        self.payload_cache = StreamPayloadCache(engine)
+        self.queue_size = queue_size
+        self.max_consecutive_drops = max_consecutive_drops
+        self.subscribers = set()
+        self.producer = None
+        self.last_message = None
+
+        # GLOBAL INDEX for Simulation Persistence (Prevents "Groundhog Day" reset on refresh)
+        self.index = 0
+        self.produced = 0
+
+    def subscribe(self):
+        subscriber = StreamSubscriber(self.queue_size)
+        if self.last_message is not None:
+            subscriber.queue.put_nowait(self.last_message)  # New dashboards render immediately
+        self.subscribers.add(subscriber)
+        if self.producer is None or self.producer.done():
+            self.producer = asyncio.create_task(self._produce())
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        subscriber.closed = True
+        self.subscribers.discard(subscriber)
+
+    def publish(self, message):
+        """Fans one serialized message out to every subscriber without ever awaiting"""
+        for subscriber in list(self.subscribers):
+            if subscriber.queue.full():
+                # Coalesce: the stale message is dropped in favour of the newest one
+                subscriber.queue.get_nowait()
+                subscriber.dropped += 1
+                subscriber.consecutive_drops += 1
+                if subscriber.consecutive_drops > self.max_consecutive_drops:
+                    print(f"🐢 SLOW CONSUMER DROPPED after {subscriber.dropped} coalesced messages")
+                    self.unsubscribe(subscriber)
+                    subscriber.queue.put_nowait(None)
+                    continue
+            subscriber.queue.put_nowait(message)
+        self.last_message = message
+
+    async def _produce(self):
+        """Scores the next transaction once per tick while anyone is listening"""
+        while self.subscribers:
+            idx = self.index
+
+            # 1. Score + encode ONCE for all subscribers (cached fragments, off the event loop)
+            try:
+                message, full_analysis = await asyncio.to_thread(self.payload_cache.render, idx)
+            except Exception as e:
+                print(f"❌ STREAM PRODUCER ERROR at index {idx}: {e}")
+                self.index += 1
+                await asyncio.sleep(1.0)
+                continue
+            log_stream_transaction(idx, full_analysis)
+
+            # 2. Fan out (decoded once: websocket text frames)
+            self.publish(message.decode())
+            self.produced += 1
+
+            # 3. PACING (Optimized for "Lively" feel)
+            # Was 8s/3s -> Now 4s (Critical) / 2s (Normal)
+            delay = 4.0 if full_analysis["vqe"]["status"] == "CRITICAL" else 2.0
+            await asyncio.sleep(delay)
+
+            self.index += 1
+
+    async def stop(self):
+        if self.producer is not None:
+            self.producer.cancel()
+            try:
+                await self.producer
+            except asyncio.CancelledError:
+                pass
+            self.producer = None
+
+    def stats(self):
+        return {
+            "subscribers": len(self.subscribers),
+            "index": self.index,
+            "produced": self.produced,
+            "dropped": sum(s.dropped for s in self.subscribers),
+            "payload_cache": self.payload_cache.stats()
+        }
@@ -0,0 +1,151 @@
+import asyncio
+import time
+
+import numpy as np
+
+PACING_MODES = ("realtime", "fixed", "replay", "max")
+
+
+class PacingConfig:
+    """
+    Per-connection pacing for /ws/risk-stream (query parameters):
+      pace=realtime              shared live feed (default, 2s / 4s per transaction)
+      pace=fixed&rate=50         private cursor at a fixed rate (tx/s)
+      pace=replay&speed=3600     original `step` timestamps (1 step = 1 hour), sped up
+      pace=max&batch=512         unthrottled, micro-batched frames {"batch": [...]}
+    Optional: start=<index>, limit=<transactions> (private modes only)
+    """
+
+    def __init__(self, pace="realtime", rate=10.0, speed=3600.0, batch=256,
+                 start=0, limit=None, max_gap=10.0):
+        if pace not in PACING_MODES:
+            raise ValueError(f"Unknown pace '{pace}'. Use one of {', '.join(PACING_MODES)}")
+        if rate <= 0 or speed <= 0 or batch < 1:
+            raise ValueError("rate, speed and batch must be positive")
+        self.pace = pace
+        self.rate = float(rate)
+        self.speed = float(speed)
+        self.max_batch = int(batch)
+        self.start = int(start)
+        self.limit = int(limit) if limit is not None else None
+        self.max_gap = float(max_gap)
+
+    @classmethod
+    def from_query(cls, params):
+        def number(name, cast, default):
+            return cast(params[name]) if name in params else default
+
+        return cls(
+            pace=params.get("pace", "realtime"),
+            rate=number("rate", float, 10.0),
+            speed=number("speed", float, 3600.0),
+            batch=number("batch", int, 256),
+            start=number("start", int, 0),
+            limit=number("limit", int, None),
+            max_gap=number("max_gap", float, 10.0),
+        )
+
+
+class PrivateStream:
+    """
+    A dedicated cursor over the test set for one connection (fixed / replay / max).
+    Shares the engine and the encoded payload cache with the live hub, but never
+    advances the live feed's position.
+    """
+
+    SECONDS_PER_STEP = 3600.0  # PaySim: one `step` is one hour
+
+    def __init__(self, websocket, engine, payload_cache, config):
+        self.websocket = websocket
+        self.engine = engine
+        self.payload_cache = payload_cache
+        self.config = config
+        self.sent = 0
+        self.frames = 0
+
+        n = len(engine.vectors)
+        if config.pace == "replay":
+            # Chronological order by the original PaySim step (stable for ties)
+            steps = engine.details["step"].to_numpy()
+            self.order = np.argsort(steps, kind="stable")
+            self.steps = steps[self.order]
+        else:
+            self.order = np.arange(n)
+            self.steps = None
+        self.position = config.start % n
+
+    def _remaining(self):
+        if self.config.limit is None:
+            return None
+        return self.config.limit - self.sent
+
+    def _next_indices(self, count):
+        n = len(self.order)
+        positions = (self.position + np.arange(count)) % n
+        self.position = (self.position + count) % n
+        return positions
+
+    async def _send_one(self):
+        position = self._next_indices(1)[0]
+        message, _ = await asyncio.to_thread(self.payload_cache.render, int(self.order[position]))
+        await self.websocket.send_text(message.decode())
+        self.sent += 1
+        self.frames += 1
+        return position
+
+    async def _run_fixed(self):
+        interval = 1.0 / self.config.rate
+        next_tick = time.perf_counter()
+        while self._remaining() is None or self._remaining() > 0:
+            await self._send_one()
+            next_tick += interval
+            await asyncio.sleep(max(0.0, next_tick - time.perf_counter()))
+
+    async def _run_replay(self):
+        while self._remaining() is None or self._remaining() > 0:
+            position = await self._send_one()
+            next_position = (position + 1) % len(self.order)
+            gap_steps = max(0, int(self.steps[next_position]) - int(self.steps[position]))
+            delay = gap_steps * self.SECONDS_PER_STEP / self.config.speed
+            await asyncio.sleep(min(delay, self.config.max_gap))
+
+    def _render_batch(self, positions):
+        messages = [self.payload_cache.render(int(self.order[p]))[0] for p in positions]
+        return b'{"batch":[' + b",".join(messages) + b"]}"
+
+    async def _run_max(self):
+        """
+        Unthrottled with backpressure-aware micro-batching: the frame size doubles
+        while the socket drains quickly and halves when `send` starts to block.
+        """
+        batch = 1
+        fast_send, slow_send = 0.005, 0.050
+        while self._remaining() is None or self._remaining() > 0:
+            count = batch if self._remaining() is None else min(batch, self._remaining())
+            positions = self._next_indices(count)
+            frame = await asyncio.to_thread(self._render_batch, positions)
+
+            started = time.perf_counter()
+            await self.websocket.send_text(frame.decode())
+            send_time = time.perf_counter() - started
+
+            self.sent += count
+            self.frames += 1
+            if send_time < fast_send:
+                batch = min(batch * 2, self.config.max_batch)
+            elif send_time > slow_send:
+                batch = max(batch // 2, 1)
+
+    async def run(self):
+        started = time.perf_counter()
+        try:
+            if self.config.pace == "fixed":
+                await self._run_fixed()
+            elif self.config.pace == "replay":
+                await self._run_replay()
+            else:
+                await self._run_max()
+        finally:
+            elapsed = max(time.perf_counter() - started, 1e-9)
+            print(f"🏁 {self.config.pace.upper()} STREAM CLOSED: {self.sent} tx in {self.frames} frames, "
+                  f"{elapsed:.2f}s ({self.sent / elapsed:,.0f} tx/s)")
@@ -0,0 +1,174 @@
+import os
+
+import numpy as np
+
+GRAPH_FILE = "transaction_graph.npz"  # written by scripts/build_transaction_graph.py
+
+
+def csr_indptr(keys, num_nodes):
+    """CSR row pointer for edges sorted by `keys`"""
+    return np.concatenate([[0], np.cumsum(np.bincount(keys, minlength=num_nodes))]).astype(np.int64)
+
+
+def csr_gather(indptr, nodes):
+    """(owner, position) for every CSR entry of `nodes`"""
+    nodes = nodes[(nodes >= 0) & (nodes < len(indptr) - 1)]
+    starts, ends = indptr[nodes], indptr[nodes + 1]
+    lengths = ends - starts
+    owner = np.repeat(nodes, lengths)
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return owner, np.repeat(starts, lengths) + offsets
+
+
+class TransactionGraph:
+    """
+    Account-level transaction graph for investigations (who paid whom, how much).
+      - account ids interned to int nodes (sorted id array + searchsorted)
+      - out/in adjacency as CSR arrays, edges sorted by (node, counterparty)
+      - one edge per transaction (parallel edges kept, amounts summed on query)
+    Degree, k-hop neighbourhood and edge-amount queries are vectorized over node arrays
+    and only touch the queried rows, so they stay fast on multi-million edge graphs.
+    """
+
+    partial = False  # True when built from a subset of the transactions (degrees undercount)
+
+    def __init__(self, account_ids, out_ptr, out_dst, out_amount, in_ptr, in_src, in_amount):
+        self.account_ids = account_ids
+        self.out_ptr, self.out_dst, self.out_amount = out_ptr, out_dst, out_amount
+        self.in_ptr, self.in_src, self.in_amount = in_ptr, in_src, in_amount
+        self._pair_keys = None  # src * N + dst per out-edge, built on first edge query
+        self._pair_cumsum = None
+
+    @classmethod
+    def from_edges(cls, source, destination, amount):
+        """Builds the graph from parallel arrays of account ids / amounts (one row per transaction)"""
+        source = np.asarray(source, dtype=np.bytes_)
+        destination = np.asarray(destination, dtype=np.bytes_)
+        amount = np.nan_to_num(np.asarray(amount, dtype=np.float64))
+
+        # 1. Intern account ids (sorted, so lookups are a binary search)
+        account_ids, codes = np.unique(np.concatenate([source, destination]), return_inverse=True)
+        n_edges, n_nodes = len(source), len(account_ids)
+        src, dst = codes[:n_edges].astype(np.int64), codes[n_edges:].astype(np.int64)
+
+        # 2. CSR in both directions, counterparties sorted within each row
+        out_order = np.lexsort((dst, src))
+        in_order = np.lexsort((src, dst))
+        return cls(
+            account_ids,
+            csr_indptr(src, n_nodes), dst[out_order], amount[out_order],
+            csr_indptr(dst, n_nodes), src[in_order], amount[in_order]
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            graph = cls(**{key: data[key] for key in data.files})
+        print(f"✅ Transaction graph: {graph.num_nodes} accounts, {graph.num_edges} edges")
+        return graph
+
+    def save(self, path):
+        np.savez(
+            path, account_ids=self.account_ids,
+            out_ptr=self.out_ptr, out_dst=self.out_dst, out_amount=self.out_amount,
+            in_ptr=self.in_ptr, in_src=self.in_src, in_amount=self.in_amount
+        )
+
+    @property
+    def num_nodes(self):
+        return len(self.account_ids)
+
+    @property
+    def num_edges(self):
+        return len(self.out_dst)
+
+    # --- Interning ---
+
+    def nodes_for(self, account_ids):
+        """Node ids for many account ids at once (-1 where unknown)"""
+        query = np.atleast_1d(np.asarray(account_ids, dtype=np.bytes_))
+        if self.num_nodes == 0:
+            return np.full(len(query), -1, dtype=np.int64)
+        pos = np.minimum(np.searchsorted(self.account_ids, query), self.num_nodes - 1)
+        return np.where(self.account_ids[pos] == query, pos, -1).astype(np.int64)
+
+    def accounts_for(self, nodes):
+        return [account.decode() for account in self.account_ids[np.asarray(nodes, dtype=np.int64)]]
+
+    # --- Queries ---
+
+    def out_degree(self, nodes):
+        """Outgoing transactions per node (0 for unknown nodes)"""
+        return self._degree(self.out_ptr, nodes)
+
+    def in_degree(self, nodes):
+        """Incoming transactions per node (0 for unknown nodes)"""
+        return self._degree(self.in_ptr, nodes)
+
+    @staticmethod
+    def _degree(indptr, nodes):
+        nodes = np.asarray(nodes, dtype=np.int64)
+        known = nodes >= 0
+        degree = np.zeros(len(nodes), dtype=np.int64)
+        degree[known] = indptr[nodes[known] + 1] - indptr[nodes[known]]
+        return degree
+
+    def adjacent(self, nodes, direction):
+        """(owner, counterparty, amount) for every edge of `nodes` in `direction` ("out" / "in" / "both")"""
+        if direction not in ("out", "in", "both"):
+            raise ValueError(f"Unknown direction '{direction}' (use out, in or both)")
+        parts = []
+        if direction in ("out", "both"):
+            owner, pos = csr_gather(self.out_ptr, nodes)
+            parts.append((owner, self.out_dst[pos], self.out_amount[pos]))
+        if direction in ("in", "both"):
+            owner, pos = csr_gather(self.in_ptr, nodes)
+            parts.append((owner, self.in_src[pos], self.in_amount[pos]))
+        return tuple(np.concatenate(column) for column in zip(*parts))
+
+    def neighbors(self, nodes, hops=1, direction="both"):
+        """Sorted nodes within `hops` steps of `nodes` (the seeds themselves excluded)"""
+        seeds = np.unique(np.asarray(nodes, dtype=np.int64))
+        seeds = seeds[seeds >= 0]
+        reached, frontier = seeds, seeds
+        for _ in range(hops):
+            _, counterparty, _ = self.adjacent(frontier, direction)
+            frontier = np.setdiff1d(counterparty, reached)
+            if len(frontier) == 0:
+                break
+            reached = np.union1d(reached, frontier)
+        return np.setdiff1d(reached, seeds)
+
+    def edge_amounts(self, src_nodes, dst_nodes):
+        """Total amount and transaction count from src to dst, per pair (0 where no edge)"""
+        if self._pair_keys is None:
+            owner = np.repeat(np.arange(self.num_nodes, dtype=np.int64), np.diff(self.out_ptr))
+            self._pair_keys = owner * self.num_nodes + self.out_dst
+            self._pair_cumsum = np.concatenate([[0.0], np.cumsum(self.out_amount)])
+        src = np.asarray(src_nodes, dtype=np.int64)
+        dst = np.asarray(dst_nodes, dtype=np.int64)
+        keys = np.where((src >= 0) & (dst >= 0), src * self.num_nodes + dst, -1)
+        lo = np.searchsorted(self._pair_keys, keys, side="left")
+        hi = np.searchsorted(self._pair_keys, keys, side="right")
+        return self._pair_cumsum[hi] - self._pair_cumsum[lo], hi - lo
+
+    def subgraph(self, nodes):
+        """Edges with both endpoints in `nodes`, parallel transactions merged: (src, dst, amount, count)"""
+        nodes = np.unique(np.asarray(nodes, dtype=np.int64))
+        src, dst, amount = self.adjacent(nodes, "out")
+        inside = np.isin(dst, nodes)
+        src, dst, amount = src[inside], dst[inside], amount[inside]
+        if len(src) == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0), empty
+        # Edges arrive grouped by (src, dst) already (CSR order), so merging is a run-length reduce
+        starts = np.flatnonzero(np.concatenate([[True], (src[1:] != src[:-1]) | (dst[1:] != dst[:-1])]))
+        return src[starts], dst[starts], np.add.reduceat(amount, starts), np.diff(np.append(starts, len(src)))
+
+
+def load_transaction_graph(data_path):
+    """TransactionGraph from `data_path`, or None if it has not been built"""
+    path = os.path.join(data_path, GRAPH_FILE)
+    if not os.path.exists(path):
+        return None
+    return TransactionGraph.load(path)
@@ -0,0 +1,157 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+# Explicit PaySim column types (anything else in the CSV is left to Arrow's inference)
+COLUMN_TYPES = {
+    "step": "int32",
+    "amount": "float32",
+    "oldbalanceOrg": "float32",
+    "newbalanceOrig": "float32",
+    "oldbalanceDest": "float32",
+    "newbalanceDest": "float32",
+    "isFraud": "int8",
+    "isFlaggedFraud": "int8",
+}
+# Interned columns: one Arrow dictionary per column (int32 code per row + each distinct string once)
+INTERNED_COLUMNS = ("type", "nameOrig", "nameDest")
+
+SNAPSHOT_SUFFIX = ".snapshot.arrow"
+SNAPSHOT_VERSION = "1"
+SIGNATURE_KEY = b"janus_source"
+
+
+def snapshot_path(csv_path, snapshot_dir):
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    return os.path.join(snapshot_dir, stem + SNAPSHOT_SUFFIX)
+
+
+def source_signature(csv_path, nrows=None):
+    """Identifies the CSV a snapshot was built from (size + mtime + row limit + layout version)"""
+    stat = os.stat(csv_path)
+    return f"{SNAPSHOT_VERSION}:{stat.st_size}:{stat.st_mtime_ns}:{nrows if nrows is not None else 'all'}"
+
+
+def read_transactions_csv(csv_path, nrows=None, block_size=16 << 20):
+    """
+    Streams the CSV through Arrow's parser in `block_size` chunks with explicit types
+    (float32 amounts/balances, small ints for step/flags), then interns the account and
+    type columns with one dictionary per column. Returns a single-chunk Arrow table.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv
+
+    column_types = {name: pa.type_for_alias(alias) for name, alias in COLUMN_TYPES.items()}
+    reader = csv.open_csv(
+        csv_path,
+        read_options=csv.ReadOptions(block_size=block_size),
+        convert_options=csv.ConvertOptions(column_types=column_types)
+    )
+    batches, rows = [], 0
+    for batch in reader:
+        if nrows is not None and rows + batch.num_rows > nrows:
+            batch = batch.slice(0, nrows - rows)
+        batches.append(batch)
+        rows += batch.num_rows
+        if nrows is not None and rows >= nrows:
+            break
+    table = pa.Table.from_batches(batches, schema=reader.schema).combine_chunks()
+    del batches
+
+    for name in INTERNED_COLUMNS:
+        if name in table.column_names and pa.types.is_string(table.schema.field(name).type):
+            index = table.schema.get_field_index(name)
+            table = table.set_column(index, name, pc.dictionary_encode(table.column(name)).combine_chunks())
+    return table
+
+
+def write_snapshot(table, path, signature):
+    """
+    Arrow IPC file tagged with the source signature, written as one uncompressed record
+    batch so loads memory-map it without copying (tmp file + atomic rename).
+    """
+    from pyarrow import feather
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    metadata = dict(table.schema.metadata or {})
+    metadata[SIGNATURE_KEY] = signature.encode()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    feather.write_feather(
+        table.replace_schema_metadata(metadata), tmp_path,
+        compression="uncompressed", chunksize=max(table.num_rows, 1)
+    )
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path, signature):
+    """Snapshot table (memory-mapped), or None when missing, unreadable or built from another CSV"""
+    from pyarrow import feather
+
+    if not os.path.exists(path):
+        return None
+    try:
+        table = feather.read_table(path, memory_map=True)
+    except Exception as e:
+        print(f"⚠️ Snapshot {os.path.basename(path)} unreadable ({e}), rebuilding")
+        return None
+    if (table.schema.metadata or {}).get(SIGNATURE_KEY) != signature.encode():
+        print(f"⚠️ Snapshot {os.path.basename(path)} is stale, rebuilding")
+        return None
+    return table
+
+
+def to_frame(table):
+    """Arrow table -> DataFrame: NumPy numeric columns, interned columns kept as Arrow dictionaries"""
+    import pyarrow as pa
+
+    return table.to_pandas(
+        split_blocks=True,
+        types_mapper=lambda t: pd.ArrowDtype(t) if pa.types.is_dictionary(t) else None
+    )
+
+
+def load_transactions(csv_path, snapshot_dir=None, nrows=None):
+    """
+    Transaction CSV as a compact DataFrame (interned accounts, float32 amounts).
+    With `snapshot_dir`, the first load writes an Arrow snapshot and later loads
+    memory-map it instead of re-parsing the CSV (rebuilt whenever the CSV changes).
+    """
+    started = time.perf_counter()
+    path = snapshot_path(csv_path, snapshot_dir) if snapshot_dir else None
+    signature = source_signature(csv_path, nrows)
+
+    table = read_snapshot(path, signature) if path else None
+    source = "snapshot"
+    if table is None:
+        table = read_transactions_csv(csv_path, nrows=nrows)
+        source = "CSV"
+        if path:
+            try:
+                write_snapshot(table, path, signature)
+            except OSError as e:
+                print(f"⚠️ Could not write snapshot {path}: {e}")
+
+    df = to_frame(table)
+    print(f"✅ {os.path.basename(csv_path)}: {len(df)} rows from {source} "
+          f"({table.nbytes / 1e6:.0f}MB, {time.perf_counter() - started:.1f}s)")
+    return df
+
+
+def interned(column):
+    """
+    (codes, names) for an account/type column: int codes per row and an Arrow string array
+    of distinct values, so names.take(codes[rows]) recovers the strings. Works for Arrow
+    dictionary, Categorical and plain string columns (the last one is factorized).
+    """
+    import pyarrow as pa
+
+    if isinstance(column.dtype, pd.ArrowDtype) and pa.types.is_dictionary(column.dtype.pyarrow_dtype):
+        array = pa.array(column.array)
+        return array.indices.to_numpy(zero_copy_only=False), array.dictionary
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.cat.codes.to_numpy(), pa.array(np.asarray(column.cat.categories, dtype=object), type=pa.string())
+    codes, names = pd.factorize(column.astype(str))
+    return codes.astype(np.int32), pa.array(np.asarray(names, dtype=object), type=pa.string())
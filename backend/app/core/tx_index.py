@@ -0,0 +1,182 @@
+from bisect import bisect_right
+
+import numpy as np
+import pandas as pd
+
+TX_ID_OFFSET = 10000  # UI ids are TX-{10000 + row}
+RECORD_FIELDS = ("id", "amount", "source", "destination", "is_fraud", "status")
+
+
+def tx_id_for(row):
+    return f"TX-{TX_ID_OFFSET + int(row)}"
+
+
+class TransactionIndex:
+    """
+    O(1) lookup layer over the transaction table, built once at engine load.
+      tx_id   -> row
+      account -> rows (as source OR destination), CSR layout
+      account -> blocked flag (+ per-row blocked mask, updated incrementally)
+    Hot columns are kept as plain NumPy arrays so list endpoints never touch `iloc`.
+    Every status change bumps `version`; the change log answers "rows changed since v".
+    """
+
+    def __init__(self, details, labels):
+        n = len(details)
+        self.size = n
+        self.tx_to_row = {tx_id_for(i): i for i in range(n)}
+
+        # 1. Hot Columns
+        self.amount = pd.to_numeric(details["amount"], errors="coerce").fillna(0).to_numpy(dtype=np.float64)
+        self.source = details["nameOrig"].astype(str).to_numpy()
+        self.destination = details["nameDest"].astype(str).to_numpy()
+        self.is_fraud = np.asarray(labels).astype(int) == 1
+
+        # 2. Interned Accounts (sources and destinations share one code space)
+        codes, self.accounts = pd.factorize(np.concatenate([self.source, self.destination]))
+        self.account_to_code = {acc: code for code, acc in enumerate(self.accounts)}
+        self.source_code = codes[:n]
+
+        # 3. account -> rows (CSR): rows_for_account is a slice, O(result size)
+        rows = np.concatenate([np.arange(n), np.arange(n)])
+        order = np.lexsort((rows, codes))
+        self._account_rows = rows[order]
+        self._account_indptr = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=len(self.accounts)))])
+
+        # 4. Block State
+        self.blocked_accounts = set()                       # includes accounts outside the table
+        self.account_blocked = np.zeros(len(self.accounts), dtype=bool)
+        self.tx_blocked = np.zeros(n, dtype=bool)           # specific trigger transactions
+        self.row_blocked = np.zeros(n, dtype=bool)          # source frozen OR tx blocked
+        self.listeners = []                                 # callback(newly_blocked_rows)
+
+        # 5. Versioning (append-only change log: version -> rows whose status changed)
+        self.version = 0
+        self._log_versions = []
+        self._log_rows = []
+
+    # --- Lookups ---
+
+    def row_for(self, tx_id):
+        """TX-xxxxx -> row, or None if unknown"""
+        return self.tx_to_row.get(tx_id)
+
+    def rows_for_account(self, account):
+        code = self.account_to_code.get(account)
+        if code is None:
+            return np.empty(0, dtype=np.int64)
+        rows = self._account_rows[self._account_indptr[code]:self._account_indptr[code + 1]]
+        return np.unique(rows)  # an account can be both sides of one transaction
+
+    def is_account_blocked(self, account):
+        return account in self.blocked_accounts
+
+    def record(self, row):
+        """Plain-dict view of one row (the /api/transactions record shape)"""
+        status = "Posted"
+        if self.is_fraud[row]:
+            status = "Flagged"
+        if self.row_blocked[row]:
+            status = "BLOCKED"
+        return {
+            "id": tx_id_for(row),
+            "amount": float(self.amount[row]),
+            "source": self.source[row],
+            "destination": self.destination[row],
+            "is_fraud": bool(self.is_fraud[row]),
+            "status": status
+        }
+
+    def statuses(self, rows):
+        """Vectorized `record(row)["status"]`"""
+        return np.where(self.row_blocked[rows], "BLOCKED", np.where(self.is_fraud[rows], "Flagged", "Posted"))
+
+    def records(self, rows, fields=None):
+        """
+        Plain-dict views of many rows, built column by column.
+        `fields` projects the record (default: all RECORD_FIELDS, in that order).
+        """
+        fields = RECORD_FIELDS if fields is None else fields
+        unknown = [f for f in fields if f not in RECORD_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown field(s) {', '.join(unknown)}. Use {', '.join(RECORD_FIELDS)}")
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = {
+            "id": lambda: [f"TX-{i}" for i in (rows + TX_ID_OFFSET).tolist()],
+            "amount": lambda: self.amount[rows].tolist(),
+            "source": lambda: self.source[rows].tolist(),
+            "destination": lambda: self.destination[rows].tolist(),
+            "is_fraud": lambda: self.is_fraud[rows].tolist(),
+            "status": lambda: self.statuses(rows).tolist()
+        }
+        values = [columns[f]() for f in fields]
+        return [dict(zip(fields, row)) for row in zip(*values)]
+
+    # --- Keyset Pages / Incremental Sync ---
+
+    def page(self, after=None, limit=100, since=None):
+        """
+        One keyset page in row order: rows strictly after the `after` tx id.
+        With `since`, only rows whose status changed after that version.
+        Returns (rows, next_cursor) where next_cursor is the last tx id or None.
+        """
+        start = 0
+        if after is not None:
+            row = self.row_for(after)
+            if row is None:
+                raise ValueError(f"Unknown cursor {after}")
+            start = row + 1
+        limit = max(int(limit), 0)
+
+        if since is None:
+            rows = np.arange(start, min(start + limit, self.size), dtype=np.int64)
+            has_more = start + limit < self.size
+        else:
+            changed = self.changed_since(since)
+            changed = changed[np.searchsorted(changed, start):]
+            rows, has_more = changed[:limit], len(changed) > limit
+
+        next_cursor = tx_id_for(rows[-1]) if has_more and len(rows) else None
+        return rows, next_cursor
+
+    def changed_since(self, version):
+        """Sorted unique rows whose status changed after `version` (O(changes))"""
+        start = bisect_right(self._log_versions, int(version))
+        if start >= len(self._log_rows):
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(self._log_rows[start:]))
+
+    # --- Incremental Block Updates ---
+
+    def block_account(self, account):
+        """Freezes an account; only that account's rows are touched. Returns True if newly blocked."""
+        if account in self.blocked_accounts:
+            return False
+        self.blocked_accounts.add(account)
+        code = self.account_to_code.get(account)
+        if code is not None:
+            self.account_blocked[code] = True
+            rows = self.rows_for_account(account)
+            rows = rows[(self.source_code[rows] == code) & ~self.row_blocked[rows]]
+            self.row_blocked[rows] = True
+            self._notify(rows)
+        return True
+
+    def block_transaction(self, row):
+        self.tx_blocked[row] = True
+        if not self.row_blocked[row]:
+            self.row_blocked[row] = True
+            self._notify(np.array([row], dtype=np.int64))
+
+    def _notify(self, rows):
+        if len(rows) == 0:
+            return
+        self.version += 1
+        self._log_versions.append(self.version)
+        self._log_rows.append(np.asarray(rows, dtype=np.int64))
+        for listener in self.listeners:
+            listener(rows)
+
+    def load_blocked(self, accounts):
+        for account in accounts:
+            self.block_account(account)
@@ -0,0 +1,135 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from app.core.vqe_runner import VQERunner
+
+# --- Worker Process State (one copy per pool process, built once by the initializer) ---
+_WORKER = {}
+
+
+def _init_worker(maxiter):
+    """Pre-warms the Qiskit stack inside each worker process (cached, transpiled template)"""
+    _WORKER["runner"] = VQERunner(maxiter=maxiter)
+
+
+def _warmup_job():
+    """Forces the pool to spawn a worker and run one short optimization (Aer JIT / imports)"""
+    _WORKER["runner"].minimize([[0.1, 0.1, 0.5]], maxiter=1, measure=False)
+    return os.getpid()
+
+
+def _vqe_job(coeff_rows, maxiter):
+    """Runs SPSA/VQE for a batch of Hamiltonians on the worker's cached runner"""
+    started = time.perf_counter()
+    results = _WORKER["runner"].minimize(coeff_rows, maxiter=maxiter)
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    for result in results:
+        result["worker_pid"] = os.getpid()
+        result["elapsed_ms"] = elapsed_ms
+    return results
+
+
+class VQEQueueFull(Exception):
+    """Raised when the bounded VQE job queue cannot accept more work"""
+
+
+class VQEExecutor:
+    """
+    Persistent process pool for REAL SPSA/VQE runs.
+    Each worker builds its Estimator/Sampler/ansatz once; jobs are awaitable,
+    bounded (max_pending) and time-limited (job_timeout) so the event loop never blocks.
+    """
+
+    def __init__(self, workers=None, max_pending=32, job_timeout=60.0, maxiter=50):
+        self.workers = workers or max(1, min(4, (os.cpu_count() or 2) - 1))
+        self.max_pending = max_pending
+        self.job_timeout = job_timeout
+        self.maxiter = maxiter
+        self.pool = None
+        self.pending = 0
+        self.completed = 0
+        self.timeouts = 0
+        self.rejected = 0
+
+    def start(self):
+        """Spawns the workers and pre-warms each of them (non-blocking)"""
+        if self.pool is not None:
+            return
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.maxiter,)
+        )
+        for _ in range(self.workers):
+            self.pool.submit(_warmup_job)
+        print(f"⚛️  VQE EXECUTOR: {self.workers} worker(s) warming up")
+
+    def shutdown(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+
+    def _release(self, _future):
+        self.pending -= 1
+
+    async def run(self, coeffs, maxiter=None, timeout=None):
+        """
+        Awaitable VQE for one set of (ZI, IZ, ZZ) coefficients.
+        Raises VQEQueueFull when saturated and asyncio.TimeoutError on timeout.
+        """
+        results = await self.run_batch([coeffs], maxiter=maxiter, timeout=timeout)
+        return results[0]
+
+    async def run_batch(self, coeff_rows, maxiter=None, timeout=None):
+        """Awaitable VQE for several Hamiltonians as ONE job (one batched Estimator call per iteration)"""
+        if self.pool is None:
+            self.start()
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise VQEQueueFull(f"{self.pending} VQE jobs already queued")
+
+        # The slot is released when the WORKER finishes (not when we stop waiting),
+        # so timed-out jobs still count against the bound until they actually end.
+        loop = asyncio.get_running_loop()
+        self.pending += 1
+        rows = [[float(c) for c in row] for row in coeff_rows]
+        future = self.pool.submit(_vqe_job, rows, maxiter)
+        future.add_done_callback(lambda f: loop.call_soon_threadsafe(self._release, f))
+
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), timeout or self.job_timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise
+        self.completed += 1
+        return result
+
+    async def run_many(self, coeff_rows, maxiter=None, timeout=None):
+        """Splits a batch into one chunk per worker and runs the chunks in parallel"""
+        coeff_rows = list(coeff_rows)
+        if not coeff_rows:
+            return []
+        size = -(-len(coeff_rows) // self.workers)
+        chunks = [coeff_rows[i:i + size] for i in range(0, len(coeff_rows), size)]
+        results = await asyncio.gather(
+            *(self.run_batch(chunk, maxiter=maxiter, timeout=timeout) for chunk in chunks)
+        )
+        return [r for chunk in results for r in chunk]
+
+    def stats(self):
+        return {
+            "workers": self.workers,
+            "running": self.pool is not None,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "completed": self.completed,
+            "timeouts": self.timeouts,
+            "rejected": self.rejected
+        }
+
+
+vqe_executor = VQEExecutor()
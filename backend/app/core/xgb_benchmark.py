@@ -0,0 +1,95 @@
+import os
+import threading
+import time
+
+import numpy as np
+
+XGB_MODEL_FILE = "xgb_final_model.pkl"
+
+# Feature order of the advanced XGBoost baseline (notebook: analyze_with_advanced_xgboost)
+FEATURE_COLUMNS = [
+    "amount", "HourOfDay", "orig_balance_change", "txn_vs_orig_balance",
+    "txn_amount_vs_historical_avg", "avg_txn_amount_last_5", "nameDest_inDegree",
+    "payee_past_fraud_ratio", "is_cross_community_txn_num", "is_single_path_transfer_num"
+]
+
+
+class XGBoostBenchmark:
+    """
+    The real classical baseline, scored in batches.
+      - the booster is loaded once; the test set's feature columns are kept as one
+        C-contiguous float32 matrix (N, F)
+      - a batch gathers its rows into a preallocated float32 buffer and runs ONE
+        `inplace_predict` on it (no DMatrix, no per-transaction DataFrame)
+      - every row's probability is scored once at load, so per-transaction lookups
+        on the live stream are an array index
+    """
+
+    def __init__(self, booster, features, batch_size=4096):
+        self.booster = booster
+        self.features = np.ascontiguousarray(features, dtype=np.float32)   # (N, F)
+        self.batch_size = batch_size
+        self._buffer = np.empty((batch_size, self.features.shape[1]), dtype=np.float32)
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.rows = 0
+        self.seconds = 0.0
+        self.probabilities, _ = self.predict(np.arange(len(self.features)))
+
+    @classmethod
+    def load(cls, model_path, features, batch_size=4096):
+        """XGBClassifier / Booster pickle (joblib) -> XGBoostBenchmark (raises ImportError without xgboost)"""
+        import joblib
+        import xgboost  # noqa: F401  (unpickling needs it; fail early with a clear ImportError)
+
+        model = joblib.load(model_path)
+        booster = model.get_booster() if hasattr(model, "get_booster") else model
+        return cls(booster, features, batch_size=batch_size)
+
+    def _score(self, matrix):
+        scores = self.booster.inplace_predict(matrix, missing=np.nan)
+        scores = np.asarray(scores, dtype=np.float64)
+        return scores[:, -1] if scores.ndim == 2 else scores
+
+    def predict(self, rows):
+        """(fraud probabilities, seconds) for test-set rows, in chunks of `batch_size`"""
+        rows = np.asarray(rows, dtype=np.int64)
+        out = np.empty(len(rows), dtype=np.float64)
+        started = time.perf_counter()
+        with self._lock:  # the buffer is shared between request threads
+            for start in range(0, len(rows), self.batch_size):
+                chunk = rows[start:start + self.batch_size]
+                buffer = self._buffer[:len(chunk)]
+                np.take(self.features, chunk, axis=0, out=buffer)
+                out[start:start + len(chunk)] = self._score(buffer)
+            seconds = time.perf_counter() - started
+            self.batches += 1
+            self.rows += len(rows)
+            self.seconds += seconds
+        return out, seconds
+
+    def stats(self):
+        return {
+            "batches": self.batches,
+            "rows": self.rows,
+            "mean_batch_ms": self.seconds / self.batches * 1000 if self.batches else None,
+            "rows_per_second": self.rows / self.seconds if self.seconds else None
+        }
+
+
+def load_xgb_benchmark(data_path, features):
+    """XGBoostBenchmark, or None without the model artifact / xgboost (the engine then simulates)"""
+    model_path = os.path.join(data_path, XGB_MODEL_FILE)
+    if features is None or not os.path.exists(model_path):
+        return None
+    try:
+        started = time.perf_counter()
+        benchmark = XGBoostBenchmark.load(model_path, features)
+        print(f"✅ XGBoost benchmark: {len(benchmark.features)} rows scored in "
+              f"{(time.perf_counter() - started) * 1000:.1f}ms")
+        return benchmark
+    except ImportError as e:
+        print(f"⚠️ XGBoost benchmark unavailable ({e}), using the simulated baseline")
+    except Exception as e:
+        print(f"⚠️ XGBoost benchmark failed to load ({e}), using the simulated baseline")
+    return None
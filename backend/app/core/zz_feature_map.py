@@ -0,0 +1,59 @@
+import numpy as np
+
+
+def entanglement_pairs(num_qubits, entanglement="linear"):
+    """ZZ interaction pairs for Qiskit's entanglement strategies (or an explicit pair list)"""
+    if entanglement == "linear":
+        return [(i, i + 1) for i in range(num_qubits - 1)]
+    if entanglement == "circular":
+        pairs = [(i, i + 1) for i in range(num_qubits - 1)]
+        return pairs + [(num_qubits - 1, 0)] if num_qubits > 2 else pairs
+    if entanglement == "full":
+        return [(i, j) for i in range(num_qubits) for j in range(i + 1, num_qubits)]
+    if isinstance(entanglement, str):
+        raise ValueError(f"Unsupported entanglement '{entanglement}'. Use linear, circular or full")
+    return [tuple(pair) for pair in entanglement]
+
+
+def feature_map_params(feature_map):
+    """(reps, entanglement, alpha) of a Qiskit ZZFeatureMap, with Qiskit's defaults"""
+    return (
+        int(getattr(feature_map, "reps", 2)),
+        getattr(feature_map, "entanglement", "full"),
+        float(getattr(feature_map, "alpha", 2.0))
+    )
+
+
+def zz_feature_states(features, reps=2, alpha=2.0, entanglement="linear"):
+    """
+    Batched statevectors of ZZFeatureMap(feature_dimension=n, reps, entanglement).
+    Each rep is H^{⊗n} followed by a diagonal phase layer:
+        phase(b) = α·Σ_i x_i·b_i + α·Σ_{(i,j)} (π - x_i)(π - x_j)·(b_i ⊕ b_j)
+    (Qiskit little-endian basis: b_i is bit i of the state index).
+    Returns complex (N, 2^n).
+    """
+    x = np.atleast_2d(np.asarray(features, dtype=np.float64))
+    n_samples, n = x.shape
+    dim = 2 ** n
+    bits = (np.arange(dim)[:, None] >> np.arange(n)) & 1                # (dim, n)
+
+    # 1. Diagonal phases per sample (single qubit + ZZ pairs)
+    phase = alpha * x @ bits.T                                          # (N, dim)
+    pairs = np.array(entanglement_pairs(n, entanglement), dtype=np.int64).reshape(-1, 2)
+    if len(pairs):
+        pair = (np.pi - x[:, pairs[:, 0]]) * (np.pi - x[:, pairs[:, 1]])  # (N, pairs)
+        parity = bits[:, pairs[:, 0]] ^ bits[:, pairs[:, 1]]              # (dim, pairs)
+        phase += alpha * pair @ parity.T
+    diagonal = np.exp(1j * phase)
+
+    # 2. H^{⊗n} as a dense (dim, dim) matrix
+    hadamard = np.ones((1, 1))
+    for _ in range(n):
+        hadamard = np.kron(hadamard, np.array([[1.0, 1.0], [1.0, -1.0]]) / np.sqrt(2.0))
+
+    # 3. ψ = (D·H)^reps |0…0>
+    state = np.zeros((n_samples, dim), dtype=np.complex128)
+    state[:, 0] = 1.0
+    for _ in range(reps):
+        state = (state @ hadamard) * diagonal  # H is symmetric
+    return state
@@ -0,0 +1,116 @@
+import json
+import os
+import platform
+import time
+
+import numpy as np
+
+# Metric each kind of case is gated on (latency: lower is better, throughput: higher is better).
+# Both are best-of-N (rounds within a case, repeats of the suite) so a noisy neighbour during
+# one stretch of the run does not fail it.
+GATED_METRIC = {"latency": "best_p50_ms", "throughput": "ops_per_s"}
+
+
+def time_calls(fn, iterations, warmup=10, rounds=5):
+    """Latency case: times `iterations` calls of fn() (split in `rounds`) after `warmup` untimed ones"""
+    for _ in range(warmup):
+        fn()
+    samples = np.empty(iterations)
+    bounds = np.linspace(0, iterations, rounds + 1).astype(int)
+    started = time.perf_counter()
+    for i in range(iterations):
+        t = time.perf_counter_ns()
+        fn()
+        samples[i] = time.perf_counter_ns() - t
+    elapsed = time.perf_counter() - started
+    samples /= 1e6
+    medians = [np.median(samples[a:b]) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+    return {
+        "kind": "latency",
+        "iterations": iterations,
+        "p50_ms": float(np.percentile(samples, 50)),
+        "best_p50_ms": float(min(medians)),
+        "p95_ms": float(np.percentile(samples, 95)),
+        "p99_ms": float(np.percentile(samples, 99)),
+        "mean_ms": float(samples.mean()),
+        "ops_per_s": iterations / elapsed
+    }
+
+
+def throughput(operations, seconds, **extra):
+    """Throughput case: `operations` completed in `seconds`"""
+    return {"kind": "throughput", "operations": operations, "seconds": seconds,
+            "ops_per_s": operations / seconds, **extra}
+
+
+def faster(a, b):
+    """The better of two results of the same case, on its gated metric"""
+    if a is None:
+        return b
+    metric = GATED_METRIC[a["kind"]]
+    if a["kind"] == "latency":
+        return a if a[metric] <= b[metric] else b
+    return a if a[metric] >= b[metric] else b
+
+
+def machine_info():
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "numpy": np.__version__
+    }
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def write_baseline(path, results):
+    """Keeps cases that were not re-run this time (e.g. with --only)"""
+    baseline = load_baseline(path) or {"results": {}}
+    baseline["machine"] = machine_info()
+    baseline["updated"] = time.strftime("%Y-%m-%d %H:%M:%S")
+    baseline["results"].update(results)
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(results, baseline, tolerance, min_delta_ms=0.0):
+    """
+    One row per case: (name, metric, baseline, current, change, regressed).
+    `change` is relative and signed so that positive = slower, whatever the metric.
+    Latency cases only regress when they are also `min_delta_ms` slower in absolute
+    terms (sub-millisecond cases jitter by tens of microseconds between runs).
+    """
+    rows = []
+    for name, result in results.items():
+        metric = GATED_METRIC[result["kind"]]
+        reference = (baseline or {}).get("results", {}).get(name, {}).get(metric)
+        current = result[metric]
+        if not reference:
+            rows.append((name, metric, None, current, None, False))
+            continue
+        if result["kind"] == "latency":
+            change = current / reference - 1.0
+            regressed = change > tolerance and current - reference > min_delta_ms
+        else:
+            change = reference / current - 1.0
+            regressed = change > tolerance
+        rows.append((name, metric, reference, current, change, regressed))
+    return rows
+
+
+def print_report(rows, tolerance):
+    print(f"\n{'case':<34} {'metric':<10} {'baseline':>12} {'current':>12} {'change':>9}")
+    print("-" * 81)
+    for name, metric, reference, current, change, regressed in rows:
+        ref = f"{reference:12.3f}" if reference is not None else f"{'-':>12}"
+        delta = f"{change * 100:+8.1f}%" if change is not None else f"{'new':>9}"
+        flag = "  ❌ REGRESSION" if regressed else ""
+        print(f"{name:<34} {metric:<10} {ref} {current:12.3f} {delta}{flag}")
+    print(f"(change > +{tolerance * 100:.0f}% on the gated metric fails the run; positive = slower)")
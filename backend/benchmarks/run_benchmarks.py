@@ -0,0 +1,307 @@
+import argparse
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.abspath(os.path.join(BENCHMARKS_DIR, ".."))
+sys.path.append(BACKEND_DIR)
+from harness import compare, faster, load_baseline, print_report, throughput, time_calls, write_baseline
+
+BASELINE_FILE = os.path.join(BENCHMARKS_DIR, "baseline.json")
+DATA_DIR = os.path.join(BACKEND_DIR, "app", "data")
+
+
+class Context:
+    """
+    Shared state for the cases: the real engine and an in-process client for the app (no server).
+    The blocklist log and audit DB live in a temp directory, never the real ones.
+    """
+
+    def __init__(self, scale):
+        self.scale = scale
+        self._client = None
+        self.state_dir = tempfile.mkdtemp(prefix="janus-bench-")
+
+    def iterations(self, n):
+        return max(1, int(n * self.scale))
+
+    @property
+    def engine(self):
+        from app.core.janus_engine import janus
+        return janus.get()
+
+    @property
+    def client(self):
+        if self._client is None:
+            from fastapi.testclient import TestClient
+            import main
+            # No `with`: skips the startup hooks (VQE worker pool); stores are opened here instead
+            main.open_stores(self.state_dir)
+            self._client = TestClient(main.app)
+        return self._client
+
+    def reset_analytics(self):
+        """Fresh load-time aggregates, so no case sees the scores recorded by the ones before it"""
+        from app.core.analytics import AnalyticsAggregates
+        engine = self.engine
+        if engine.analytics is not None:
+            engine.index.listeners.remove(engine.analytics.record_block)
+        engine.analytics = AnalyticsAggregates(engine.index, engine.details)
+
+    def close(self):
+        if self._client is not None:
+            import main
+            main.blocklist.close()
+            main.audit.close()
+        shutil.rmtree(self.state_dir, ignore_errors=True)
+
+    def rows(self, n):
+        return np.arange(n) % len(self.engine.vectors)
+
+
+# --- Microbenchmarks (engine hot paths) ---
+
+def bench_run_vqe_forecast(ctx):
+    engine = ctx.engine
+    rows = ctx.rows(256)
+    vectors = np.asarray(engine.vectors[rows], dtype=np.float64)
+    rng = np.random.default_rng(0)
+    state = {"i": 0}
+
+    def call():
+        i = state["i"] = (state["i"] + 1) % len(vectors)
+        engine.run_vqe_forecast(vectors[i], classical_potential=0.9 if i % 2 else 0.1, rng=rng)
+    return time_calls(call, ctx.iterations(2000))
+
+
+def bench_process_transaction_full(ctx):
+    engine = ctx.engine
+    state = {"i": 0}
+
+    def call():
+        state["i"] += 1
+        engine.process_transaction_full(state["i"])
+    return time_calls(call, ctx.iterations(1000))
+
+
+def bench_transaction_topology(ctx):
+    engine = ctx.engine
+    n = len(engine.vectors)
+    state = {"i": 0}
+
+    def call():
+        # Skips the debug print rows (idx % 50 == 0) so the case measures the lookup, not stdout
+        state["i"] += 1
+        if state["i"] % 50 == 0:
+            state["i"] += 1
+        engine._get_transaction_topology(state["i"] % n)
+    return time_calls(call, ctx.iterations(1000))
+
+
+def _compiled_qsvc():
+    from app.core.qsvc_compiler import COMPILED_FILE, CompiledQSVC
+    path = os.path.join(DATA_DIR, COMPILED_FILE)
+    if not os.path.exists(path):
+        return None
+    return CompiledQSVC.load(path)
+
+
+def bench_qsvc_single(ctx):
+    qsvc = _compiled_qsvc()
+    if qsvc is None:
+        return None
+    vector = np.asarray(ctx.engine.vectors[0], dtype=np.float64)[None, :]
+    return time_calls(lambda: qsvc.predict_proba(vector), ctx.iterations(2000))
+
+
+def bench_qsvc_batch(ctx):
+    qsvc = _compiled_qsvc()
+    if qsvc is None:
+        return None
+    vectors = np.asarray(ctx.engine.vectors[ctx.rows(256)], dtype=np.float64)
+    result = time_calls(lambda: qsvc.predict_proba(vectors), ctx.iterations(200))
+    result["rows_per_s"] = len(vectors) * result["ops_per_s"]
+    return result
+
+
+# --- API (in-process ASGI client: routing + handler + serialization) ---
+
+def _get(ctx, url):
+    client = ctx.client
+    ctx.engine  # load outside the timed region
+
+    def call():
+        response = client.get(url)
+        if response.status_code != 200:
+            raise RuntimeError(f"GET {url} -> {response.status_code}")
+    return call
+
+
+def bench_api_transactions(ctx):
+    return time_calls(_get(ctx, "/api/transactions?limit=100"), ctx.iterations(300))
+
+
+def bench_api_investigate(ctx):
+    ids = [f"TX-{10000 + i}" for i in ctx.rows(64)]
+    client = ctx.client
+    ctx.engine
+    state = {"i": 0}
+
+    def call():
+        state["i"] = (state["i"] + 1) % len(ids)
+        response = client.get(f"/api/investigate/{ids[state['i']]}")
+        if response.status_code != 200 or "error" in response.json():
+            raise RuntimeError(f"investigate {ids[state['i']]} failed")
+    return time_calls(call, ctx.iterations(300))
+
+
+def bench_api_analytics(ctx):
+    return time_calls(_get(ctx, "/api/analytics"), ctx.iterations(500))
+
+
+# --- WebSocket ---
+
+def bench_ws_fanout(ctx, subscribers=100, messages=1000):
+    """Live hub fan-out: one serialized message delivered to every subscriber's queue"""
+    from app.core.stream_hub import RiskStreamHub, StreamSubscriber
+
+    hub = RiskStreamHub(ctx.engine)
+    message = hub.payload_cache.render(1)[0].decode()
+    messages = ctx.iterations(messages)
+
+    async def consume(subscriber):
+        received = 0
+        while received < messages:
+            await subscriber.get()
+            received += 1
+
+    async def run():
+        # Subscribers are attached directly: subscribe() would also start the paced producer
+        queues = [StreamSubscriber(hub.queue_size) for _ in range(subscribers)]
+        hub.subscribers.update(queues)
+        consumers = [asyncio.create_task(consume(s)) for s in queues]
+        started = time.perf_counter()
+        for _ in range(messages):
+            hub.publish(message)
+            await asyncio.sleep(0)  # let the consumers drain, like the event loop does between sends
+        await asyncio.gather(*consumers)
+        return time.perf_counter() - started
+
+    seconds = asyncio.run(run())
+    return throughput(subscribers * messages, seconds, subscribers=subscribers, messages=messages)
+
+
+def _drain(ws, limit):
+    """Transactions received until `limit` or the server closes: (transactions, frames)"""
+    import orjson
+    from starlette.websockets import WebSocketDisconnect
+
+    received = frames = 0
+    try:
+        while received < limit:
+            frame = orjson.loads(ws.receive_text())
+            received += len(frame["batch"]) if "batch" in frame else 1
+            frames += 1
+    except WebSocketDisconnect:
+        pass
+    return received, frames
+
+
+def bench_ws_private_max(ctx, limit=10000):
+    """End to end /ws/risk-stream?pace=max: scoring + encoding + micro-batched frames over the socket"""
+    limit = ctx.iterations(limit)
+    client = ctx.client
+    ctx.engine
+    with client.websocket_connect("/ws/risk-stream?pace=max&limit=512") as ws:
+        _drain(ws, 512)  # warm-up: first connection, encoder and payload caches
+
+    started = time.perf_counter()
+    with client.websocket_connect(f"/ws/risk-stream?pace=max&limit={limit}") as ws:
+        received, frames = _drain(ws, limit)
+    return throughput(received, time.perf_counter() - started, frames=frames)
+
+
+CASES = [
+    ("micro.run_vqe_forecast", bench_run_vqe_forecast),
+    ("micro.process_transaction_full", bench_process_transaction_full),
+    ("micro.transaction_topology", bench_transaction_topology),
+    ("micro.qsvc_score_single", bench_qsvc_single),
+    ("micro.qsvc_score_batch256", bench_qsvc_batch),
+    ("api.transactions", bench_api_transactions),
+    ("api.investigate", bench_api_investigate),
+    ("api.analytics", bench_api_analytics),
+    ("ws.hub_fanout_100", bench_ws_fanout),
+    ("ws.private_stream_max", bench_ws_private_max),
+]
+
+
+def run(names, scale, repeat):
+    """Runs the selected cases `repeat` times (whole suite per pass) and keeps each case's best result"""
+    ctx = Context(scale)
+    selected = [(name, case) for name, case in CASES
+                if not names or any(name.startswith(prefix) for prefix in names)]
+    results = {}
+    try:
+        for attempt in range(1, repeat + 1):
+            print(f"\n--- Pass {attempt}/{repeat} ---")
+            for name, case in selected:
+                ctx.reset_analytics()
+                started = time.perf_counter()
+                result = case(ctx)
+                if result is None:
+                    print(f"⚠️ {name}: skipped (artifact missing)")
+                    continue
+                results[name] = faster(results.get(name), result)
+                p50 = f"p50 {result['best_p50_ms']:9.3f}ms" if "best_p50_ms" in result else f"{'':15}"
+                print(f"⏱️  {name:<34} {p50}  {result['ops_per_s']:12,.1f} ops/s  "
+                      f"({time.perf_counter() - started:.1f}s)")
+    finally:
+        ctx.close()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline benchmark suite for the scoring pipeline and API")
+    parser.add_argument("--only", nargs="*", default=None,
+                        help="Case name prefixes to run (e.g. micro api.investigate ws)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Iteration multiplier (0.2 for a quick run)")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over the suite; each case keeps its best")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--tolerance", type=float, default=0.50,
+                        help="Allowed slowdown on the gated metric before a case fails (default 0.50)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.05,
+                        help="Latency cases must also be this much slower in absolute terms to fail")
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--list", action="store_true", help="List the cases and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, _ in CASES:
+            print(name)
+        sys.exit(0)
+
+    print("--- Janus Benchmarks ---")
+    results = run(args.only, args.scale, args.repeat)
+
+    if args.update_baseline:
+        write_baseline(args.baseline, results)
+        print(f"\n✅ Baseline updated: {len(results)} cases -> {args.baseline}")
+        sys.exit(0)
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"\n⚠️ No baseline at {args.baseline} (run with --update-baseline)")
+        sys.exit(0)
+    rows = compare(results, baseline, args.tolerance, args.min_delta_ms)
+    print_report(rows, args.tolerance)
+    regressions = [row[0] for row in rows if row[5]]
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s): {', '.join(regressions)}")
+        sys.exit(1)
+    print("✅ No regressions")
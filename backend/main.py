@@ -1,10 +1,20 @@
-from fastapi import FastAPI, WebSocket
+from fastapi import FastAPI, Response, WebSocket
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 import asyncio
-import json
+import threading
 import random
 import os
+from typing import Optional
+from app.core.audit_store import AuditStore, format_time, parse_time
+from app.core.blocklist_store import BlocklistStore
 from app.core.janus_engine import janus
+from app.core.payload_cache import dumps
+from app.core.vqe_executor import vqe_executor, VQEQueueFull
+from app.core.stream_hub import RiskStreamHub
+from app.core.stream_pacing import PacingConfig, PrivateStream
+from schemas import BatchScoreRequest, BulkBlockRequest, IngestRequest
 
 app = FastAPI(title="Foresight Enterprise RiskOS Backend")
 
@@ -14,101 +24,192 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Version"],  # /api/transactions pagination + sync
 )
 
+@app.on_event("startup")
+async def startup():
+    # Blocklist log + audit DB are opened here, not at import (migration, SQLite, writer threads)
+    open_stores()
+    # Load artifacts in the background: the server accepts connections immediately
+    # and /api/ready reports when the engine is warm
+    janus.warm_up()
+    # Pre-warm the VQE worker pool so the first verification doesn't pay the Qiskit import cost
+    vqe_executor.start()
+
+@app.on_event("shutdown")
+async def shutdown():
+    await risk_hub.stop()
+    vqe_executor.shutdown()
+    if blocklist is not None:
+        blocklist.close()
+    if audit is not None:
+        audit.close()
+
 # BLOCKING SYSTEM (Persistent & Account-Based)
+# Append-only log with group-commit fsync; blocked_accounts.json is migrated on first start
+BLOCKED_LOG = "blocked_accounts.log"
 BLOCKED_FILE = "blocked_accounts.json"
 
-def load_blocked_accounts():
-    if os.path.exists(BLOCKED_FILE):
-        with open(BLOCKED_FILE, "r") as f:
-            return set(json.load(f))
-    return set()
+# COMPLIANCE AUDIT TRAIL (SQLite, written off the request path)
+AUDIT_DB = "audit_log.db"
+
+blocklist = None
+audit = None
+
+def open_stores(directory=""):
+    """Opens the blocklist log and the audit DB under `directory` (once; startup hook)"""
+    global blocklist, audit
+    if blocklist is not None:
+        return
+    blocklist = BlocklistStore(os.path.join(directory, BLOCKED_LOG),
+                               legacy_json=os.path.join(directory, BLOCKED_FILE))
+    audit = AuditStore(os.path.join(directory, AUDIT_DB))
+    if blocklist.tx_ids and audit.count() == 0:
+        # Blocks recorded before the audit store existed keep their original time
+        audit.record([
+            {"ts": entry["ts"], "action": "BLOCK_TRANSACTION", "account": entry["account"], "tx_id": tx_id,
+             "reason": "VQE_CRITICAL_RISK", "user": "ADMIN_01"}
+            for tx_id, entry in blocklist.tx_ids.items()
+        ])
+    # Runs now if the engine is already loaded, otherwise as soon as it is
+    janus.on_ready(restore_blocklist)
 
-def save_blocked_accounts():
-    with open(BLOCKED_FILE, "w") as f:
-        json.dump(list(BLOCKED_ACCOUNTS), f)
+def restore_blocklist(engine):
+    engine.index.load_blocked(blocklist.accounts)
+    for tx_id in list(blocklist.tx_ids):
+        row = engine.index.row_for(tx_id)
+        if row is not None:
+            engine.index.block_transaction(row)
 
-BLOCKED_ACCOUNTS = load_blocked_accounts()
-BLOCKED_IDS = set()
+def block_event(index, row, tx_id, reason):
+    return {
+        "action": "BLOCK_TRANSACTION", "account": str(index.source[row]), "tx_id": tx_id,
+        "reason": reason, "user": "ADMIN_01",
+        "details": f"Amount: {index.amount[row]} | Dest: {index.destination[row]}"
+    }
 
-# GLOBAL INDEX for Simulation Persistence (Prevents "Groundhog Day" reset on refresh)
-CURRENT_SIMULATION_INDEX = 0
+# LIVE STREAM: one producer scores each transaction once and fans it out to every dashboard
+risk_hub = RiskStreamHub(janus)
 
 @app.websocket("/ws/risk-stream")
 async def websocket_endpoint(websocket: WebSocket):
-    global CURRENT_SIMULATION_INDEX
     await websocket.accept()
+
+    # PACING: realtime (shared live feed) | fixed | replay | max (see PacingConfig)
+    try:
+        pacing = PacingConfig.from_query(websocket.query_params)
+    except ValueError as e:
+        await websocket.send_json({"error": str(e)})
+        await websocket.close(code=1008)
+        return
+
+    if pacing.pace != "realtime":
+        print(f"✅ CLIENT CONNECTED: {pacing.pace.upper()} stream")
+        try:
+            engine = await run_in_threadpool(janus.get)  # cold engine: load off the event loop
+            await PrivateStream(websocket, engine, risk_hub.payload_cache, pacing).run()
+            await websocket.close()
+        except Exception as e:
+            print(f"❌ Connection Closed: {e}")
+        return
+
     print("✅ CLIENT CONNECTED: Dashboard is Online")
-    
-    # Do not reset idx here. Use the global one.
-    
+    subscriber = risk_hub.subscribe()
     try:
         while True:
-            # 1. RUN UNIFIED PROCESS (Shared with Investigation API)
-            full_analysis = janus.process_transaction_full(CURRENT_SIMULATION_INDEX)
-            tx_data = full_analysis["transaction"]
-            vqe_result = full_analysis["vqe"]
-            benchmark = full_analysis["benchmark"]
-            
-            # 2. Construct Live Payload (Detailed for Frontend Storage)
-            # We explicitly send EVERYTHING so the frontend can "store" it for the Investigation View
-            payload = {
-                "transaction": tx_data,
-                "analysis": {
-                    "perturbation_vector": janus.vectors[CURRENT_SIMULATION_INDEX % len(janus.vectors)].tolist(),
-                    "qsvc_prob": full_analysis["qsvc"]["probability"],
-                    "vqe_energy": vqe_result["energy"],
-                    "risk_score": vqe_result["risk_score"],
-                    "status": vqe_result["status"],
-                    "quantum_probabilities": vqe_result["probabilities"]
-                },
-                "system_entropy": vqe_result["risk_score"],
-                "benchmark": benchmark # Include the Classic AI result
-            }
-            
-            # 4. RIGOROUS TERMINAL LOGGING (As Requested)
-            if CURRENT_SIMULATION_INDEX % 5 == 0 or vqe_result["status"] == "CRITICAL":
-                print("\n────────────────────────────────────────────────────────")
-                print(f"📡 PROCESSING TX: {tx_data['id']} | TYPE: {tx_data['type']}")
-                print(f"   💵 AMOUNT: {tx_data['amount']} | ACCOUNT: {tx_data['account']}")
-                print(f"   🔮 JANUS (H-GSAD): {vqe_result['status']} (Energy: {vqe_result['energy']:.2f} eV)")
-                
-                # Show actual topology pattern from the engine
-                topology = full_analysis["topology"]
-                if benchmark['blindspot_detected']:
-                     print(f"   ⚠️  MULE RING DETECTED: {topology['pattern']} ({topology['neighbor_count']} nodes)")
-                
-                print("────────────────────────────────────────────────────────\n")
-
-
-            await websocket.send_json(payload)
-            
-            # 5. PACING (Optimized for "Lively" feel)
-            # Was 8s/3s -> Now 4s (Critical) / 2s (Normal)
-            delay = 4.0 if vqe_result["status"] == "CRITICAL" else 2.0
-            await asyncio.sleep(delay)
-            
-            CURRENT_SIMULATION_INDEX += 1  
-            
+            message = await subscriber.get()
+            if message is None:
+                # Hub disconnected us for falling too far behind
+                await websocket.close()
+                break
+            await websocket.send_text(message)
+
     except Exception as e:
         print(f"❌ Connection Closed: {e}")
+    finally:
+        risk_hub.unsubscribe(subscriber)
+
+@app.get("/api/stream/stats")
+def stream_stats():
+    """Live stream fan-out state (subscribers, position, coalesced messages)"""
+    return risk_hub.stats()
+
+@app.post("/api/block/bulk")
+async def block_bulk(request: BulkBlockRequest):
+    """
+    Freezes many accounts in one call (one durable commit): the source accounts of
+    `tx_ids`, explicit `accounts`, and/or every member of a detected ring (`ring_id`).
+    The index only changes once the blocks are durable.
+    """
+    # A cold engine loads in the threadpool, never on the event loop
+    engine = await run_in_threadpool(janus.get)
+    index = engine.index
+
+    # 1. Validate + collect (nothing changes if the request is rejected)
+    ring_members = []
+    if request.ring_id is not None:
+        rings = await run_in_threadpool(lambda: engine.ring_table)
+        if rings is None or not 0 <= request.ring_id < len(rings.ring_size):
+            return {"status": "ERROR", "message": f"Unknown ring {request.ring_id}"}
+        ring_members = [account.decode() for account in rings.account_ids[rings.account_ring == request.ring_id]]
+
+    entries, events, rows, unknown = [], [], [], []
+    for tx_id in request.tx_ids or []:
+        row = index.row_for(tx_id)
+        if row is None:
+            unknown.append(tx_id)
+            continue
+        rows.append(row)
+        entries.append((index.source[row], tx_id))
+        events.append(block_event(index, row, tx_id, "BULK_BLOCK"))
+    entries += [(account, None) for account in request.accounts or []]
+    entries += [(account, None) for account in ring_members]
+    events += [{"action": "BLOCK_ACCOUNT", "account": account, "reason": f"MULE_RING_{request.ring_id}",
+                "user": "ADMIN_01"} for account in ring_members]
+    events += [{"action": "BLOCK_ACCOUNT", "account": account, "reason": "BULK_BLOCK", "user": "ADMIN_01"}
+               for account in request.accounts or []]
+
+    # 2. Durable append (one group commit)
+    try:
+        await asyncio.wrap_future(blocklist.block(entries))
+    except Exception as e:
+        print(f"Bulk Block Failed: {e}")
+        return {"status": "ERROR", "message": str(e)}
+
+    # 3. Apply to the index (flags change incrementally) and audit
+    for row in rows:
+        index.block_transaction(row)
+    newly_blocked = sorted({account for account, _ in entries if index.block_account(account)})
+    audit.record(events)
+
+    print(f"🔒 BULK FREEZE: {len(newly_blocked)} new accounts ({len(entries)} requested)")
+    return {
+        "status": "BLOCKED",
+        "requested": len(entries),
+        "newly_blocked": len(newly_blocked),
+        "accounts": newly_blocked,
+        "unknown_tx_ids": unknown
+    }
 
 @app.post("/api/block/{tx_id}")
 async def block_transaction(tx_id: str):
     """Freezes the SOURCE ACCOUNT associated with this transaction ID"""
     print(f"🔒 COMMAND RECEIVED: FREEZE ACCOUNT FOR {tx_id}")
     
-    # 1. Find the Account from the ID (Reverse lookup in Janus Data)
+    # 1. Find the Account from the ID (O(1) index lookup; a cold engine loads off the event loop)
     try:
-        # Assuming our ID generation is consistent: TX-{10000+idx}
-        numeric_id = int(tx_id.split("-")[1]) - 10000
-        real_account = janus.details.iloc[numeric_id]["nameOrig"]
+        index = (await run_in_threadpool(janus.get)).index
+        row = index.row_for(tx_id)
+        if row is None:
+            raise KeyError(f"Unknown transaction {tx_id}")
+        real_account = index.source[row]
         
-        # 2. Add to Blocklist
-        BLOCKED_ACCOUNTS.add(real_account)
-        BLOCKED_IDS.add(tx_id) # Track the specific trigger
-        save_blocked_accounts()
+        # 2. Wait for the durable append, then update the index (flags change incrementally)
+        await asyncio.wrap_future(blocklist.block([(real_account, tx_id)]))
+        index.block_account(real_account)
+        index.block_transaction(row)
+        audit.record([block_event(index, row, tx_id, "VQE_CRITICAL_RISK")])
         
         print(f"   PLEASE NOTE: Account {real_account} has been permanently blocked.")
         return {"status": "BLOCKED", "account": real_account, "tx_id": tx_id}
@@ -117,83 +218,186 @@ async def block_transaction(tx_id: str):
         print(f"Block Failed: {e}")
         return {"status": "ERROR", "message": str(e)}
 
+@app.get("/api/blocklist/stats")
+def blocklist_stats():
+    """Blocklist log state (entries, log lines, group commits, compactions)"""
+    return blocklist.stats()
+
 @app.get("/api/circuit")
 def get_circuit():
     return janus.get_circuit_layout()
 
 @app.get("/api/transactions")
-def get_transactions(limit: int = 100):
-    """Returns the list of all transactions in the test set"""
+def get_transactions(response: Response, limit: int = 100, after: Optional[str] = None,
+                     fields: Optional[str] = None, since: Optional[int] = None, format: str = "json"):
+    """
+    Keyset-paginated transaction list (row order).
+      after=TX-xxxxx       continue after this id (X-Next-Cursor of the previous page)
+      fields=id,status     project the record
+      since=<version>      only rows whose status changed after that X-Version
+      format=ndjson        stream one JSON record per line
+    Headers: X-Next-Cursor (absent on the last page), X-Version (current change version)
+    """
     try:
-        # Convert DataFrame to list of dicts
-        records = janus.details.head(limit).to_dict(orient="records")
-        
-        # Enrich with ID and Block Status
-        enriched = []
-        for i, r in enumerate(records):
-            tx_id = f"TX-{10000+i}"
-            
-            # Check if account is frozen OR specific ID is blocked
-            # explicit global reference just in case
-            is_frozen = (r["nameOrig"] in BLOCKED_ACCOUNTS) or (tx_id in BLOCKED_IDS)
-            
-            status = "Posted"
-            if janus.labels[i] == 1:
-                status = "Flagged"
-            if is_frozen:
-                status = "BLOCKED"
-
-            enriched.append({
-                "id": tx_id,
-                "amount": r["amount"],
-                "source": r["nameOrig"],
-                "destination": r["nameDest"],
-                "is_fraud": bool(janus.labels[i] == 1),
-                "status": status
-            })
-        return enriched
+        # Rows come straight from the index arrays (block status is precomputed)
+        index = janus.index
+        version = index.version
+        columns = tuple(f.strip() for f in fields.split(",") if f.strip()) if fields else None
+        rows, next_cursor = index.page(after=after, limit=limit, since=since)
+        if columns is not None:
+            index.records(rows[:0], columns)  # validate the projection before streaming
+
+        headers = {"X-Version": str(version)}
+        if next_cursor is not None:
+            headers["X-Next-Cursor"] = next_cursor
+
+        if format == "ndjson":
+            def stream_rows(chunk_size=1000):
+                for start in range(0, len(rows), chunk_size):
+                    records = index.records(rows[start:start + chunk_size], columns)
+                    yield b"".join(dumps(record) + b"\n" for record in records)
+            return StreamingResponse(stream_rows(), media_type="application/x-ndjson", headers=headers)
+
+        response.headers.update(headers)
+        return index.records(rows, columns)
+    except ValueError as e:
+        return {"error": str(e)}
     except Exception as e:
         print(f"❌ TRANSACTIONS ERROR: {e}")
         import traceback
         traceback.print_exc()
         return []
 
+@app.get("/api/accounts/{account_id}/transactions")
+def get_account_transactions(account_id: str):
+    """All transactions where this account is the source or the destination"""
+    index = janus.index
+    return {
+        "account": account_id,
+        "blocked": index.is_account_blocked(account_id),
+        "transactions": [index.record(row) for row in index.rows_for_account(account_id)]
+    }
+
+
+async def verify_energy(coeffs, exact_energy):
+    """Real SPSA/VQE cross-check of an exact ground-state energy, run in the process pool (never the event loop)"""
+    try:
+        vqe = await vqe_executor.run(coeffs)
+    except VQEQueueFull as e:
+        return {"error": f"VQE busy: {e}"}
+    except asyncio.TimeoutError:
+        return {"error": "VQE timed out"}
+    return {
+        "vqe_energy": vqe["energy"],
+        "exact_energy": exact_energy,
+        "energy_error": vqe["energy"] - exact_energy,
+        "probabilities": vqe.get("probs", {}),
+        "elapsed_ms": vqe["elapsed_ms"]
+    }
 
 @app.get("/api/investigate/{tx_id}")
-def investigate_transaction(tx_id: str):
-    """Returns deep-dive forensics for a single transaction"""
-    data = janus.get_forensic_details(tx_id)
+async def investigate_transaction(tx_id: str, verify: bool = False):
+    """Returns deep-dive forensics for a single transaction (verify=true also runs SPSA/VQE)"""
+    # Resolve the engine in the threadpool too (janus.<attr> on a cold engine loads it inline)
+    engine = await run_in_threadpool(janus.get)
+    data = await run_in_threadpool(engine.get_forensic_details, tx_id)
     if not data:
         return {"error": "Transaction not found"}
+
+    if verify:
+        coeffs = [term["coeff"] for term in data["vqe"]["hamiltonian"]]
+        data["vqe"]["verification"] = await verify_energy(coeffs, data["vqe"]["ground_state"]["energy"])
     return data
 
-@app.get("/api/analytics")
-def get_analytics():
-    """Returns aggregate statistics for the Analytics Dashboard"""
+# Dashboard analysis service (pandas/joblib/Qiskit): built on the first /api/analyze request
+_model_service = None
+_model_service_lock = threading.Lock()
+
+def get_model_service():
+    global _model_service
+    with _model_service_lock:
+        if _model_service is None:
+            from services.model_service import ModelService
+            _model_service = ModelService()
+    return _model_service
+
+@app.get("/api/analyze/{tx_id}")
+async def analyze_transaction(tx_id: str, verify: bool = False):
+    """Full DashboardData for a transaction, serialized straight from the validated template (verify=true also runs SPSA/VQE)"""
     try:
-        total_tx = len(janus.labels)
-        fraud_count = int(sum(janus.labels))
-        blocked_count = len(BLOCKED_ACCOUNTS) # Use persistent count
-        
-        # Calculate volume safely
-        # 1. Force convert to numeric, coercing errors to NaN
-        import pandas as pd
-        amounts = pd.to_numeric(janus.details["amount"], errors='coerce').fillna(0)
-        
-        total_volume = float(amounts.sum())
-        
-        # Filter for fraud
-        fraud_mask = (janus.labels == 1)
-        fraud_volume = float(amounts[fraud_mask].sum())
+        service = await run_in_threadpool(get_model_service)
+        payload, coeffs = await run_in_threadpool(service.analysis_payload, tx_id)
+    except Exception as e:
+        print(f"❌ ANALYZE ERROR: {e}")
+        return {"error": str(e)}
 
-        return {
-            "total_transactions": total_tx,
-            "total_volume": total_volume,
-            "fraud_attempts": fraud_count,
-            "fraud_volume": fraud_volume,
-            "blocked_count": blocked_count,
-            "prevention_rate": (blocked_count / max(fraud_count, 1)) if fraud_count > 0 else 1.0
-        }
+    if verify:
+        payload["vqeResults"]["verification"] = await verify_energy(coeffs, payload["vqeResults"]["energy"])
+    return Response(dumps(payload), media_type="application/json")
+
+@app.get("/api/topology/{tx_id}")
+def get_topology(tx_id: str, hops: int = 1, limit: int = 200):
+    """Real k-hop account neighbourhood of a transaction (nodes + aggregated edges)"""
+    try:
+        data = janus.get_topology(tx_id, hops=hops, limit=max(1, min(limit, 2000)))
+        if data is None:
+            return {"error": "Transaction not found"}
+        return data
+    except ValueError as e:
+        return {"error": str(e)}
+    except Exception as e:
+        print(f"❌ TOPOLOGY ERROR: {e}")
+        return {"error": str(e)}
+
+@app.get("/api/vqe/stats")
+def vqe_stats():
+    """Load of the VQE worker pool (queue depth, timeouts, rejections)"""
+    return vqe_executor.stats()
+
+@app.get("/api/benchmark/stats")
+def benchmark_stats():
+    """Classical baseline in use (real XGBoost or simulated) and its batch scoring latency"""
+    benchmark = janus.xgb_benchmark
+    return {"model": janus.benchmark_name, "simulated": benchmark is None,
+            **(benchmark.stats() if benchmark is not None else {})}
+
+@app.post("/api/score/batch")
+def score_batch(request: BatchScoreRequest):
+    """Scores many transactions in one vectorized pass (columnar response)"""
+    try:
+        return janus.process_batch(request.indices)
+    except Exception as e:
+        print(f"❌ BATCH SCORING ERROR: {e}")
+        return {"error": str(e)}
+
+@app.post("/api/graph/ingest")
+def ingest_transactions(request: IngestRequest):
+    """Adds live transactions to the account graph and re-embeds the accounts they affect"""
+    try:
+        txs = request.transactions
+        return janus.ingest_transactions(
+            [t.nameOrig for t in txs], [t.nameDest for t in txs], [t.amount for t in txs]
+        )
+    except RuntimeError as e:
+        return {"error": str(e)}
+    except Exception as e:
+        print(f"❌ GRAPH INGEST ERROR: {e}")
+        return {"error": str(e)}
+
+@app.get("/api/analytics")
+def get_analytics(timeline: Optional[str] = None):
+    """
+    Returns aggregate statistics for the Analytics Dashboard.
+    Served from incrementally maintained aggregates (cost does not grow with the table).
+    Optional: timeline=hour|day adds time-bucketed rollups.
+    """
+    try:
+        stats = janus.analytics.snapshot()
+        if timeline is not None:
+            stats["timeline"] = janus.analytics.timeline(timeline)
+        return stats
+    except ValueError as e:
+        return {"error": str(e)}
     except Exception as e:
         print(f"❌ ANALYTICS ERROR: {e}")
         import traceback
@@ -209,29 +413,46 @@ def get_analytics():
         }
 
 @app.get("/api/compliance")
-def get_compliance_log():
-    """Returns the audit log of blocked transactions"""
-    log = []
-    # In a real app we'd track timestamp of block.
-    # Here we just list them.
-    for tx_id in BLOCKED_IDS:
-        # Find original data if possible (fast lookup would be better, but loop is fine for 450 items)
-        # We need to reverse map ID to index
-        try:
-            idx = int(tx_id.split("-")[1]) - 10000
-            if 0 <= idx < len(janus.labels):
-                row = janus.details.iloc[idx]
-                log.append({
-                    "id": tx_id,
-                    "timestamp": "2024-02-04 14:32:01", # Mock time for the demo
-                    "action": "BLOCK_TRANSACTION",
-                    "reason": "VQE_CRITICAL_RISK",
-                    "user": "ADMIN_01",
-                    "details": f"Amount: {row['amount']} | Dest: {row['nameDest']}"
-                })
-        except:
-             continue
-    return log
+def get_compliance_log(response: Response, start: Optional[str] = None, end: Optional[str] = None,
+                       account: Optional[str] = None, action: Optional[str] = None,
+                       limit: int = 100, cursor: Optional[str] = None, format: str = "json"):
+    """
+    Audit log of blocking actions, newest first.
+      start / end          time range [start, end): epoch seconds or ISO-8601 (UTC)
+      account / action     exact filters (indexed by account + time)
+      limit + cursor       keyset pagination; the next cursor is in the X-Next-Cursor header
+      format=ndjson        streaming export of the whole range, oldest first
+    """
+    try:
+        start_ts, end_ts = parse_time(start), parse_time(end)
+        if format == "ndjson":
+            return StreamingResponse(audit.export(start_ts, end_ts, account, action),
+                                     media_type="application/x-ndjson")
+        events, next_cursor = audit.query(start_ts, end_ts, account, action,
+                                          limit=max(1, min(limit, 1000)), cursor=cursor)
+    except ValueError as e:
+        return {"error": str(e)}
+
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return [
+        {
+            "id": event["tx_id"] or event["account"],
+            "event_id": event["id"],
+            "timestamp": format_time(event["ts"]),
+            "action": event["action"],
+            "account": event["account"],
+            "reason": event["reason"],
+            "user": event["user"],
+            "details": event["details"]
+        }
+        for event in events
+    ]
+
+@app.get("/api/compliance/stats")
+def compliance_stats():
+    """Audit store size and writer state"""
+    return audit.stats()
 
 @app.get("/")
 def health_check():
@@ -240,3 +461,9 @@ def health_check():
 @app.get("/api/health")
 def api_health_check():
     return {"status": "OK", "service": "Backend API"}
+
+@app.get("/api/ready")
+def readiness_check():
+    """Readiness probe: 200 once the engine artifacts are loaded, 503 while warming up"""
+    status = janus.status()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
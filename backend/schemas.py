@@ -103,3 +103,25 @@ class DashboardData(BaseModel):
     quantumPathSelection: QuantumPathSelection
     energyGap: EnergyGap
     digitalTwin: DigitalTwin
+
+# --- Janus Batch Scoring ---
+
+class BatchScoreRequest(BaseModel):
+    indices: Optional[List[int]] = None  # None = score the whole test set
+
+# --- Live Graph Ingestion ---
+
+class LiveTransaction(BaseModel):
+    nameOrig: str
+    nameDest: str
+    amount: float
+
+class IngestRequest(BaseModel):
+    transactions: List[LiveTransaction]
+
+# --- Bulk Blocking ---
+
+class BulkBlockRequest(BaseModel):
+    tx_ids: Optional[List[str]] = None     # freeze the source account of each transaction
+    accounts: Optional[List[str]] = None   # freeze accounts directly
+    ring_id: Optional[int] = None          # freeze every member of a detected mule ring
@@ -0,0 +1,39 @@
+import argparse
+import os
+import sys
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(BACKEND_DIR)
+from app.core.embedding_store import ACCOUNT_MAP_PICKLE, convert_torch_artifacts, load_embedding_store
+
+ARTIFACTS_DIR = os.path.abspath(os.path.join(BACKEND_DIR, "..", "artifacts2"))
+DATA_DIR = os.path.join(BACKEND_DIR, "app", "data")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Converts 2normal_graph_embeddings.pt + account_to_idx.pkl into the mmap embedding store"
+    )
+    parser.add_argument("--artifacts-dir", default=ARTIFACTS_DIR, help="Notebook artifacts (torch embeddings, account map)")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="Output directory (the engine reads app/data)")
+    parser.add_argument("--graph", action="store_true",
+                        help="Also write the account graph + GAT encoder for incremental re-embedding")
+    args = parser.parse_args()
+
+    print("--- Building Embedding Store ---")
+    convert_torch_artifacts(args.artifacts_dir, args.data_dir)
+    store = load_embedding_store(args.data_dir)
+    print(f"   Centroid norm: {float((store.centroid ** 2).sum() ** 0.5):.4f}")
+
+    if args.graph:
+        import pickle
+        import pandas as pd
+        from app.core.gat_embedder import write_graph_artifacts
+
+        print("--- Building Account Graph ---")
+        normal_df = pd.read_csv(os.path.join(args.artifacts_dir, "normal_transactions_pool.csv"))
+        with open(os.path.join(args.artifacts_dir, ACCOUNT_MAP_PICKLE), "rb") as f:
+            account_to_idx = pickle.load(f)
+        write_graph_artifacts(
+            args.data_dir, normal_df, account_to_idx,
+            os.path.join(args.artifacts_dir, "final_gat_anomaly_encoder.pth")
+        )
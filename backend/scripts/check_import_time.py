@@ -0,0 +1,69 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Modules that must NOT be imported just by importing the API (they load on demand)
+HEAVY_MODULES = ["torch", "qiskit", "qiskit_aer", "qiskit_algorithms", "pandas", "pyarrow", "sklearn"]
+
+PROBE = (
+    "import sys, time, json; t = time.perf_counter(); import main; "
+    "elapsed = time.perf_counter() - t; "
+    f"print(json.dumps({{'seconds': elapsed, 'heavy': [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))"
+)
+
+
+def measure(runs):
+    """Imports `main` in fresh interpreters and returns the best (warm page cache) result"""
+    results = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        )
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        result["process_seconds"] = time.perf_counter() - started
+        results.append(result)
+    return min(results, key=lambda r: r["seconds"])
+
+
+def slowest_imports(limit=10):
+    """Top cumulative entries from `python -X importtime`"""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=BACKEND_DIR, capture_output=True, text=True
+    )
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = [part.strip() for part in line[len("import time:"):].split("|")]
+        rows.append((int(cumulative), name))
+    return sorted(rows, reverse=True)[:limit]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fails if importing the API exceeds the startup budget")
+    parser.add_argument("--budget", type=float, default=1.0, help="Max seconds to import main (default 1.0)")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    result = measure(args.runs)
+    print(f"⏱️  import main: {result['seconds']:.3f}s (process {result['process_seconds']:.3f}s, budget {args.budget:.3f}s)")
+    for cumulative, name in slowest_imports():
+        print(f"   {cumulative / 1e6:7.3f}s  {name}")
+
+    failed = False
+    if result["heavy"]:
+        print(f"❌ Heavy modules imported eagerly: {', '.join(result['heavy'])}")
+        failed = True
+    if result["seconds"] > args.budget:
+        print(f"❌ Import budget exceeded by {result['seconds'] - args.budget:.3f}s")
+        failed = True
+    if not failed:
+        print("✅ Import budget OK")
+    sys.exit(1 if failed else 0)
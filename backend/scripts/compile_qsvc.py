@@ -0,0 +1,69 @@
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(BACKEND_DIR)
+from app.core.artifact_store import load_test_set
+from app.core.qsvc_compiler import COMPILED_FILE, DECISION_TOLERANCE, PROBABILITY_TOLERANCE, CompiledQSVC
+
+DATA_DIR = os.path.join(BACKEND_DIR, "app", "data")
+
+
+def compile_qsvc(data_dir, output, parity_samples):
+    import joblib  # needs qiskit-machine-learning to unpickle the QSVC
+
+    print("--- Compiling QSVC into a feature-space linear model ---")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        qsvc = joblib.load(os.path.join(data_dir, "qsvc_2k.pkl"))
+        pca = joblib.load(os.path.join(data_dir, "qsvc_pca.pkl"))
+        scaler = joblib.load(os.path.join(data_dir, "qsvc_scaler.pkl"))
+
+    compiled = CompiledQSVC.compile(qsvc, pca, scaler)
+    print(f"✅ Folded {len(qsvc.support_)} support vectors into a "
+          f"{compiled.weights.shape[0]}x{compiled.weights.shape[1]} weight matrix")
+
+    # Parity against the original pipeline (pca -> scaler -> QSVC kernel circuits)
+    vectors, _, _ = load_test_set(data_dir, columns=["step"])
+    vectors = np.asarray(vectors[:parity_samples], dtype=np.float64)
+    features = scaler.transform(pca.transform(vectors))
+
+    started = time.perf_counter()
+    expected_decision = qsvc.decision_function(features)
+    expected_proba = qsvc.predict_proba(features)
+    original_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    decision = compiled.decision_function(vectors)
+    proba = compiled.predict_proba(vectors)
+    compiled_seconds = time.perf_counter() - started
+
+    decision_error = float(np.abs(decision - expected_decision).max())
+    proba_error = float(np.abs(proba - expected_proba).max())
+    print(f"   Parity on {len(vectors)} vectors: |Δdecision| {decision_error:.2e}, |Δproba| {proba_error:.2e}")
+    print(f"   Original {original_seconds:.2f}s | Compiled {compiled_seconds * 1000:.2f}ms")
+
+    if decision_error > DECISION_TOLERANCE or proba_error > PROBABILITY_TOLERANCE:
+        print("❌ Parity check failed, compiled model NOT written")
+        return False
+
+    compiled.save(output)
+    print(f"✅ Wrote {output}")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compiles qsvc_2k.pkl (+ PCA/scaler) into qsvc_compiled.npz")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="Directory with the QSVC pickles and test set")
+    parser.add_argument("--output", default=None, help=f"Output path (default: <data-dir>/{COMPILED_FILE})")
+    parser.add_argument("--parity-samples", type=int, default=16,
+                        help="Test vectors to check against the original model (slow: kernel circuits)")
+    args = parser.parse_args()
+
+    output = args.output or os.path.join(args.data_dir, COMPILED_FILE)
+    sys.exit(0 if compile_qsvc(args.data_dir, output, args.parity_samples) else 1)
@@ -0,0 +1,79 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(BACKEND_DIR)
+from app.core.ring_detection import RING_TABLE_FILE, RingTable, detect_rings, flag_names
+
+ARTIFACTS_DIR = os.path.abspath(os.path.join(BACKEND_DIR, "..", "artifacts2"))
+DATA_DIR = os.path.join(BACKEND_DIR, "app", "data")
+COLUMNS = ["step", "nameOrig", "nameDest", "amount"]
+
+
+def load_transactions(csv_path):
+    """The four detection columns as an Arrow table (multi-threaded parser, no per-string Python objects)"""
+    from pyarrow import csv
+
+    return csv.read_csv(csv_path, convert_options=csv.ConvertOptions(include_columns=COLUMNS))
+
+
+def run(table, args):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    # 1. Intern accounts (Arrow dictionary encoding over senders + receivers)
+    names = pa.chunked_array(table["nameOrig"].chunks + table["nameDest"].chunks).combine_chunks()
+    encoded = names.cast(pa.string()).dictionary_encode()
+    codes = encoded.indices.to_numpy(zero_copy_only=False).astype(np.int64)
+    n = table.num_rows
+    src, dst = codes[:n], codes[n:]
+    eligible = None
+    if args.ignore_prefix:
+        eligible = ~pc.starts_with(encoded.dictionary, args.ignore_prefix).to_numpy(zero_copy_only=False)
+
+    # 2. Detection
+    ring_of, flags, summary = detect_rings(
+        src, dst, table["amount"].to_numpy(), table["step"].to_numpy(), len(encoded.dictionary),
+        eligible=eligible, window=args.window, fan_threshold=args.fan_threshold,
+        max_cycle_length=args.max_cycle_length, max_degree=args.max_degree, min_ring_size=args.min_ring_size
+    )
+
+    # 3. Ring table keeps only ring members' ids
+    members = np.flatnonzero(ring_of >= 0)
+    accounts = np.empty(len(ring_of), dtype=object)
+    accounts[members] = encoded.dictionary.take(pa.array(members)).to_pylist()
+    return RingTable.from_detection(accounts, ring_of, flags, summary)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline mule-ring detection over the full transaction graph")
+    parser.add_argument("--csv", default=os.path.join(ARTIFACTS_DIR, "fraud_transactions_with_types3.csv"),
+                        help="Transaction CSV (step, nameOrig, nameDest, amount)")
+    parser.add_argument("--output", default=os.path.join(DATA_DIR, RING_TABLE_FILE), help="Ring table (.npz)")
+    parser.add_argument("--window", type=int, default=24, help="Fan-in/out window in steps (PaySim: hours)")
+    parser.add_argument("--fan-threshold", type=int, default=5, help="Distinct counterparties per window")
+    parser.add_argument("--max-cycle-length", type=int, default=4)
+    parser.add_argument("--max-degree", type=int, default=50, help="Skip hubs above this degree in the cycle search")
+    parser.add_argument("--min-ring-size", type=int, default=3)
+    parser.add_argument("--ignore-prefix", default="M", help="Account prefix excluded from rings ('' to keep all)")
+    args = parser.parse_args()
+
+    print("--- Mule Ring Detection ---")
+    started = time.perf_counter()
+    table = load_transactions(args.csv)
+    loaded = time.perf_counter()
+    print(f"   Loaded {table.num_rows} transactions in {loaded - started:.1f}s")
+
+    ring_table = run(table, args)
+    print(f"   Detection: {time.perf_counter() - loaded:.1f}s")
+
+    ring_table.save(args.output)
+    print(f"✅ {len(ring_table.ring_size)} rings, {len(ring_table.account_ids)} accounts -> {args.output}")
+    for ring_id in np.argsort(-ring_table.ring_amount)[:5]:
+        ring = ring_table.ring(ring_id)
+        print(f"   Ring {ring['ring_id']}: {ring['size']} accounts, {ring['transactions']} tx, "
+              f"${ring['amount']:,.0f} ({', '.join(flag_names(ring_table.ring_flags[ring_id]))})")
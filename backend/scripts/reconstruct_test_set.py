@@ -2,15 +2,23 @@ import numpy as np
 import pandas as pd
 import pickle
 import os
-from sklearn.model_selection import train_test_split
+import sys
+import argparse
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(BACKEND_DIR)
+from app.core.artifact_store import write_columnar_store, convert_pickle
 
 # Paths
 ARTIFACTS_DIR = r"d:\dashboard\artifacts2"
 OUTPUT_DIR = r"d:\dashboard\backend\app\data"
-os.makedirs(OUTPUT_DIR, exist_ok=True)
+DATA_DIR = os.path.join(BACKEND_DIR, "app", "data")
 
 def reconstruct_data():
+    from sklearn.model_selection import train_test_split
+
     print("--- Reconstructing Test Set from Artifacts ---")
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
     
     # 1. Load Artifacts
     print(f"Loading artifacts from {ARTIFACTS_DIR}...")
@@ -71,6 +79,9 @@ def reconstruct_data():
         
     print(f"Saved production dataset to: {output_path}")
 
+    # 4b. Columnar Store (memory-mapped .npy + Parquet) used by the engine
+    write_columnar_store(OUTPUT_DIR, X_test_raw, y_test, test_df_details)
+
     # 5. Also copy the Projection Matrix for the Engine
     try:
         proj_matrix = np.load(os.path.join(ARTIFACTS_DIR, 'projection_matrix.npy'))
@@ -80,4 +91,13 @@ def reconstruct_data():
         print(f"Could not copy projection matrix: {e}")
 
 if __name__ == "__main__":
-    reconstruct_data()
+    parser = argparse.ArgumentParser(description="Rebuild the production test set")
+    parser.add_argument("--convert", action="store_true",
+                        help="Only convert an existing production_test_set.pkl to the columnar store")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="Directory holding production_test_set.pkl")
+    args = parser.parse_args()
+
+    if args.convert:
+        convert_pickle(args.data_dir)
+    else:
+        reconstruct_data()
@@ -3,8 +3,14 @@ import numpy as np
 import os
 import random
 import joblib
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from schemas import * 
+from app.core.hamiltonian import (
+    BASIS_STATES, hybrid_bias, hybrid_coefficients, solve_ground_state, solve_ground_states
+)
+from app.core.payload_cache import dumps
+from app.core.qsvc_compiler import COMPILED_FILE, CompiledQSVC
+from app.core.transaction_table import interned, load_transactions
 
 # --- Qiskit Integrations (Lazy Loaded to prevent ImportErrors on reload) ---
 def get_qiskit_modules():
@@ -37,6 +43,10 @@ PROJECTION_MATRIX_PATH = os.path.join(ARTIFACTS_DIR, "projection_matrix.npy")
 QSVC_MODEL_PATH = os.path.join(ARTIFACTS_DIR, "qsvc_2k.pkl")
 QSVC_PCA_PATH = os.path.join(ARTIFACTS_DIR, "qsvc_pca.pkl")
 QSVC_SCALER_PATH = os.path.join(ARTIFACTS_DIR, "qsvc_scaler.pkl")
+# Compiled QSVC (scripts/compile_qsvc.py): PCA + scaler + kernel SVM folded into NumPy
+QSVC_COMPILED_PATH = os.path.abspath(os.path.join(BASE_DIR, "../app/data", COMPILED_FILE))
+# Arrow snapshots of the transaction CSVs (written on first load, reused while the CSV is unchanged)
+SNAPSHOT_DIR = os.path.abspath(os.path.join(BASE_DIR, "../app/data"))
 
 
 class ModelService:
@@ -45,9 +55,12 @@ class ModelService:
         self.df = None
         self.normal_pool = None
         self.qsvc = None
+        self.qsvc_compiled = None
         
-        # Load Data
+        # Load Data (+ columnar fraud/normal partition, built once)
         self._load_data()
+        self._build_partition()
+        self._template = self._build_template()
         
         # Load Qiskit
         try:
@@ -59,16 +72,23 @@ class ModelService:
 
         # Load Artifacts
         print("Loading Quantum Artifacts...")
+        # Compiled QSVC first: a few NumPy matrix products per batch, no kernel circuits per query
+        if os.path.exists(QSVC_COMPILED_PATH):
+            self.qsvc_compiled = CompiledQSVC.load(QSVC_COMPILED_PATH)
+            print("✅ Compiled QSVC Loaded")
         try:
             self.projection_matrix = np.load(PROJECTION_MATRIX_PATH)
             self.pca = joblib.load(QSVC_PCA_PATH)
             self.scaler = joblib.load(QSVC_SCALER_PATH)
             
-            # Load QSVC Model
-            if os.path.exists(QSVC_MODEL_PATH):
+            # Load QSVC Model (only needed when there is no compiled scorer)
+            if self.qsvc_compiled is None and os.path.exists(QSVC_MODEL_PATH):
                 # We try to load it. If qiskit definitions in pickle mismatch, it might fail.
                 try:
                     self.qsvc = joblib.load(QSVC_MODEL_PATH)
+                    # Analytic statevector kernel instead of one compute-uncompute circuit per pair
+                    from app.core.quantum_kernel import attach_statevector_kernel
+                    attach_statevector_kernel(self.qsvc)
                     print("✅ QSVC Model Loaded")
                 except Exception as e:
                     print(f"⚠️ QSVC Pickle Load Failed (Version Mismatch?): {e}")
@@ -91,245 +111,228 @@ class ModelService:
 
     def _load_data(self):
         try:
+            # Full dataset: typed chunked read (or the cached snapshot), interned account ids
             if os.path.exists(CSV_PATH):
-                self.df = pd.read_csv(CSV_PATH, nrows=5000) 
-                self.df['nameOrig'] = self.df['nameOrig'].astype(str)
-                self.df['nameDest'] = self.df['nameDest'].astype(str)
+                self.df = load_transactions(CSV_PATH, snapshot_dir=SNAPSHOT_DIR)
             
             if os.path.exists(NORMAL_POOL_PATH):
-                 self.normal_pool = pd.read_csv(NORMAL_POOL_PATH, nrows=1000)
+                 self.normal_pool = load_transactions(NORMAL_POOL_PATH, snapshot_dir=SNAPSHOT_DIR)
             
             print(f"✅ Data Loaded. {len(self.df) if self.df is not None else 0} transactions.")
         except Exception as e:
             print(f"❌ Error loading data: {e}")
             self.df = pd.DataFrame()
 
-    def get_transaction_history(self, limit: int = 20) -> List[Transaction]:
-        if self.df is None or self.df.empty: return []
-        # Return a mix of normal and fraud for the history
-        subset = self.df.sample(n=min(limit, len(self.df)))
-        txs = []
-        for _, row in subset.iterrows():
-            txs.append(Transaction(
-                id=f"TX-{int(row.get('step', 0))}-{random.randint(1000,9999)}",
-                time=f"10:{random.randint(10,59)} AM",
-                from_=row['nameOrig'],
-                to=row['nameDest'],
-                amount=float(row['amount']),
-                status="Suspicious" if row['isFraud'] else "Normal"
-            ))
+    def _build_partition(self):
+        """Hot columns as NumPy arrays + fraud/normal row ids (no DataFrame filtering per request)"""
+        df = self.df if self.df is not None else pd.DataFrame()
+        n = len(df)
+        # Accounts stay interned: int codes per row + one Arrow array of names per column
+        self._src_codes, self._src_names = self._account_codes(df, "nameOrig")
+        self._dst_codes, self._dst_names = self._account_codes(df, "nameDest")
+        self._amount = df["amount"].to_numpy(dtype=np.float32) if n else np.empty(0, dtype=np.float32)
+        self._step = df["step"].fillna(0).to_numpy(dtype=np.int32) if "step" in df else np.zeros(n, dtype=np.int32)
+        self._is_fraud = (df["isFraud"].to_numpy() == 1) if "isFraud" in df else np.zeros(n, dtype=bool)
+        self._fraud_rows = np.flatnonzero(self._is_fraud)
+        self._all_rows = range(n)  # O(1) memory; len() and indexing are all the hot path needs
+
+    @staticmethod
+    def _account_codes(df, column):
+        if column not in df or not len(df):
+            return interned(pd.Series([], dtype=str))
+        return interned(df[column])
+
+    def _build_template(self) -> Dict[str, Any]:
+        """
+        DashboardData with every static section filled in, validated ONCE here and kept as a
+        JSON-shaped dict; requests only overwrite the per-transaction fields.
+        """
+        placeholder = {"id": "", "time": "", "from": "", "to": "", "amount": 0.0}
+        template = DashboardData(
+            transactionHistory=[],
+            suspiciousTransaction=Transaction(**placeholder),
+            fraudRing=[],
+            networkGraph=GraphData(nodes=[], edges=[]),
+            perturbationVector=[], pcaVector=[], quantumVector=[], quantumVectorDisplay=[],
+            hamiltonian="H = J*ZZ + h*ZI (Hybrid Bias)",
+            vqeResults=VQEResults(energy=0.0, probabilities={}, verdict="", confidence="", recommendation=""),
+            scatterData=ScatterData(normal=[], suspicious=ScatterPoint(x=0.0, y=0.0, label="TX")),
+            qsvcResults=QSVCResults(fraudProbability=0.0, advantage=1.4, kernelType="FidelityQuantumKernel", accuracy=98.5),
+            riskEncoding=RiskEncoding(gnnVector=[], encodedVector=[], topK=4, method="GAT+Topology"),
+            quantumPathSelection=QuantumPathSelection(threshold=0.5, decision="Quantum", reason="Hybrid Bias via VQE"),
+            energyGap=EnergyGap(groundEnergy=0.0, observedEnergy=0.2, deltaE=0.2, interpretation="Stable Gap"),
+            digitalTwin=DigitalTwin(scenario="Janus Replay", scenarioDescription="Real-time VQE", simulationSteps=[])
+        )
+        return template.model_dump(by_alias=True)
+
+    def _history_records(self, limit: int) -> List[Dict[str, Any]]:
+        """Random history sample built from the column arrays (JSON-shaped dicts)"""
+        n = len(self._all_rows)
+        rows = random.sample(range(n), min(limit, n)) if n else []
+        records = [
+            {
+                "id": f"TX-{step}-{random.randint(1000,9999)}",
+                "time": f"10:{random.randint(10,59)} AM",
+                "from": src, "to": dst, "amount": round(amount, 2),
+                "status": "Suspicious" if fraud else "Normal",
+                "note": None
+            }
+            for src, dst, amount, step, fraud in zip(
+                [self._src_names[code].as_py() for code in self._src_codes[rows].tolist()],
+                [self._dst_names[code].as_py() for code in self._dst_codes[rows].tolist()],
+                self._amount[rows].tolist(),
+                self._step[rows].tolist(), self._is_fraud[rows].tolist()
+            )
+        ]
         # INJECT PROOF OF LIFE
-        txs.append(Transaction(
-            id=f"LIVE-BACKEND-{random.randint(100,999)}",
-            time=f"12:{random.randint(10,59)} PM",
-            from_="SYSTEM",
-            to="USER",
-            amount=99999.99,
-            status="Suspicious"
-        ))
-        return txs
+        records.append({
+            "id": f"LIVE-BACKEND-{random.randint(100,999)}",
+            "time": f"12:{random.randint(10,59)} PM",
+            "from": "SYSTEM", "to": "USER", "amount": 99999.99,
+            "status": "Suspicious", "note": None
+        })
+        return records
+
+    def get_transaction_history(self, limit: int = 20) -> List[Transaction]:
+        if not len(self._all_rows): return []
+        return [Transaction(**record) for record in self._history_records(limit)]
 
     def _run_vqe_forecast(self, perturbation_vector, classical_potential=0.0) -> Dict[str, Any]:
         """
         Ports the `run_vqe_forecast` from the notebook.
         Uses Hamiltonian = J*ZZ + h*ZI with bias.
+        H is diagonal, so the EXACT ground state is the answer; the SPSA/VQE
+        cross-check runs on the VQE process pool (see /api/analyze?verify=true).
         """
-        try:
-            # 1. Base Coefficients from Topology
-            # project vector (16,) -> (3,) using projection matrix (16,3)
-            # Ensure dims match
-            if perturbation_vector.shape[0] != self.projection_matrix.shape[0]:
-                 # Resize or pad if mismatch (e.g. if vector is 6 dim from GAT)
-                 # Assuming vector is correct from loaded file
-                 pass
-            
-            coeffs = (perturbation_vector @ self.projection_matrix).tolist()
+        # 1. Base Coefficients from Topology + HYBRID BIAS
+        if perturbation_vector.shape[0] != self.projection_matrix.shape[0]:
+            # Dimension mismatch (e.g. 6-dim vector from GAT): neutral landscape
+            coeffs = np.array([[0.1, 0.1, 0.5]])
+            coeffs[0, 0] += hybrid_bias(classical_potential)
+        else:
+            coeffs = hybrid_coefficients(perturbation_vector, self.projection_matrix, classical_potential)
 
-            # 2. HYBRID BIAS
-            if classical_potential > 0.5:
-                 coeffs[0] += (classical_potential * 4.0) # Bias ZI
+        # 2. Exact Ground State (microseconds)
+        exact = solve_ground_state(coeffs[0])
+        return {"probs": exact["probs"], "energy": exact["energy"], "coeffs": coeffs[0].tolist()}
 
-            hamiltonian = self.SparsePauliOp(["ZI", "IZ", "ZZ"], coeffs=coeffs)
-            
-            # Optimization (SPSA) - Simplified for speed in API
-            optimizer = self.SPSA(maxiter=20) 
-            
-            def cost_func(params):
-                job = self.estimator.run([self.vqe_ansatz], [hamiltonian], [params])
-                return job.result().values[0]
+    def forecast_batch(self, perturbation_vectors, classical_potentials) -> Dict[str, Any]:
+        """Exact ground states for a whole batch of transactions (columnar)"""
+        coeffs = hybrid_coefficients(perturbation_vectors, self.projection_matrix, classical_potentials)
+        solved = solve_ground_states(coeffs)
+        return {
+            "energies": solved["energies"].tolist(),
+            "states": [BASIS_STATES[i] for i in solved["ground_index"]],
+            "probabilities": {k: solved["probabilities"][:, i].tolist() for i, k in enumerate(BASIS_STATES)}
+        }
 
-            initial_point = np.random.random(self.vqe_ansatz.num_parameters)
-            opt_result = optimizer.minimize(fun=cost_func, x0=initial_point)
-            
-            # Measure
-            final_circuit = self.vqe_ansatz.assign_parameters(opt_result.x)
-            final_circuit.measure_all()
-            
-            job = self.sampler.run(final_circuit)
-            result = job.result()
-            counts = result.quasi_dists[0]
-            
-            # Map keys (int) to binary strings
-            # and normalize
-            total = sum(counts.values())
-            probs = {f"{k:02b}": v/total for k, v in counts.items()}
-            
-            # Calculate Energy
-            energy = opt_result.fun
-            
-            return {"probs": probs, "energy": energy}
+    def screen_batch(self, perturbation_vectors) -> np.ndarray:
+        """QSVC fraud probability for a whole batch (compiled scorer: a few small matrix products)"""
+        vectors = np.atleast_2d(np.asarray(perturbation_vectors, dtype=np.float64))
+        if self.qsvc_compiled is not None:
+            return self.qsvc_compiled.predict_proba(vectors)[:, 1]
+        if self.qsvc:
+            return self.qsvc.predict_proba(self.scaler.transform(self.pca.transform(vectors)))[:, 1]
+        raise RuntimeError("No QSVC model loaded (run scripts/compile_qsvc.py)")
 
-        except Exception as e:
-            print(f"VQE Error: {e}")
-            # Fallback to pure Numpy simulation of the diagonal Hamiltonian (Robustness)
-            # H = c0*ZI + c1*IZ + c2*ZZ
-            # ZI diag: [1, -1, 1, -1]
-            # IZ diag: [1, 1, -1, -1]
-            # ZZ diag: [1, -1, -1, 1]
-            try:
-                # Re-calculate coeffs if not available (failed before)
-                if perturbation_vector.shape[0] != self.projection_matrix.shape[0]:
-                    coeffs = [0.1, 0.1, 0.5]
+    def _qsvc_probability(self, p_vector, is_fraud) -> float:
+        """Classical QSVC Score (compiled scorer, pickled model, or distance-based fallback)"""
+        try:
+            if self.qsvc_compiled is not None:
+                qsvc_prob = float(self.qsvc_compiled.predict_proba(p_vector)[0, 1])
+            else:
+                vec_pca = self.pca.transform(p_vector.reshape(1, -1))
+                vec_scaled = self.scaler.transform(vec_pca)
+            
+                if self.qsvc:
+                    qsvc_prob = self.qsvc.predict_proba(vec_scaled)[0][1]
                 else:
-                    coeffs = (perturbation_vector @ self.projection_matrix).tolist()
-                
-                if classical_potential > 0.5:
-                     coeffs[0] += (classical_potential * 4.0)
+                    # Fallback: Dynamic distance-based score (Simulates Kernel)
+                    # Centroid of fraud usually high magnitude in this projection
+                    # Measure distance of vec_scaled (or vec_pca) to a theoretical centroid
+                    # Assuming scaled vector roughly [-1, 1].
+                    # Fraud centroid approx at [0.8, 0.8, ...] 
+                    # Simple proxy: sigmoid of mean value
+                    score = np.mean(vec_scaled) if 'vec_scaled' in locals() else np.mean(p_vector)
+                    # Sigmoid to [0, 1]
+                    qsvc_prob = 1 / (1 + np.exp(-5 * (score - 0.2)))
+                    # Clamp for realism (if is_fraud, ensure it's > 0.5 usually)
+                    if is_fraud and qsvc_prob < 0.5: qsvc_prob = 0.55 + random.random()*0.1
+                    if not is_fraud and qsvc_prob > 0.5: qsvc_prob = 0.45 - random.random()*0.1
 
-                # Construct Diagonal
-                c0, c1, c2 = coeffs[0], coeffs[1], coeffs[2]
-                h_diag = np.array([
-                    c0*1 + c1*1 + c2*1,    # 00
-                    c0*-1 + c1*1 + c2*-1,  # 01
-                    c0*1 + c1*-1 + c2*-1,  # 10
-                    c0*-1 + c1*-1 + c2*1   # 11
-                ])
-                
-                # Find Ground State
-                min_energy = np.min(h_diag)
-                min_idx = np.argmin(h_diag)
-                
-                # Create probability dict (Sharp peak at ground state, like VQE)
-                probs = {"00": 0.0, "01": 0.0, "10": 0.0, "11": 0.0}
-                keys = ["00", "01", "10", "11"]
-                probs[keys[min_idx]] = 0.98
-                # Add some noise
-                for k in keys:
-                    if probs[k] == 0.0: probs[k] = 0.006
-                
-                return {"probs": probs, "energy": float(min_energy)}
-            except:
-                return {"probs": {"00": 1.0}, "energy": -1.0}
+        except Exception as e:
+            print(f"QSVC Prediction Error: {e}")
+            qsvc_prob = 0.85 if is_fraud else 0.12
+        return float(qsvc_prob)
 
-    def analyze_transaction(self, tx_id: str) -> DashboardData:
-        # 1. Find Transaction or Pick Random Sample
-        # If tx_id is a "Test Sample" request, pick from valid range
-        is_fraud = False
-        row = None
-        
-        # Try to find in DF
-        # (Simplification: We assume tx_id might not match perfectly in this random subsample, 
-        # so we pick a random one if not found, or specific one if flagged)
-        
-        # Test Sample Logic: pick a 'fraud' one from our loaded pool to show interesting VQE
-        if "MOCK" not in tx_id: 
-             # Try to find a real fraud one for demonstration
-             fraud_rows = self.df[self.df['isFraud'] == 1]
-             if not fraud_rows.empty:
-                 row = fraud_rows.sample(1).iloc[0]
-                 is_fraud = True
-        
-        if row is None:
-             row = self.df.sample(1).iloc[0]
-             is_fraud = row['isFraud'] == 1
+    def analysis_payload(self, tx_id: str) -> Tuple[Dict[str, Any], List[float]]:
+        """
+        DashboardData as a JSON-shaped dict (static sections from the template, the rest per request)
+        plus the Hamiltonian coefficients behind its VQE section, for an optional SPSA/VQE cross-check.
+        """
+        # 1. Pick the Transaction (precomputed fraud partition for real requests, any row for MOCK)
+        if not len(self._all_rows):
+            raise RuntimeError("No transaction data loaded")
+        pool = self._fraud_rows if "MOCK" not in tx_id and len(self._fraud_rows) else self._all_rows
+        row = int(pool[random.randrange(len(pool))])
+        is_fraud = bool(self._is_fraud[row])
+        src = self._src_names[int(self._src_codes[row])].as_py()
+        dst = self._dst_names[int(self._dst_codes[row])].as_py()
+        amount = round(float(self._amount[row]), 2)  # float32 storage, cents on output
 
         # 2. Get Perturbation Vector
-        # In full system, this comes from GAT. Here we pick from our pre-computed file 
+        # In full system, this comes from GAT. Here we pick from our pre-computed file
         # to ensure "Test on samples" validity
         if self.perturbation_vectors is not None:
-            # Pick a random vector from the file
-            # If is_fraud, pick from the latter half (assuming file structure or just random)
-            idx = random.randint(0, len(self.perturbation_vectors)-1)
-            p_vector = self.perturbation_vectors[idx]
+            p_vector = self.perturbation_vectors[random.randint(0, len(self.perturbation_vectors)-1)]
         else:
             p_vector = np.random.randn(16) # Fallback
 
-        # 3. classical QSVC Score (Real Logic)
-        try:
-            vec_pca = self.pca.transform(p_vector.reshape(1, -1))
-            vec_scaled = self.scaler.transform(vec_pca)
-            
-            if self.qsvc:
-                qsvc_prob = self.qsvc.predict_proba(vec_scaled)[0][1]
-            else:
-                # Fallback: Dynamic distance-based score (Simulates Kernel)
-                # Centroid of fraud usually high magnitude in this projection
-                # Measure distance of vec_scaled (or vec_pca) to a theoretical centroid
-                # Assuming scaled vector roughly [-1, 1].
-                # Fraud centroid approx at [0.8, 0.8, ...] 
-                # Simple proxy: sigmoid of mean value
-                score = np.mean(vec_scaled) if 'vec_scaled' in locals() else np.mean(p_vector)
-                # Sigmoid to [0, 1]
-                qsvc_prob = 1 / (1 + np.exp(-5 * (score - 0.2)))
-                # Clamp for realism (if is_fraud, ensure it's > 0.5 usually)
-                if is_fraud and qsvc_prob < 0.5: qsvc_prob = 0.55 + random.random()*0.1
-                if not is_fraud and qsvc_prob > 0.5: qsvc_prob = 0.45 - random.random()*0.1
+        # 3. Classical QSVC Score -> 4. VQE Forecast (the model math)
+        qsvc_prob = self._qsvc_probability(p_vector, is_fraud)
+        vqe_res = self._run_vqe_forecast(p_vector, classical_potential=qsvc_prob)
+        probs = {k: float(v) for k, v in vqe_res['probs'].items()}
+        energy = float(vqe_res['energy'])
 
-        except Exception as e:
-            print(f"QSVC Prediction Error: {e}")
-            qsvc_prob = 0.85 if is_fraud else 0.12 
+        # 5. Fill the validated template (shallow copies of the sections that change)
+        vector = np.asarray(p_vector, dtype=np.float64).tolist()
+        payload = dict(self._template)
+        payload["transactionHistory"] = self._history_records(5)
+        payload["suspiciousTransaction"] = {
+            "id": tx_id, "time": "12:00 PM", "from": src, "to": dst, "amount": amount,
+            "status": "Suspicious" if is_fraud else "Normal", "note": "Project Janus Analysis"
+        }
+        payload["networkGraph"] = {
+            "nodes": [
+                {"id": src, "label": "Acc", "type": "primary", "transfers": 1, "flagged": is_fraud},
+                {"id": dst, "label": "Acc", "type": "suspicious" if is_fraud else "normal", "transfers": 1, "flagged": False}
+            ][:1 if src == dst else 2],
+            "edges": [{"source": src, "target": dst, "value": amount, "suspicious": is_fraud}]
+        }
+        payload["perturbationVector"] = vector
+        payload["pcaVector"] = vector[:4]  # Mock PCA for display
+        payload["quantumVector"] = vector[:2]
+        payload["quantumVectorDisplay"] = [round(x, 4) for x in vector[:2]]
+        payload["vqeResults"] = {
+            "energy": energy,
+            "probabilities": probs,
+            "verdict": "Critical/Cascade Risk" if probs.get("10", 0) > 0.4 else "Stable",
+            "confidence": f"{max(probs.values())*100:.1f}%",
+            "recommendation": "Block" if is_fraud else "Allow"
+        }
+        payload["scatterData"] = {"normal": [], "suspicious": {"x": vector[0], "y": vector[1], "label": "TX"}}
+        payload["qsvcResults"] = {**self._template["qsvcResults"], "fraudProbability": qsvc_prob * 100}
+        payload["riskEncoding"] = {**self._template["riskEncoding"], "gnnVector": vector}
+        payload["energyGap"] = {**self._template["energyGap"], "groundEnergy": energy, "observedEnergy": energy + 0.2}
+        return payload, vqe_res["coeffs"]
 
-        # 4. RUN VQE FORECAST (The Core Request)
-        vqe_res = self._run_vqe_forecast(p_vector, classical_potential=qsvc_prob)
-        probs = vqe_res['probs']
-        energy = vqe_res['energy']
-        
-        # 5. Build Response
-        target_src = row['nameOrig']
-        target_dst = row['nameDest']
-        
-        # Graph
-        nodes, edges = {}, []
-        nodes[target_src] = Node(id=target_src, label="Acc", type="primary", transfers=1, flagged=is_fraud)
-        nodes[target_dst] = Node(id=target_dst, label="Acc", type="suspicious" if is_fraud else "normal", transfers=1, flagged=False)
-        edges.append(Edge(source=target_src, target=target_dst, value=float(row['amount']), suspicious=is_fraud))
+    def analyze_transaction_json(self, tx_id: str) -> bytes:
+        """Hot path: the DashboardData payload serialized straight to JSON bytes (no per-request validation)"""
+        return dumps(self.analysis_payload(tx_id)[0])
 
-        return DashboardData(
-            transactionHistory=self.get_transaction_history(5),
-            suspiciousTransaction=Transaction(
-                id=tx_id,
-                time="12:00 PM",
-                from_=target_src, # Maps to 'from' in JSON
-                to=target_dst,
-                amount=float(row['amount']),
-                status="Suspicious" if is_fraud else "Normal",
-                note="Project Janus Analysis"
-            ),
-            fraudRing=[],
-            networkGraph=GraphData(nodes=list(nodes.values()), edges=edges),
-            perturbationVector=p_vector.tolist(),
-            pcaVector=p_vector[:4].tolist(), # Mock PCA for display
-            quantumVector=[p_vector[0], p_vector[1]], 
-            quantumVectorDisplay=[round(x, 4) for x in p_vector[:2]],
-            hamiltonian="H = J*ZZ + h*ZI (Hybrid Bias)",
-            vqeResults=VQEResults(
-                energy=energy,
-                probabilities=probs,
-                verdict="Critical/Cascade Risk" if probs.get("10", 0) > 0.4 else "Stable",
-                confidence=f"{max(probs.values())*100:.1f}%",
-                recommendation="Block" if is_fraud else "Allow"
-            ),
-            scatterData=ScatterData(normal=[], suspicious=ScatterPoint(x=p_vector[0], y=p_vector[1], label="TX")),
-            qsvcResults=QSVCResults(
-                fraudProbability=qsvc_prob * 100,
-                advantage=1.4,
-                kernelType="FidelityQuantumKernel", accuracy=98.5
-            ),
-            riskEncoding=RiskEncoding(gnnVector=p_vector.tolist(), encodedVector=[], topK=4, method="GAT+Topology"),
-            quantumPathSelection=QuantumPathSelection(threshold=0.5, decision="Quantum", reason="Hybrid Bias via VQE"),
-            energyGap=EnergyGap(groundEnergy=energy, observedEnergy=energy+0.2, deltaE=0.2, interpretation="Stable Gap"),
-            digitalTwin=DigitalTwin(scenario="Janus Replay", scenarioDescription="Real-time VQE", simulationSteps=[])
-        )
+    def analyze_transaction(self, tx_id: str) -> DashboardData:
+        """Typed DashboardData (validates the payload; use analyze_transaction_json to serve it)"""
+        return DashboardData.model_validate(self.analysis_payload(tx_id)[0])
 
     def _get_mock_fallback(self):
         return None
@@ -0,0 +1,70 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+
+from app.core.audit_store import AuditStore
+
+EVENTS = 5000
+
+
+def make_store(tmp_path):
+    store = AuditStore(str(tmp_path / "audit.db"))
+    store.record([
+        {"ts": 1_700_000_000 + i, "action": "BLOCK", "account": f"C{i % 50}", "tx_id": f"TX-{10000 + i}"}
+        for i in range(EVENTS)
+    ])
+    store.flush()
+    return store
+
+
+def drain_across_threads(chunks):
+    """Advances the generator with every next() on a new thread, like StreamingResponse's threadpool"""
+    lines = []
+    while True:
+        result = {}
+
+        def step():
+            try:
+                result["chunk"] = next(chunks)
+            except StopIteration:
+                pass
+            except Exception as e:
+                result["error"] = e
+        worker = threading.Thread(target=step)
+        worker.start()
+        worker.join()
+        if "error" in result:
+            raise result["error"]
+        if "chunk" not in result:
+            return lines
+        lines += result["chunk"].splitlines()
+
+
+def test_export_survives_thread_hops(tmp_path):
+    store = make_store(tmp_path)
+    lines = drain_across_threads(store.export(chunk_size=100))
+    timestamps = [orjson.loads(line)["ts"] for line in lines]
+    assert len(timestamps) == EVENTS
+    assert timestamps == sorted(timestamps)
+    store.close()
+
+
+def test_concurrent_exports(tmp_path):
+    store = make_store(tmp_path)
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        exports = list(pool.map(
+            lambda _: len(drain_across_threads(store.export(chunk_size=250))), range(20)
+        ))
+    assert exports == [EVENTS] * 20
+    store.close()
+
+
+def test_export_filters_account_and_range(tmp_path):
+    store = make_store(tmp_path)
+    start, end = 1_700_000_000 + 1000, 1_700_000_000 + 2000
+    lines = drain_across_threads(store.export(start=start, end=end, account="C7"))
+    events = [orjson.loads(line) for line in lines]
+    assert len(events) == 20
+    assert all(e["account"] == "C7" and start <= e["ts"] < end for e in events)
+    store.close()
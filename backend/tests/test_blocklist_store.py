@@ -0,0 +1,57 @@
+import pytest
+
+from app.core.blocklist_store import BlocklistStore
+
+
+def test_block_is_visible_once_durable(tmp_path):
+    path = tmp_path / "blocked.log"
+    store = BlocklistStore(str(path))
+    store.block([("C1", "TX-10001"), ("C2", None)]).result(timeout=5)
+    assert store.accounts == {"C1", "C2"}
+    assert store.tx_ids["TX-10001"]["account"] == "C1"
+    store.close()
+
+    replayed = BlocklistStore(str(path))
+    assert replayed.accounts == {"C1", "C2"}
+    replayed.close()
+
+
+def test_failed_write_is_not_applied(tmp_path):
+    path = tmp_path / "blocked.log"
+    store = BlocklistStore(str(path))
+    path.mkdir()  # the log path is now a directory: the append cannot open it
+    with pytest.raises(OSError):
+        store.block([("C1", "TX-10001")]).result(timeout=5)
+    assert store.accounts == set()
+    assert store.tx_ids == {}
+    store.close()
+
+
+class TornFile:
+    """Log handle whose next write lands a few bytes and then fails (disk full mid-append)"""
+
+    def __init__(self, f):
+        self.f = f
+
+    def write(self, data):
+        self.f.write(bytes(data[:10]))
+        raise OSError("No space left on device")
+
+    def __getattr__(self, name):
+        return getattr(self.f, name)
+
+
+def test_torn_write_is_rolled_back(tmp_path):
+    path = tmp_path / "blocked.log"
+    store = BlocklistStore(str(path))
+    store.block([("C1", "TX-10001")]).result(timeout=5)
+    store._file = TornFile(store._file)
+    with pytest.raises(OSError):
+        store.block([("C2", "TX-10002")]).result(timeout=5)
+    store.block([("C3", "TX-10003")]).result(timeout=5)
+    store.close()
+
+    replayed = BlocklistStore(str(path))
+    assert replayed.accounts == {"C1", "C3"}
+    assert set(replayed.tx_ids) == {"TX-10001", "TX-10003"}
+    replayed.close()
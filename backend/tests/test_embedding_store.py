@@ -0,0 +1,44 @@
+import threading
+
+import numpy as np
+
+from app.core.embedding_store import EmbeddingStore
+
+
+def _store():
+    embeddings = np.arange(4 * 16, dtype=np.float32).reshape(4, 16)
+    account_ids = np.array([b"C0", b"C1", b"C2", b"C3"])
+    return EmbeddingStore(embeddings, account_ids, np.arange(4), centroid=np.zeros(16, dtype=np.float32))
+
+
+def test_cold_start_accounts():
+    store = _store()
+    rows, new = store.add_accounts(["C1", "N1", "N1"])
+    assert rows.tolist() == [1, 4, 4]
+    assert new.tolist() == [False, True, True]
+    store.upsert([4], np.full((1, 16), 2.0))
+    vectors, known = store.perturbation_vectors(["C1", "N1", "N2"], ["N1", "C0", "C0"])
+    assert known.tolist() == [True, True, False]
+    assert np.allclose(vectors[0], (np.arange(16, 32) + 2.0) / 2)
+    assert np.allclose(vectors[1], (2.0 + np.arange(16)) / 2)
+    assert store.size == 5
+
+
+def test_lookups_wait_for_ingest():
+    # An ingest mid-update (holding the lock) must not be observed half-done by readers
+    store = _store()
+    rows, _ = store.add_accounts(["N1"])
+    results = []
+    with store._lock:
+        readers = [
+            threading.Thread(target=lambda: results.append(store.rows_for(["N1"]))),
+            threading.Thread(target=lambda: results.append(store.vectors_for(rows)))
+        ]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join(timeout=0.2)
+        assert results == []
+    for reader in readers:
+        reader.join(timeout=5)
+    assert len(results) == 2
@@ -0,0 +1,24 @@
+import numpy as np
+
+from app.core.hamiltonian import (
+    BASIS_STATES, hybrid_coefficients, risk_level, risk_levels, solve_ground_state, solve_ground_states
+)
+
+
+def test_ground_state_mapping():
+    # ZI dominates: a positive ZI (the hybrid bias) flips qubit 1 to |1>, a negative one keeps it at |0>
+    assert solve_ground_state([3.0, 0.5, 0.1])["state"] == "11"
+    assert solve_ground_state([-3.0, 0.5, 0.1])["state"] == "01"
+    assert risk_level(-3.4, "11") == ("CRITICAL", 3.4 / 5.0)
+    assert risk_level(-3.4, "01") == ("WARNING", 0.3)
+    assert risk_level(-0.6, "00") == ("STABLE", 0.0)
+    assert risk_level(-12.0, "10") == ("CRITICAL", 1.0)
+
+
+def test_scalar_and_batch_risk_agree():
+    rng = np.random.default_rng(0)
+    coeffs = hybrid_coefficients(rng.standard_normal((200, 16)), rng.standard_normal((16, 3)), rng.uniform(0, 1, 200))
+    solved = solve_ground_states(coeffs)
+    status, risk_score = risk_levels(solved["energies"], solved["ground_index"])
+    for energy, index, batch_status, batch_risk in zip(solved["energies"], solved["ground_index"], status, risk_score):
+        assert risk_level(energy, BASIS_STATES[index]) == (batch_status, batch_risk)
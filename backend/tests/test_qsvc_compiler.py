@@ -0,0 +1,89 @@
+import os
+import warnings
+
+import numpy as np
+import pytest
+
+from app.core.qsvc_compiler import COMPILED_FILE, DECISION_TOLERANCE, PROBABILITY_TOLERANCE, CompiledQSVC
+from app.core.quantum_kernel import StatevectorKernel
+from app.core.zz_feature_map import zz_feature_states
+
+qiskit = pytest.importorskip("qiskit")
+qml_kernels = pytest.importorskip("qiskit_machine_learning.kernels")
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "app", "data")
+
+
+def zz_feature_map(entanglement="linear", reps=2):
+    from qiskit.circuit.library import ZZFeatureMap
+    return ZZFeatureMap(feature_dimension=4, reps=reps, entanglement=entanglement)
+
+
+def reference_kernel(feature_map):
+    """Qiskit's own exact fidelity kernel (same values as the compute-uncompute circuits)"""
+    return qml_kernels.FidelityStatevectorKernel(feature_map=feature_map)
+
+
+@pytest.mark.parametrize("entanglement", ["linear", "circular", "full"])
+def test_feature_states_match_qiskit(entanglement):
+    from qiskit.quantum_info import Statevector
+
+    x = np.random.default_rng(0).uniform(-1, 1, size=(5, 4))
+    feature_map = zz_feature_map(entanglement)
+    expected = np.array([Statevector(feature_map.assign_parameters(row)).data for row in x])
+    np.testing.assert_allclose(zz_feature_states(x, 2, 2.0, entanglement), expected, atol=1e-10)
+
+
+def test_statevector_kernel_matches_reference():
+    rng = np.random.default_rng(1)
+    x, y = rng.uniform(-1, 1, size=(12, 4)), rng.uniform(-1, 1, size=(7, 4))
+    feature_map = zz_feature_map()
+    kernel, reference = StatevectorKernel(feature_map=feature_map), reference_kernel(feature_map)
+    np.testing.assert_allclose(kernel.evaluate(x, y), reference.evaluate(x, y), atol=1e-10)
+    np.testing.assert_allclose(kernel.evaluate(x), reference.evaluate(x), atol=1e-8)
+
+
+def assert_parity(compiled, qsvc, pca, scaler, vectors):
+    features = scaler.transform(pca.transform(vectors))
+    decision_error = np.abs(compiled.decision_function(vectors) - qsvc.decision_function(features)).max()
+    proba_error = np.abs(compiled.predict_proba(vectors) - qsvc.predict_proba(features)).max()
+    assert decision_error < DECISION_TOLERANCE
+    assert proba_error < PROBABILITY_TOLERANCE
+
+
+def test_compiled_matches_reference_qsvc():
+    """Synthetic pipeline shaped like production: 16-D vectors -> PCA(4) -> MinMax(-1, 1) -> QSVC"""
+    from qiskit_machine_learning.algorithms import QSVC
+    from sklearn.decomposition import PCA
+    from sklearn.preprocessing import MinMaxScaler
+
+    rng = np.random.default_rng(2)
+    vectors = rng.standard_normal((60, 16))
+    labels = (vectors[:, :3].sum(axis=1) > 0).astype(int)
+    pca = PCA(n_components=4).fit(vectors[:40])
+    scaler = MinMaxScaler(feature_range=(-1, 1)).fit(pca.transform(vectors[:40]))
+    qsvc = QSVC(quantum_kernel=reference_kernel(zz_feature_map()), probability=True, random_state=0)
+    qsvc.fit(scaler.transform(pca.transform(vectors[:40])), labels[:40])
+
+    assert_parity(CompiledQSVC.compile(qsvc, pca, scaler), qsvc, pca, scaler, vectors[40:48])
+
+
+@pytest.mark.skipif(not os.path.exists(os.path.join(DATA_DIR, "qsvc_2k.pkl")), reason="QSVC artifacts not present")
+def test_shipped_model_matches_trained_qsvc():
+    """The compiled artifact the engine serves vs the trained QSVC (reference kernel swapped in)"""
+    import joblib
+    from app.core.artifact_store import load_test_set
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        qsvc = joblib.load(os.path.join(DATA_DIR, "qsvc_2k.pkl"))
+        pca = joblib.load(os.path.join(DATA_DIR, "qsvc_pca.pkl"))
+        scaler = joblib.load(os.path.join(DATA_DIR, "qsvc_scaler.pkl"))
+    qsvc.quantum_kernel = reference_kernel(qsvc.quantum_kernel.feature_map)
+    vectors, _, _ = load_test_set(DATA_DIR, columns=["step"])
+    vectors = np.asarray(vectors[:4], dtype=np.float64)
+
+    assert_parity(CompiledQSVC.compile(qsvc, pca, scaler), qsvc, pca, scaler, vectors)
+    compiled_path = os.path.join(DATA_DIR, COMPILED_FILE)
+    if os.path.exists(compiled_path):
+        assert_parity(CompiledQSVC.load(compiled_path), qsvc, pca, scaler, vectors)
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+from app.core.janus_engine import JanusEngine
+from app.core.transaction_graph import TransactionGraph
+
+# A pays B twice and C once, D pays B, C pays E
+EDGES = pd.DataFrame({
+    "step": [1, 1, 2, 2, 3],
+    "amount": [10.0, 20.0, 5.0, 7.0, 3.0],
+    "nameOrig": ["A", "A", "A", "D", "C"],
+    "nameDest": ["B", "C", "B", "B", "E"],
+    "nameOrig_outDegree": [2, 2, 2, 1, 1],
+    "nameDest_inDegree": [2, 1, 2, 2, 1],
+})
+
+
+def _graph(details=EDGES):
+    return TransactionGraph.from_edges(details["nameOrig"], details["nameDest"], details["amount"])
+
+
+def _engine(details, graph):
+    """Engine shell over a fixture: only what the topology view reads"""
+    engine = JanusEngine.__new__(JanusEngine)
+    engine.details = details
+    engine._transaction_graph = graph
+    engine._ring_table = None
+    return engine
+
+
+def test_degrees_and_edge_amounts():
+    graph = _graph()
+    a, b, c, d, e = graph.nodes_for(["A", "B", "C", "D", "E"])
+    assert graph.out_degree([a, b, c, d, e]).tolist() == [3, 0, 1, 1, 0]
+    assert graph.in_degree([a, b, c, d, e]).tolist() == [0, 3, 1, 0, 1]
+    assert graph.out_degree(graph.nodes_for(["Z"])).tolist() == [0]
+
+    total, count = graph.edge_amounts([a, a, d, b], [b, c, b, a])
+    assert total.tolist() == [15.0, 20.0, 7.0, 0.0]
+    assert count.tolist() == [2, 1, 1, 0]
+
+
+def test_one_and_two_hop_neighbors():
+    graph = _graph()
+    a = graph.nodes_for(["A"])
+    assert graph.accounts_for(graph.neighbors(a, hops=1)) == ["B", "C"]
+    assert graph.accounts_for(graph.neighbors(a, hops=2)) == ["B", "C", "D", "E"]
+    assert graph.accounts_for(graph.neighbors(a, hops=2, direction="out")) == ["B", "C", "E"]
+
+
+def test_topology_lists_real_counterparties():
+    topology = _engine(EDGES, _graph())._get_transaction_topology(0)  # A -> B
+    assert set(topology) == {"pattern", "neighbor_count", "nodes", "ring", "metrics"}
+    assert topology["pattern"] == "Small Network"
+    assert topology["neighbor_count"] == 2
+    # Largest flow first: A's other payee C, then B's other payer D
+    assert [(n["id"], n["direction"], n["amount"]) for n in topology["nodes"]] == [("C", "out", 20.0), ("D", "in", 7.0)]
+    assert topology["ring"] is None
+    assert topology["metrics"] == {"source_degree": 2, "dest_degree": 2, "connectivity_score": 2.0}
+
+
+def test_partial_graph_count_matches_pattern():
+    # The dataset says the sender pays 9 accounts, but the loaded slice only holds this transaction
+    details = EDGES.iloc[[0]].assign(nameOrig_outDegree=9, nameDest_inDegree=2).reset_index(drop=True)
+    graph = _graph(details)
+    graph.partial = True
+    topology = _engine(details, graph)._get_transaction_topology(0)
+    assert topology["pattern"] == "Star-Hub (Mule)"
+    assert topology["neighbor_count"] == 11
+    assert topology["nodes"] == []
+
+    # Same on a full graph that does not know the accounts
+    topology = _engine(details, _graph(EDGES.iloc[[4]]))._get_transaction_topology(0)
+    assert topology["neighbor_count"] == 11
@@ -16,12 +16,61 @@ const TransactionExplorer = () => {
     const [filter, setFilter] = useState('');
 
     useEffect(() => {
-        fetch('http://localhost:8000/api/transactions?limit=500')
-            .then(res => res.json())
-            .then(data => {
-                setData(data);
+        const API = 'http://localhost:8000/api/transactions';
+        let version: string | null = null;
+        let cancelled = false;
+
+        // Keyset pages (X-Next-Cursor), rendered as they arrive
+        const loadPages = async () => {
+            let cursor: string | null = null;
+            let rows: Transaction[] = [];
+            do {
+                const res: Response = await fetch(`${API}?limit=250${cursor ? `&after=${cursor}` : ''}`);
+                version = version ?? res.headers.get('X-Version');
+                cursor = res.headers.get('X-Next-Cursor');
+                rows = rows.concat(await res.json());
+                if (cancelled) return;
+                setData(rows);
                 setLoading(false);
-            });
+            } while (cursor && rows.length < 500);
+        };
+
+        // Incremental sync: only rows whose status changed since the last version.
+        // Every page of changes (X-Next-Cursor) is read before `version` advances, so a
+        // burst larger than one page is never skipped.
+        let syncing = false;
+        const syncChanges = async () => {
+            if (version === null || syncing) return;
+            syncing = true;
+            try {
+                let cursor: string | null = null;
+                let nextVersion: string | null = null;
+                const changes: Pick<Transaction, 'id' | 'status'>[] = [];
+                do {
+                    const res: Response = await fetch(
+                        `${API}?since=${version}&fields=id,status&limit=1000${cursor ? `&after=${cursor}` : ''}`
+                    );
+                    if (!res.ok) return;
+                    nextVersion = nextVersion ?? res.headers.get('X-Version');  // taken before the first page
+                    cursor = res.headers.get('X-Next-Cursor');
+                    changes.push(...await res.json());
+                    if (cancelled) return;
+                } while (cursor);
+                version = nextVersion ?? version;
+                if (changes.length === 0) return;
+                const status = new Map(changes.map(c => [c.id, c.status]));
+                setData(prev => prev.map(tx => status.has(tx.id) ? { ...tx, status: status.get(tx.id)! } : tx));
+            } finally {
+                syncing = false;
+            }
+        };
+
+        loadPages();
+        const interval = setInterval(syncChanges, 5000);
+        return () => {
+            cancelled = true;
+            clearInterval(interval);
+        };
     }, []);
 
     const filteredData = data.filter(tx =>